@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Microbenchmark of keyword extraction from SKU names.
+
+Compares the previous regex-per-call KeywordExtractor with the current
+one, called per name and through extract_many, on a synthetic catalog
+that repeats names and name prefixes the way real catalogs do. Outputs
+are checked to be identical before timing.
+
+Usage:
+    python scripts/benchmark_keywords.py
+    python scripts/benchmark_keywords.py --names 200000 --distinct 20000
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import List
+
+# Add project root to path to enable absolute imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.keyword_extractor import KeywordExtractor
+
+BRANDS = ["Coca-Cola", "Dewalt", "Heinz", "Nike", "Stanley", "3M", "Hershey's", "L'Oreal", "Café Bustelo"]
+PRODUCTS = ["Classic Soda", "Cordless Drill Kit", "Tomato Ketchup", "Running Shoe", "Tape Measure",
+            "Duct Tape", "Milk Chocolate Bar", "Shampoo", "Espresso Ground Coffee"]
+VARIANTS = ["12oz Can", "20V MAX", "32 oz", "Mens Size 10", "25 ft", "1.88 in x 60 yd",
+            "1.55oz 36 pcs", "Blk/Wht XL", "10oz pkg of 6", "(Case of 24)"]
+
+
+class PreviousKeywordExtractor(KeywordExtractor):
+    """Previous implementation: module-level re calls, one name at a time."""
+
+    def extract_keywords(self, sku_name: str) -> List[str]:
+        self.logger.debug(f"Extracting keywords from: {sku_name}")
+
+        cleaned = self.clean_text(sku_name)
+        words = self.split_words(cleaned)
+        words = self.remove_stopwords(words)
+
+        if self.expand_abbreviations:
+            words = [self.expand_abbreviation(w) for w in words]
+
+        if self.remove_numbers:
+            words = [w for w in words if not w.isdigit()]
+
+        words = [w for w in words if len(w) >= self.min_length]
+        keywords = words[:self.max_keywords]
+
+        self.logger.debug(f"Extracted keywords: {keywords}")
+        return keywords
+
+    def clean_text(self, text: str) -> str:
+        import re
+        text = text.lower()
+        text = re.sub(r'[^a-z0-9\s\-_]', ' ', text)
+        text = re.sub(r'\s+', ' ', text)
+        return text.strip()
+
+    def split_words(self, text: str) -> List[str]:
+        import re
+        words = re.split(r'[-_\s]+', text)
+        return [w for w in words if w]
+
+
+def make_catalog(names: int, distinct: int, seed: int = 7) -> List[str]:
+    """Build a catalog of SKU names drawn from a smaller set of distinct names."""
+    rng = random.Random(seed)
+    pool = [f"{rng.choice(BRANDS)} {rng.choice(PRODUCTS)} {rng.choice(VARIANTS)} #{n}"
+            if n % 3 == 0 else f"{rng.choice(BRANDS)} {rng.choice(PRODUCTS)} {rng.choice(VARIANTS)}"
+            for n in range(distinct)]
+    return [rng.choice(pool) for _ in range(names)]
+
+
+def check_identical(catalog: List[str]) -> None:
+    """Fail if the current extractor disagrees with the previous one."""
+    samples = catalog[:5000] + ["".join(chr(code) for code in range(160)), "Éclair Café KIT",
+                                "a-_-b\x1cc\x1fdd\x85ee", ""]
+    for options in ({}, {"remove_numbers": True}, {"expand_abbreviations": False, "min_length": 1}):
+        previous = PreviousKeywordExtractor(**options)
+        current = KeywordExtractor(**options)
+        for name in samples:
+            expected = previous.extract_keywords(name)
+            if current.extract_keywords(name) != expected:
+                raise SystemExit(f"Mismatch for {name!r} with {options}: "
+                                 f"{current.extract_keywords(name)} != {expected}")
+        if KeywordExtractor(**options).extract_many(samples) != [previous.extract_keywords(n) for n in samples]:
+            raise SystemExit(f"extract_many mismatch with {options}")
+
+
+def run(catalog: List[str], mode: str) -> float:
+    """Return the mean extraction time per name in microseconds."""
+    started = time.perf_counter()
+    if mode == "previous":
+        extractor = PreviousKeywordExtractor()
+        for name in catalog:
+            extractor.extract_keywords(name)
+    elif mode == "per-name":
+        extractor = KeywordExtractor()
+        for name in catalog:
+            extractor.extract_keywords(name)
+    else:
+        KeywordExtractor().extract_many(catalog)
+    return (time.perf_counter() - started) / len(catalog) * 1e6
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark keyword extraction")
+    parser.add_argument("--names", type=int, default=100000, help="SKU names to extract (default: 100000)")
+    parser.add_argument("--distinct", type=int, default=10000,
+                        help="Distinct names among them (default: 10000)")
+    args = parser.parse_args()
+
+    catalog = make_catalog(args.names, args.distinct)
+    check_identical(catalog)
+
+    timings = {}
+    for mode in ("previous", "per-name", "extract_many"):
+        run(catalog[:1000], mode)  # warm up
+        timings[mode] = run(catalog, mode)
+
+    print(f"{'Mode':<13} | {'us per name':>11}")
+    for mode, timing in timings.items():
+        print(f"{mode:<13} | {timing:>11.2f}")
+    print(f"Speedup: {timings['previous'] / timings['per-name']:.1f}x per name, "
+          f"{timings['previous'] / timings['extract_many']:.1f}x batched")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Microbenchmark of per-SKU model construction overhead.
+
+Compares the slotted SKU, ImageResult and ProcessingResult classes with
+the validated pydantic models they replaced. Each simulated SKU builds
+one SKU, a page of provider ImageResults and one ProcessingResult.
+
+Usage:
+    python scripts/benchmark_models.py
+    python scripts/benchmark_models.py --skus 50000 --results 15
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel
+
+# Add project root to path to enable absolute imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.models import SKU, ImageResult, ImageSource, ProcessingResult
+
+
+class PydanticSKU(BaseModel):
+    """Previous validated SKU model."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    category: Optional[str] = None
+    has_image: bool = False
+
+
+class PydanticImageResult(BaseModel):
+    """Previous validated ImageResult model."""
+
+    id: str
+    url: str
+    download_url: str
+    source: ImageSource
+    title: Optional[str] = None
+    width: int
+    height: int
+    file_size: Optional[int] = None
+    relevance_score: float = 0.0
+    photographer: Optional[str] = None
+    photographer_url: Optional[str] = None
+
+
+class PydanticProcessingResult(BaseModel):
+    """Previous validated ProcessingResult model."""
+
+    sku_id: str
+    success: bool
+    image_attached: bool = False
+    image_source: Optional[ImageSource] = None
+    relevance_score: Optional[float] = None
+    error: Optional[str] = None
+    processing_time: float = 0.0
+
+
+MODES = {
+    "pydantic": (PydanticSKU, PydanticImageResult, PydanticProcessingResult),
+    "slotted": (SKU, ImageResult, ProcessingResult),
+}
+
+
+def run(skus: int, results_per_sku: int, mode: str) -> float:
+    """Return the mean construction time per SKU in microseconds."""
+    sku_cls, image_cls, result_cls = MODES[mode]
+    started = time.perf_counter()
+    for i in range(skus):
+        sku = sku_cls(id=f"SKU{i}", name=f"Product {i}")
+        for n in range(results_per_sku):
+            image_cls(
+                id=str(n),
+                url=f"https://images.example.com/{i}/{n}/large.jpg",
+                download_url=f"https://images.example.com/{i}/{n}/original.jpg",
+                source=ImageSource.PEXELS,
+                title=sku.name,
+                width=1920,
+                height=1280,
+                photographer="Example",
+                photographer_url="https://example.com/photographer"
+            )
+        result_cls(sku_id=sku.id, success=True, image_attached=True, image_source=ImageSource.PEXELS,
+                   relevance_score=0.8, processing_time=0.01)
+    return (time.perf_counter() - started) / skus * 1e6
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark per-SKU model construction")
+    parser.add_argument("--skus", type=int, default=20000, help="SKUs to simulate (default: 20000)")
+    parser.add_argument("--results", type=int, default=5, help="Provider results per SKU (default: 5)")
+    args = parser.parse_args()
+
+    timings = {}
+    for mode in MODES:
+        run(1000, args.results, mode)  # warm up
+        timings[mode] = run(args.skus, args.results, mode)
+
+    print(f"{'Mode':<10} | {'us per SKU':>10}")
+    for mode, timing in timings.items():
+        print(f"{mode:<10} | {timing:>10.1f}")
+    print(f"Speedup: {timings['pydantic'] / timings['slotted']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
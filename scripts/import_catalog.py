@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Load a product master export into the offline catalog index.
+
+Accepts .csv or .jsonl files (optionally .gz) with a SKU code column
+(sku, gtin, upc, ean, ...) and a name column, plus optional brand and
+category columns.
+
+Usage:
+    python scripts/import_catalog.py product_master.csv
+    python scripts/import_catalog.py product_master.jsonl.gz --db ./data/catalog.db
+    python scripts/import_catalog.py --lookup 00076171913999
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to path to enable absolute imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.logger import setup_logging
+from src.storage.catalog_index import CatalogIndex
+from src.storage.state_io import read_state_file
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Load the product catalog index")
+    parser.add_argument("path", type=str, nargs="?", help="Product master export (.csv or .jsonl, optionally .gz)")
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=None,
+        help="Path to catalog database (default: catalog.database_path from config.yaml)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="Records per transaction (default: 10000)"
+    )
+    parser.add_argument("--lookup", type=str, nargs="+", help="Look up SKU codes instead of importing")
+    return parser.parse_args()
+
+
+def get_db_path(args) -> str:
+    """Resolve the catalog path from arguments or YAML config."""
+    if args.db:
+        return args.db
+    try:
+        import yaml
+        with open("config/config.yaml", "r") as f:
+            return (yaml.safe_load(f) or {}).get("catalog", {}).get("database_path", "./data/catalog.db")
+    except Exception:
+        return "./data/catalog.db"
+
+
+def main():
+    """Main entry point."""
+    args = parse_arguments()
+    setup_logging("config/logging.yaml")
+    catalog = CatalogIndex(get_db_path(args))
+
+    if args.lookup:
+        products = catalog.lookup_many(args.lookup)
+        for sku in args.lookup:
+            product = products.get(sku)
+            if product is None:
+                print(f"{sku}: not in catalog")
+            else:
+                print(f"{sku}: {product['name']} | brand: {product['brand'] or '-'} | "
+                      f"category: {product['category'] or '-'}")
+        sys.exit(0 if len(products) == len(set(args.lookup)) else 1)
+
+    if not args.path:
+        print("Give a product master file to import, or --lookup SKU codes")
+        sys.exit(2)
+
+    started = time.time()
+    loaded = catalog.ingest(read_state_file(args.path), batch_size=args.batch_size)
+    print(f"Loaded {loaded} products from {args.path} in {time.time() - started:.1f}s "
+          f"({catalog.count()} in catalog)")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Maintenance commands for the processing state database.
+
+Usage:
+    python scripts/manage_state.py check-stats
+    python scripts/manage_state.py check-stats --no-rebuild
+    python scripts/manage_state.py archive --days 30
+    python scripts/manage_state.py enable-auto-vacuum
+    python scripts/manage_state.py export-state state_dump.jsonl.gz
+    python scripts/manage_state.py import-state wholesalehub_export.csv
+    python scripts/manage_state.py source-stats
+    python scripts/manage_state.py quota
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to path to enable absolute imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.logger import setup_logging
+from src.storage.models import ProcessingStatus
+from src.storage.state_manager import StateManager
+from src.storage.state_io import read_state_file, write_state_file
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Maintain the Image Fetcher Bot state database")
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=None,
+        help="Path to state database (default: DATABASE_PATH from .env, or ./data/state.db)"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    check = subparsers.add_parser(
+        "check-stats",
+        help="Verify the stats counters against processed_skus and rebuild them if they drifted"
+    )
+    check.add_argument(
+        "--no-rebuild",
+        action="store_true",
+        help="Only report mismatches, do not rebuild"
+    )
+
+    archive_cmd = subparsers.add_parser(
+        "archive",
+        help="Move old SUCCESS records into compressed archive files and compact the database"
+    )
+    archive_cmd.add_argument(
+        "--days",
+        type=int,
+        default=30,
+        help="Archive SUCCESS records older than this many days (default: 30)"
+    )
+    archive_cmd.add_argument(
+        "--archive-dir",
+        type=str,
+        default="./data/archive",
+        help="Directory for archive files (default: ./data/archive)"
+    )
+
+    subparsers.add_parser(
+        "enable-auto-vacuum",
+        help="Let archiving release space in a database created before incremental auto-vacuum "
+             "(one-time full VACUUM; stop the bot first)"
+    )
+
+    export_cmd = subparsers.add_parser(
+        "export-state",
+        help="Stream processed SKU records to a .csv or .jsonl file (optionally .gz)"
+    )
+    export_cmd.add_argument("path", type=str, help="Output file")
+
+    import_cmd = subparsers.add_parser(
+        "import-state",
+        help="Bulk-load processed SKU records from a .csv or .jsonl file (optionally .gz)"
+    )
+    import_cmd.add_argument("path", type=str, help="Input file (only sku_id is required per record)")
+    import_cmd.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="Records per transaction (default: 10000)"
+    )
+    import_cmd.add_argument(
+        "--default-status",
+        type=str,
+        default=ProcessingStatus.SUCCESS.value,
+        choices=[status.value for status in ProcessingStatus],
+        help="Status for records without one (default: success)"
+    )
+
+    subparsers.add_parser(
+        "source-stats",
+        help="Show the per-category image source outcomes used for adaptive source ordering"
+    )
+
+    subparsers.add_parser(
+        "quota",
+        help="Show provider calls this hour and month and the quota providers last reported"
+    )
+
+    return parser.parse_args()
+
+
+def get_db_path(args) -> str:
+    """Resolve the database path from arguments or environment config."""
+    if args.db:
+        return args.db
+    try:
+        from src.utils.config import AppConfig
+        return AppConfig().database_path
+    except Exception:
+        return "./data/state.db"
+
+
+def check_stats(state_manager: StateManager, args) -> int:
+    """Run the stats consistency check."""
+    mismatches = state_manager.check_processing_stats(rebuild=not args.no_rebuild)
+    if not mismatches:
+        print("Stats counters are consistent")
+        return 0
+
+    print(f"{'Status':<15} | {'Source':<12} | {'Counter':>8} | {'Actual':>8}")
+    for (status, source), (counter, actual) in sorted(mismatches.items()):
+        print(f"{status:<15} | {source or '-':<12} | {counter:>8} | {actual:>8}")
+    print("Counters rebuilt" if not args.no_rebuild else "Run without --no-rebuild to fix")
+    return 1
+
+
+def archive(state_manager: StateManager, args) -> int:
+    """Archive old records."""
+    archived = state_manager.cleanup_old_records(days=args.days, archive_dir=args.archive_dir)
+    print(f"Archived {archived} records to {args.archive_dir}")
+    return 0
+
+
+def enable_auto_vacuum(state_manager: StateManager, args) -> int:
+    """Switch the database to incremental auto-vacuum."""
+    if state_manager.enable_incremental_vacuum():
+        print("Incremental auto-vacuum enabled")
+    else:
+        print("Incremental auto-vacuum was already enabled")
+    return 0
+
+
+def export_state(state_manager: StateManager, args) -> int:
+    """Export processing state."""
+    written = write_state_file(args.path, state_manager.export_records())
+    print(f"Exported {written} records to {args.path}")
+    return 0
+
+
+def import_state(state_manager: StateManager, args) -> int:
+    """Import processing state."""
+    started = time.time()
+    imported = state_manager.import_records(
+        read_state_file(args.path),
+        batch_size=args.batch_size,
+        default_status=ProcessingStatus(args.default_status)
+    )
+    print(f"Imported {imported} records from {args.path} in {time.time() - started:.1f}s")
+    return 0
+
+
+def source_stats(state_manager: StateManager, args) -> int:
+    """Show learned image source statistics."""
+    stats = state_manager.get_source_stats()
+    if not stats:
+        print("No source statistics recorded yet")
+        return 0
+
+    print(f"{'Category':<20} | {'Source':<12} | {'Calls':>7} | {'Hit rate':>8} | {'Mean score':>10} | {'Mean ms':>8}")
+    for (category, source), (calls, hits, score_sum, latency_sum) in sorted(stats.items()):
+        print(f"{category or '-':<20} | {source:<12} | {calls:>7} | {hits / calls:>8.1%} | "
+              f"{score_sum / calls:>10.2f} | {latency_sum / calls:>8.0f}")
+    return 0
+
+
+def quota(state_manager: StateManager, args) -> int:
+    """Show the provider quota ledger."""
+    usage = state_manager.get_quota_usage()
+    if not usage:
+        print("No provider calls recorded yet")
+        return 0
+
+    print(f"{'Source':<12} | {'Period':<8} | {'Start':<13} | {'Calls':>7} | {'Remaining':>9} | {'Resets'}")
+    for (source, period), row in sorted(usage.items()):
+        remaining = row["reported_remaining"] if row["reported_remaining"] is not None else "-"
+        resets = time.strftime("%Y-%m-%d %H:%M", time.gmtime(row["reset_at"])) if row["reset_at"] else "-"
+        print(f"{source:<12} | {period:<8} | {row['period_start'] or '-':<13} | {row['calls']:>7} | "
+              f"{remaining:>9} | {resets}")
+    return 0
+
+
+def main():
+    """Main entry point."""
+    args = parse_arguments()
+    setup_logging("config/logging.yaml")
+    state_manager = StateManager(get_db_path(args))
+
+    commands = {
+        "check-stats": check_stats,
+        "archive": archive,
+        "enable-auto-vacuum": enable_auto_vacuum,
+        "export-state": export_state,
+        "import-state": import_state,
+        "source-stats": source_stats,
+        "quota": quota,
+    }
+    sys.exit(commands[args.command](state_manager, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -234,7 +234,9 @@ def main():
                 failed_count += 1
                 logger.error(f"❌ FAILED: {sku.id}")
                 logger.error(f"   Error: {result.error}")
-        
+
+        processor.close()
+
         # Print summary
         print("\n" + "="*60)
         print("TEST RUN COMPLETE")
@@ -1,21 +1,87 @@
 """Base HTTP client with retry logic and rate limiting."""
 
 import time
-from typing import Any, Dict, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, RetryError
+from src.api.circuit_breaker import CircuitBreaker, CircuitOpenError
 from src.utils.logger import LoggerMixin
 
+DEFAULT_RETRY_AFTER_SECONDS = 60
+# X-Ratelimit-Reset values above this are epoch timestamps, not seconds from now
+EPOCH_THRESHOLD = 1e9
+
+
+class RateLimitedError(Exception):
+    """Raised when a source is throttled (HTTP 429) instead of waiting it out."""
+
+    def __init__(self, source: str, retry_at: float):
+        self.source = source
+        self.retry_at = retry_at
+        super().__init__(f"{source} rate limited for {max(retry_at - time.time(), 0):.0f}s")
+
+
+def parse_retry_after(value: Optional[str], default: float = DEFAULT_RETRY_AFTER_SECONDS) -> float:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer header, or None if missing or malformed."""
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """Parse X-Ratelimit-Limit/Remaining/Reset response headers.
+
+    Reset is accepted as seconds from now (Pixabay) or an epoch timestamp (Pexels).
+
+    Returns:
+        (limit, remaining, reset_at epoch seconds); each None if not sent
+    """
+    reset = _header_int(headers, "X-Ratelimit-Reset")
+    if reset is not None:
+        reset = float(reset) if reset > EPOCH_THRESHOLD else time.time() + reset
+    return _header_int(headers, "X-Ratelimit-Limit"), _header_int(headers, "X-Ratelimit-Remaining"), reset
+
 
 class BaseAPIClient(LoggerMixin):
     """Base class for API clients with retry and rate limiting."""
 
+    # Length of the provider's rate limit window, for providers that report
+    # the remaining quota without a reset time
+    rate_window_seconds = 3600
+
     def __init__(self, base_url: str, api_key: Optional[str] = None, timeout: int = 30):
         """Initialize base client."""
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.session = requests.Session()
+        self.circuit_breaker = CircuitBreaker(type(self).__name__)
+        self.throttled_until = 0.0
+        # Called with every response received, e.g. for quota accounting
+        self.response_listeners: List[Callable[[requests.Response], None]] = []
+        # Proactive pacing from rate limit headers (see _update_pacing)
+        self.pacing_threshold = 0.2
+        self.max_pacing_wait_seconds = 30.0
+        self.request_interval = 0.0
+        self._next_request_at = 0.0
+        self._peak_remaining = 0
         self._setup_session()
 
     def _setup_session(self) -> None:
@@ -28,26 +94,113 @@ class BaseAPIClient(LoggerMixin):
         """Add authentication header. Override in subclasses."""
         pass
 
+    def is_throttled(self) -> bool:
+        """Check whether the source asked us to back off (429) and the window is still closed."""
+        return time.time() < self.throttled_until
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Make HTTP request through the circuit breaker.
+
+        Connection errors, timeouts (after retries) and 5xx responses count
+        as source failures. While the circuit is open no request is sent and
+        CircuitOpenError is raised immediately.
+
+        A 429 marks the source as throttled until its Retry-After deadline
+        and raises RateLimitedError; requests until then raise it without
+        being sent, so callers can move on to other work instead of waiting.
+        While the source is paced, requests wait for their slot, or raise
+        RateLimitedError if it is more than max_pacing_wait_seconds away.
+        """
+        if self.is_throttled():
+            raise RateLimitedError(self.circuit_breaker.name, self.throttled_until)
+        wait = self._next_request_at - time.time()
+        if wait > self.max_pacing_wait_seconds:
+            raise RateLimitedError(self.circuit_breaker.name, self._next_request_at)
+        if wait > 0:
+            time.sleep(wait)
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(f"{self.circuit_breaker.name} circuit open, request skipped")
+
+        try:
+            response = self._send(method, endpoint, **kwargs)
+        except RateLimitedError:
+            # Throttled, but reachable
+            self.circuit_breaker.record_success()
+            raise
+        except RetryError as e:
+            self.circuit_breaker.record_failure(str(e.last_attempt.exception()))
+            raise
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is None or status >= 500:
+                self.circuit_breaker.record_failure(str(e))
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        except Exception as e:
+            self.circuit_breaker.record_failure(str(e))
+            raise
+
+        self.circuit_breaker.record_success()
+        return response
+
     @retry(stop=stop_after_attempt(3),
            wait=wait_exponential(multiplier=1, min=2, max=60),
            retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout)))
-    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request with retry logic."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         self.logger.debug(f"{method.upper()} {url}")
         
         kwargs.setdefault("timeout", self.timeout)
         response = self.session.request(method, url, **kwargs)
+        self._update_pacing(response.headers)
+        for listener in self.response_listeners:
+            listener(response)
         
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-            self.logger.warning(f"Rate limited. Waiting {retry_after}s")
-            time.sleep(retry_after)
-            response = self.session.request(method, url, **kwargs)
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.throttled_until = time.time() + retry_after
+            self.logger.warning(f"Rate limited by {self.circuit_breaker.name}, "
+                                f"pausing this source for {retry_after:.0f}s")
+            raise RateLimitedError(self.circuit_breaker.name, self.throttled_until)
         
         response.raise_for_status()
         return response
 
+    def _update_pacing(self, headers: Mapping[str, str]) -> None:
+        """Adjust the spacing between requests from the quota a response reports.
+
+        Once the remaining quota falls below ``pacing_threshold`` of the
+        limit, requests are spaced out so the rest lasts until the window
+        resets, ramping up from no delay at the threshold to an even spread
+        near zero. Every client (and every worker process) sees the same
+        shared count, so they all slow down together instead of running into
+        a 429. With no quota left the source is throttled until the reset.
+        """
+        limit, remaining, reset_at = parse_rate_limit_headers(headers)
+        if remaining is None:
+            return
+        now = time.time()
+        self._peak_remaining = max(self._peak_remaining, remaining)
+        limit = limit or self._peak_remaining
+        if reset_at is None or reset_at <= now:
+            reset_at = now + self.rate_window_seconds
+
+        if remaining <= 0:
+            self.throttled_until = max(self.throttled_until, reset_at)
+            self.logger.warning(f"{self.circuit_breaker.name} quota used up, "
+                                f"pausing this source for {reset_at - now:.0f}s")
+            return
+
+        pressure = 1 - remaining / (self.pacing_threshold * limit) if limit else 0.0
+        interval = max(pressure, 0.0) * (reset_at - now) / remaining
+        if interval and not self.request_interval:
+            self.logger.info(f"{self.circuit_breaker.name} has {remaining}/{limit} requests left, "
+                             f"pacing requests {interval:.2f}s apart")
+        self.request_interval = interval
+        self._next_request_at = now + interval
+
     def get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
         """GET request."""
         return self._request("GET", endpoint, params=params)
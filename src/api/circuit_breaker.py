@@ -0,0 +1,96 @@
+"""Circuit breaker that stops calling an API source while it is failing."""
+
+import time
+from typing import Dict, Optional
+
+from src.utils.logger import LoggerMixin
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a source whose circuit is open."""
+
+
+class CircuitBreaker(LoggerMixin):
+    """Track consecutive failures of one API source.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused for ``cooldown_seconds``. The first request after
+    the cool-down is let through as a probe (half-open): success closes the
+    circuit, failure opens it again for another cool-down.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown_seconds: float = 60.0):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Source name, for logs and reports
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: How long an open circuit refuses requests
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def is_available(self) -> bool:
+        """Check whether a request would be let through, without claiming the probe."""
+        if self.state == OPEN:
+            return time.monotonic() - self.opened_at >= self.cooldown_seconds
+        return self.state == CLOSED
+
+    def reopens_at(self) -> float:
+        """Get when the circuit next lets a request through (epoch seconds)."""
+        if self.state == OPEN:
+            return time.time() + max(self.opened_at + self.cooldown_seconds - time.monotonic(), 0.0)
+        if self.state == HALF_OPEN:
+            # Probe in flight; if it fails the circuit opens for a full cool-down
+            return time.time() + self.cooldown_seconds
+        return time.time()
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now, moving to half-open after the cool-down."""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            self.state = HALF_OPEN
+            self.logger.info(f"Circuit for {self.name} half-open, sending probe request")
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        if self.state != CLOSED:
+            self.logger.info(f"Circuit for {self.name} closed, source recovered")
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self, error: str) -> None:
+        """Record a failed request, opening the circuit if the threshold is reached."""
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        self.last_error = error
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.logger.warning(f"Circuit for {self.name} open after {self.consecutive_failures} "
+                                f"consecutive failures, skipping for {self.cooldown_seconds:.0f}s: {error}")
+
+    def snapshot(self) -> Dict:
+        """Get the breaker state for reports."""
+        return {"state": self.state, "consecutive_failures": self.consecutive_failures,
+                "total_failures": self.total_failures, "times_opened": self.times_opened,
+                "rejected": self.rejected, "last_error": self.last_error}
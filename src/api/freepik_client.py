@@ -33,31 +33,29 @@ class FreepikClient(BaseAPIClient):
             "limit": per_page
         }
 
-        try:
-            response = self.get("/resources", params=params)
-            data = response.json()
-
-            results = []
-            for item in data.get("data", []):
-                # Freepik API structure
-                image_data = item.get("image", {})
-                thumbnail = image_data.get("thumbnail", {})
-
-                results.append(ImageResult(
-                    id=str(item.get("id", "")),
-                    url=thumbnail.get("url", ""),
-                    download_url=image_data.get("source", {}).get("url", thumbnail.get("url", "")),
-                    source=ImageSource.FREEPIK,
-                    title=item.get("title", query),
-                    width=thumbnail.get("width", 800),
-                    height=thumbnail.get("height", 600),
-                    photographer=item.get("author", {}).get("name", "Unknown"),
-                    photographer_url=item.get("author", {}).get("url", "")
-                ))
-
-            self.logger.info(f"Found {len(results)} images on Freepik")
-            return results
-
-        except Exception as e:
-            self.logger.error(f"Freepik API error: {e}")
-            return []
+        response = self.get("/resources", params=params)
+        data = response.json()
+
+        results = []
+        for item in data.get("data", []):
+            # Freepik API structure
+            image_data = item.get("image", {})
+            thumbnail = image_data.get("thumbnail", {})
+            source_url = image_data.get("source", {}).get("url")
+            # Only the thumbnail's size is listed; the source image's is unknown
+            downloaded = {} if source_url else thumbnail
+
+            results.append(ImageResult(
+                id=str(item.get("id", "")),
+                url=thumbnail.get("url", ""),
+                download_url=source_url or thumbnail.get("url", ""),
+                source=ImageSource.FREEPIK,
+                title=item.get("title", query),
+                width=downloaded.get("width"),
+                height=downloaded.get("height"),
+                photographer=item.get("author", {}).get("name", "Unknown"),
+                photographer_url=item.get("author", {}).get("url", "")
+            ))
+
+        self.logger.info(f"Found {len(results)} images on Freepik")
+        return results
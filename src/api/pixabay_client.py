@@ -1,10 +1,20 @@
 """Pixabay API client."""
 
-from typing import List
+from typing import List, Tuple
 from src.api.base_client import BaseAPIClient
 from src.storage.models import ImageResult, ImageSource
 
 
+# largeImageURL is the original scaled down to fit this size
+LARGE_IMAGE_MAX_SIZE = 1280
+
+
+def large_image_size(width: int, height: int) -> Tuple[int, int]:
+    """Get the dimensions of largeImageURL for an original of the given size."""
+    scale = min(1.0, LARGE_IMAGE_MAX_SIZE / max(width, height, 1))
+    return round(width * scale), round(height * scale)
+
+
 class PixabayClient(BaseAPIClient):
     """Client for Pixabay API."""
 
@@ -23,14 +33,15 @@ class PixabayClient(BaseAPIClient):
         
         results = []
         for item in data.get("hits", []):
+            width, height = large_image_size(item["imageWidth"], item["imageHeight"])
             results.append(ImageResult(
                 id=str(item["id"]),
                 url=item["webformatURL"],
                 download_url=item["largeImageURL"],
                 source=ImageSource.PIXABAY,
                 title=item.get("tags") or query,
-                width=item["imageWidth"],
-                height=item["imageHeight"],
+                width=width,
+                height=height,
                 photographer=item.get("user"),
                 photographer_url=f"https://pixabay.com/users/{item.get('user')}-{item.get('user_id')}/"
                 if item.get("user") else None
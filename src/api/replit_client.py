@@ -1,6 +1,7 @@
 """WholesaleHub Replit API client with session-based authentication."""
 
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 import requests
 from src.storage.models import SKU
 from src.utils.logger import LoggerMixin
@@ -26,6 +27,11 @@ class ReplitClient(LoggerMixin):
         self.password = password
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "ImageFetcherBot/1.0"})
+        # Product listing runs in a prefetch thread, so it gets its own
+        # session sharing the login cookie
+        self.listing_session = requests.Session()
+        self.listing_session.headers.update(self.session.headers)
+        self.listing_session.cookies = self.session.cookies
         self._authenticated = False
 
     def authenticate(self) -> bool:
@@ -65,25 +71,101 @@ class ReplitClient(LoggerMixin):
             if not self.authenticate():
                 raise RuntimeError("Failed to authenticate with Replit API")
 
-    def get_skus_without_images(self, limit: int = 50) -> List[SKU]:
+    def get_skus_without_images(self, limit: int = 50, page_size: int = 200) -> List[SKU]:
         """Get SKUs that don't have images attached.
-        
-        Note: This endpoint needs to be implemented on the Replit side.
-        For now, this is a placeholder that returns empty list.
-        
-        TODO: Update this once the Replit API provides an endpoint to list products.
+
+        Args:
+            limit: Maximum number of SKUs
+            page_size: Products requested per page
+
+        Returns:
+            Up to ``limit`` SKUs, in listing order
+        """
+        return list(self.iter_skus_without_images(limit=limit, page_size=page_size))
+
+    def iter_skus_without_images(self, limit: Optional[int] = None, page_size: int = 200) -> Iterator[SKU]:
+        """Stream SKUs that don't have images attached (see iter_sku_pages)."""
+        for page in self.iter_sku_pages(limit=limit, page_size=page_size):
+            yield from page
+
+    def iter_sku_pages(self, limit: Optional[int] = None, page_size: int = 200) -> Iterator[List[SKU]]:
+        """Stream pages of SKUs without images from the admin products listing.
+
+        Pages are requested from ``GET /api/admin/products?hasImage=false``
+        by cursor when the server returns ``nextCursor``, otherwise by
+        offset. The next page is fetched in a background thread while the
+        caller works through the current one. With offset paging, products
+        that get an image while the listing is read shift later pages, so
+        some products may be left to the next run.
+
+        Args:
+            limit: Maximum number of SKUs over all pages (None for all)
+            page_size: Products requested per page
+
+        Yields:
+            Lists of SKUs, in listing order
         """
         self._ensure_authenticated()
-        
-        self.logger.warning("get_skus_without_images not implemented in Replit API yet")
-        self.logger.info("You'll need to provide SKU list manually or implement product listing endpoint")
-        
-        # Placeholder - in reality you'd call something like:
-        # response = self.session.get(f"{self.base_url}/api/admin/products?hasImage=false&limit={limit}")
-        # data = response.json()
-        # return [SKU(...) for item in data["products"]]
-        
-        return []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sku-listing") as executor:
+            cursor, offset, listed = None, 0, 0
+            paged_by_cursor = False
+            size = min(page_size, limit) if limit else page_size
+            future: Optional[Future] = executor.submit(self._fetch_sku_page, cursor, offset, size)
+
+            while future is not None:
+                page, cursor = self._page_result(future, cursor, offset, size)
+                # Once the server pages by cursor, a missing cursor marks the last page
+                paged_by_cursor = paged_by_cursor or cursor is not None
+                has_more = cursor is not None if paged_by_cursor else len(page) >= size
+                offset += len(page)
+                if limit:
+                    page = page[:limit - listed]
+                listed += len(page)
+
+                has_more = has_more and bool(page) and not (limit and listed >= limit)
+                size = min(page_size, limit - listed) if limit else page_size
+                future = executor.submit(self._fetch_sku_page, cursor, offset, size) if has_more else None
+                if page:
+                    yield page
+
+    def _page_result(self, future: Future, cursor: Optional[str], offset: int,
+                     size: int) -> Tuple[List[SKU], Optional[str]]:
+        """Get a fetched page, logging in again and refetching once if the session expired."""
+        try:
+            return future.result()
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in (401, 403):
+                raise
+        self.logger.warning("Session expired, re-authenticating...")
+        self._authenticated = False
+        self._ensure_authenticated()
+        return self._fetch_sku_page(cursor, offset, size)
+
+    def _fetch_sku_page(self, cursor: Optional[str], offset: int, size: int) -> Tuple[List[SKU], Optional[str]]:
+        """Fetch one page of the products listing.
+
+        Returns:
+            (SKUs, cursor of the next page or None)
+        """
+        params = {"hasImage": "false", "limit": size}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
+
+        response = self.listing_session.get(f"{self.base_url}/api/admin/products", params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+
+        items = data.get("products", []) if isinstance(data, dict) else data
+        next_cursor = data.get("nextCursor") if isinstance(data, dict) else None
+        skus = [
+            SKU(id=str(item["sku"]), name=item.get("name") or str(item["sku"]),
+                description=item.get("description"), category=item.get("category"))
+            for item in items if item.get("sku")
+        ]
+        self.logger.debug(f"Listed {len(skus)} products without images (offset {offset})")
+        return skus, str(next_cursor) if next_cursor else None
 
     def attach_image_to_sku(self, sku: str, image_data: bytes, filename: str) -> bool:
         """Upload image for a specific SKU.
@@ -165,8 +247,9 @@ class ReplitClient(LoggerMixin):
         return True
 
     def close(self) -> None:
-        """Close the session."""
+        """Close the sessions."""
         self.session.close()
+        self.listing_session.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -1,12 +1,18 @@
 """Unsplash API client."""
 
 from typing import List
-from .base_client import BaseAPIClient
-from ..storage.models import ImageResult, ImageSource
+from src.api.base_client import BaseAPIClient
+from src.storage.models import ImageResult, ImageSource
 
 
 class UnsplashClient(BaseAPIClient):
-    """Client for Unsplash API."""
+    """Client for Unsplash API.
+
+    Unsplash reports X-Ratelimit-Remaining for a rolling hour without a
+    reset time, so pacing assumes the hourly window.
+    """
+
+    rate_window_seconds = 3600
 
     def __init__(self, access_key: str):
         """Initialize Unsplash client."""
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Main entry point for Image Fetcher Bot."""
 
+import signal
 import sys
 import click
 from src.utils.config import get_config
@@ -13,7 +14,9 @@ from src.services.sku_processor import SKUProcessor
 @click.option("--interval", default=6, help="Interval in hours for scheduled runs")
 @click.option("--config", default="config/config.yaml", help="Path to config file")
 @click.option("--sku-file", default=None, help="Path to text file with SKU list (one per line)")
-def main(run_once, interval, config, sku_file):
+@click.option("--worker-id", default=None, help="Worker identifier for the shared work queue (default: host:pid)")
+@click.option("--resume", is_flag=True, help="Continue the last incomplete run from its checkpoint")
+def main(run_once, interval, config, sku_file, worker_id, resume):
     """Image Fetcher Bot - Autonomous SKU image attachment."""
     setup_logging()
     logger = get_logger(__name__)
@@ -23,14 +26,19 @@ def main(run_once, interval, config, sku_file):
     try:
         cfg = get_config(config)
         logger.info(f"Loaded config: {cfg.app_name} v{cfg.app_version}")
-        
+
+        # Signal handlers can only be installed from the main thread, while
+        # scheduled jobs run on a scheduler worker thread
+        stop_signals = StopSignals()
+        stop_signals.install()
+
         if run_once:
             logger.info("Running in single-run mode")
-            run_job(cfg, sku_file)
+            run_job(cfg, sku_file, worker_id, resume, stop_signals=stop_signals)
         else:
             logger.info(f"Starting scheduler (interval: {interval} hours)")
             from src.scheduler.job_scheduler import start_scheduler
-            start_scheduler(cfg, interval)
+            start_scheduler(cfg, interval, stop_signals=stop_signals)
             
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
@@ -40,13 +48,25 @@ def main(run_once, interval, config, sku_file):
         sys.exit(1)
 
 
-def run_job(cfg, sku_file=None):
-    """Run single image fetching job."""
+def run_job(cfg, sku_file=None, worker_id=None, resume=False, stop_signals=None):
+    """Run single image fetching job.
+
+    Args:
+        stop_signals: StopSignals installed by main(), told about the
+            running processor so SIGTERM/SIGINT stop it gracefully
+    """
     logger = get_logger(__name__)
 
     try:
-        processor = SKUProcessor(cfg)
-        report = processor.process_all_skus(sku_file=sku_file)
+        processor = SKUProcessor(cfg, worker_id=worker_id)
+        if stop_signals:
+            stop_signals.processor = processor
+        try:
+            report = processor.process_all_skus(sku_file=sku_file, resume=resume)
+        finally:
+            if stop_signals:
+                stop_signals.processor = None
+            processor.close()
         
         logger.info("="*60)
         logger.info("PROCESSING REPORT")
@@ -55,6 +75,10 @@ def run_job(cfg, sku_file=None):
         logger.info(f"Successful: {report.successful}")
         logger.info(f"Failed: {report.failed}")
         logger.info(f"Skipped: {report.skipped}")
+        if report.deferred:
+            logger.info(f"Deferred (rate limited): {report.deferred}")
+        if report.held_back:
+            logger.info(f"Held back (provider quota): {report.held_back}")
         logger.info(f"Success Rate: {report.success_rate:.1f}%")
         logger.info(f"Duration: {report.duration_seconds:.1f}s")
         
@@ -63,11 +87,25 @@ def run_job(cfg, sku_file=None):
             for source, count in report.source_breakdown.items():
                 logger.info(f"  {source}: {count}")
         
+        if report.source_health:
+            logger.info("Source Health:")
+            for source, health in report.source_health.items():
+                line = f"  {source}: {health['state']} ({health['total_failures']} failures"
+                if health["times_opened"]:
+                    line += f", opened {health['times_opened']}x, {health['rejected']} calls skipped"
+                line += ")"
+                if health["last_error"] and health["state"] != "closed":
+                    line += f" - {health['last_error']}"
+                logger.info(line)
+
         if report.error_summary:
             logger.info(f"Errors ({len(report.error_summary)}):")
             for error in report.error_summary[:10]:
                 logger.info(f"  {error}")
 
+        if report.interrupted:
+            logger.info("Run interrupted - continue with --resume")
+
         if report.needs_review > 0:
             logger.info(f"\nReport: {report.needs_review} SKUs needing review saved to reports/")
             logger.info(f"  Check: reports/needs_review_*.txt")
@@ -79,5 +117,39 @@ def run_job(cfg, sku_file=None):
         raise
 
 
+class StopSignals:
+    """Make SIGTERM/SIGINT stop the bot gracefully instead of killing it.
+
+    Installed once from the main thread, for single runs and scheduled mode
+    alike. The first signal lets the SKU in flight finish, checkpoints
+    progress and flushes state (via the running processor's request_stop)
+    and shuts the scheduler down so no further run starts; a second one
+    interrupts immediately.
+    """
+
+    def __init__(self):
+        self.processor = None
+        self.scheduler = None
+        self._received = False
+
+    def install(self) -> None:
+        """Install the handlers; must be called from the main thread."""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._handle)
+
+    def _handle(self, signum, frame) -> None:
+        if self._received:
+            raise KeyboardInterrupt
+        self._received = True
+        get_logger(__name__).warning(f"Received signal {signum}, stopping")
+
+        processor = self.processor
+        if processor is not None:
+            processor.request_stop()
+        if self.scheduler is not None and self.scheduler.running:
+            # The running job keeps its thread until it has checkpointed
+            self.scheduler.shutdown(wait=False)
+
+
 if __name__ == "__main__":
     main()
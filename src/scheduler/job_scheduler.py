@@ -5,18 +5,25 @@ from apscheduler.triggers.interval import IntervalTrigger
 from ..utils.logger import get_logger
 
 
-def start_scheduler(config, interval_hours: int = 6):
-    """Start the job scheduler."""
+def start_scheduler(config, interval_hours: int = 6, stop_signals=None):
+    """Start the job scheduler.
+
+    Args:
+        stop_signals: StopSignals installed by main(); a stop signal shuts
+            the scheduler down and stops the running job gracefully
+    """
     logger = get_logger(__name__)
     
     from ..main import run_job
     
     scheduler = BlockingScheduler()
+    if stop_signals:
+        stop_signals.scheduler = scheduler
     
     trigger = IntervalTrigger(hours=interval_hours)
     
     scheduler.add_job(
-        func=lambda: run_job(config),
+        func=lambda: run_job(config, stop_signals=stop_signals),
         trigger=trigger,
         id="image_fetcher_job",
         name="Image Fetcher Bot Job",
@@ -1,19 +1,70 @@
 """Multi-source image search with relevance scoring."""
 
-from typing import List, Optional
+import math
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+import requests
+from tenacity import RetryError
+from src.api.base_client import RateLimitedError
+from src.api.circuit_breaker import CircuitBreaker, CircuitOpenError
 from src.api.freepik_client import FreepikClient
 from src.api.pexels_client import PexelsClient
 from src.api.pixabay_client import PixabayClient
+from src.api.unsplash_client import UnsplashClient
+from src.services.image_validator import ImageValidator
+from src.services.quota_ledger import QuotaLedger
+from src.services.source_scheduler import SourceScheduler
 from src.storage.models import ImageResult, ImageSource
+from src.storage.state_manager import StateManager
 from src.utils.logger import LoggerMixin
 from src.utils.config import Config
+from src.utils.text import tokenize_words
+
+# Relevance score component for each image source
+SOURCE_SCORES = {"freepik": 0.2, "pexels": 0.15, "unsplash": 0.15, "pixabay": 0.1}
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Check whether a source error is an outage worth waiting out.
+
+    Open circuits, exhausted retries, connection errors, timeouts and 5xx
+    responses are; 4xx responses (e.g. a rejected API key) and unreadable
+    responses would fail the same way on retry.
+    """
+    if isinstance(error, (CircuitOpenError, RetryError, requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError):
+        return error.response is None or error.response.status_code >= 500
+    return False
+
+
+class SearchDeferredError(Exception):
+    """No acceptable image yet, but a source could not be searched.
+
+    Raised when a source was throttled, out of quota, behind an open circuit
+    or failing. The caller should retry the search after ``retry_at`` (epoch
+    seconds) rather than treat the SKU as having no image.
+    """
+
+    def __init__(self, retry_at: float):
+        self.retry_at = retry_at
+        super().__init__(f"Search deferred for {max(retry_at - time.time(), 0):.0f}s "
+                         f"by rate-limited or unavailable sources")
 
 
 class ImageSearchService(LoggerMixin):
     """Search for images across multiple sources with cascade strategy."""
 
-    def __init__(self, config: Config):
-        """Initialize image search service."""
+    def __init__(self, config: Config, state_manager: Optional[StateManager] = None):
+        """Initialize image search service.
+
+        Args:
+            config: Application configuration
+            state_manager: State DB for learned source ordering and quota
+                accounting; without it sources are always tried in static
+                priority order and quotas are not tracked
+        """
         self.config = config
         self.minimum_score = config.minimum_relevance_score
         
@@ -24,76 +75,317 @@ class ImageSearchService(LoggerMixin):
             self.clients[ImageSource.PEXELS] = PexelsClient(config.get_api_key("pexels"))
         if config.is_source_enabled("pixabay"):
             self.clients[ImageSource.PIXABAY] = PixabayClient(config.get_api_key("pixabay"))
+        if config.is_source_enabled("unsplash"):
+            self.clients[ImageSource.UNSPLASH] = UnsplashClient(config.get_api_key("unsplash"))
         
+        breaker_cfg = config.image_search_config.get("circuit_breaker", {})
+        for source, client in self.clients.items():
+            client.circuit_breaker = CircuitBreaker(
+                source.value,
+                failure_threshold=breaker_cfg.get("failure_threshold", 3),
+                cooldown_seconds=breaker_cfg.get("cooldown_seconds", 300)
+            )
+
+        pacing_cfg = config.image_search_config.get("pacing", {})
+        for client in self.clients.values():
+            client.pacing_threshold = pacing_cfg.get("threshold", 0.2)
+            client.max_pacing_wait_seconds = pacing_cfg.get("max_wait_seconds", 30)
+
         self.source_priorities = config.source_priorities
+        self.results_per_query = {
+            source: config.image_search_config.get(source.value, {}).get("results_per_query", 5)
+            for source in self.clients
+        }
+        self.max_candidates = config.image_search_config.get("max_candidates", 5)
+        self.validator = ImageValidator(**config.validation_config)
+        # Recent provider responses, so a SKU retried after a rate limit does
+        # not repeat calls to the sources that did answer
+        self._result_cache: "OrderedDict[Tuple[ImageSource, str], List[ImageResult]]" = OrderedDict()
+        self.result_cache_size = config.image_search_config.get("result_cache_size", 256)
 
-    def search_image(self, keywords: List[str]) -> Optional[ImageResult]:
-        """Search for best matching image across all sources."""
-        self.logger.info(f"Searching for image with keywords: {keywords}")
-        
-        query = " ".join(keywords)
-        all_results = []
-        
-        for source, priority in sorted(self.source_priorities.items(), key=lambda x: x[1]):
-            source_enum = ImageSource(source)
-            if source_enum not in self.clients:
-                continue
-            
-            try:
-                results = self._search_source(source_enum, query)
-                scored_results = [(r, self.score_image_relevance(r, keywords)) for r in results]
-                all_results.extend(scored_results)
-                
-                best = max(scored_results, key=lambda x: x[1], default=(None, 0))
-                if best[0] and best[1] >= self.minimum_score:
-                    self.logger.info(f"Found good match on {source} (score: {best[1]:.2f})")
-                    best[0].relevance_score = best[1]
-                    return best[0]
-                    
-            except Exception as e:
-                self.logger.error(f"Error searching {source}: {e}")
-                continue
-        
-        if all_results:
-            best = max(all_results, key=lambda x: x[1])
-            if best[1] >= self.minimum_score * 0.8:
-                self.logger.warning(f"Using lower-scored image (score: {best[1]:.2f})")
-                best[0].relevance_score = best[1]
-                return best[0]
-        
+        adaptive_cfg = config.image_search_config.get("adaptive_ordering", {})
+        if state_manager and adaptive_cfg.get("enabled", True):
+            self.scheduler = SourceScheduler(
+                state_manager, self.source_priorities,
+                min_samples=adaptive_cfg.get("min_samples", 20),
+                skip_below_hit_rate=adaptive_cfg.get("skip_below_hit_rate", 0.02),
+                explore_rate=adaptive_cfg.get("explore_rate", 0.05)
+            )
+        else:
+            self.scheduler = None
+
+        quota_cfg = dict(config.image_search_config.get("quotas", {}))
+        calls_per_sku = quota_cfg.pop("calls_per_sku", 1.5)
+        if state_manager and quota_cfg:
+            self.quota = QuotaLedger(
+                state_manager, quota_cfg,
+                run_interval_hours=config.scheduler_config.get("interval", {}).get("hours", 6),
+                calls_per_sku=calls_per_sku
+            )
+            for source, client in self.clients.items():
+                client.response_listeners.append(
+                    lambda response, name=source.value: self.quota.record_call(name, response.headers)
+                )
+        else:
+            self.quota = None
+
+    def _ordered_sources(self, category: Optional[str]) -> List[str]:
+        """Get enabled sources in the order to try them."""
+        sources = [source for source, _ in sorted(self.source_priorities.items(), key=lambda x: x[1])
+                   if ImageSource(source) in self.clients]
+        if self.scheduler:
+            return self.scheduler.order_sources(sources, category)
+        return sources
+
+    def plan_queries(self, keywords: List[str], category: Optional[str] = None) -> List[List[str]]:
+        """Build the keyword sets to search for a SKU, most specific first.
+
+        The plan is the full keywords, then the top two, then the top keyword
+        qualified by the product category. Duplicate queries are dropped.
+        """
+        candidates = [keywords]
         if len(keywords) > 2:
-            self.logger.info("No good match, trying with fewer keywords")
-            return self.search_image(keywords[:2])
-        
-        self.logger.warning("No suitable image found")
-        return None
+            candidates.append(keywords[:2])
+        if category and keywords and category.lower() != keywords[0].lower():
+            candidates.append([keywords[0], category])
+
+        plan = []
+        seen = set()
+        for plan_keywords in candidates:
+            query = " ".join(plan_keywords).lower()
+            if plan_keywords and query not in seen:
+                seen.add(query)
+                plan.append(plan_keywords)
+        return plan
+
+    def search_image(self, keywords: List[str], category: Optional[str] = None) -> Optional[ImageResult]:
+        """Search for best matching image across all sources.
+
+        Args:
+            keywords: Search keywords
+            category: Product category (see search_candidates)
+
+        Returns:
+            Best candidate, or None if none is good enough
+        """
+        candidates = self.search_candidates(keywords, category)
+        return candidates[0] if candidates else None
+
+    def search_candidates(self, keywords: List[str], category: Optional[str] = None) -> List[ImageResult]:
+        """Search for acceptable images, best first.
+
+        Planned queries (see plan_queries) are issued in order, each across
+        the sources in scheduler order, stopping at the first candidate that
+        reaches the minimum relevance score. All candidates go into one
+        pool, and each (source, query) pair is requested at most once. If no
+        candidate reaches the minimum, candidates within 80% of it are
+        accepted.
+
+        Args:
+            keywords: Search keywords
+            category: Product category, used to pick the source order learned
+                for similar SKUs and to qualify a back-off query
+
+        Returns:
+            Up to max_candidates images ranked by relevance_score, for the
+            caller to fall back through if a download or validation fails
+
+        Raises:
+            SearchDeferredError: Nothing acceptable was found and a source
+                was skipped or unavailable (rate limited, out of quota,
+                circuit open, or a transient error, see is_transient_error),
+                so "no image" is not yet a verdict
+        """
+        self.logger.info(f"Searching for image with keywords: {keywords}")
+        if self.quota:
+            self.quota.record_search()
+
+        pool: Dict[Tuple[ImageSource, str], Tuple[ImageResult, float]] = {}
+        searched: Set[Tuple[ImageSource, str]] = set()
+        plan = self.plan_queries(keywords, category)
+        found = False
+        throttled_until = None
+
+        for step, plan_keywords in enumerate(plan):
+            if step:
+                self.logger.info(f"No good match, trying with keywords: {plan_keywords}")
+            query = " ".join(plan_keywords)
+
+            for source in self._ordered_sources(category):
+                source_enum = ImageSource(source)
+                if (source_enum, query.lower()) in searched:
+                    continue
+                client = self.clients[source_enum]
+                if client.is_throttled():
+                    self.logger.debug(f"Skipping {source}: rate limited")
+                    throttled_until = min(throttled_until or client.throttled_until, client.throttled_until)
+                    continue
+                quota_until = self.quota.exhausted_until(source) if self.quota else None
+                if quota_until:
+                    self.logger.debug(f"Skipping {source}: quota used up")
+                    throttled_until = min(throttled_until or quota_until, quota_until)
+                    continue
+                breaker = client.circuit_breaker
+                if not breaker.is_available():
+                    breaker.rejected += 1
+                    self.logger.debug(f"Skipping {source}: circuit open")
+                    throttled_until = min(throttled_until or breaker.reopens_at(), breaker.reopens_at())
+                    continue
+                searched.add((source_enum, query.lower()))
+
+                try:
+                    cache_key = (source_enum, query.lower())
+                    cached = self._result_cache.get(cache_key)
+                    if cached is None:
+                        search_start = time.time()
+                        results = self._search_source(source_enum, query)
+                        latency_ms = (time.time() - search_start) * 1000
+                        self._cache_results(cache_key, results)
+                    else:
+                        results = cached
+                    results = self.prefilter_candidates(results)
+                    scored_results = list(zip(results, self.score_candidates(results, plan_keywords)))
+                    for image, score in scored_results:
+                        key = (image.source, image.id)
+                        if key not in pool or pool[key][1] < score:
+                            pool[key] = (image, score)
+
+                    best = max(scored_results, key=lambda x: x[1], default=(None, 0))
+                    if self.scheduler and cached is None:
+                        self.scheduler.record(source, category,
+                                              best[0] is not None and best[1] >= self.minimum_score,
+                                              best[1], latency_ms)
+                    if best[0] and best[1] >= self.minimum_score:
+                        self.logger.info(f"Found good match on {source} (score: {best[1]:.2f})")
+                        found = True
+                        break
+
+                except RateLimitedError as e:
+                    throttled_until = min(throttled_until or e.retry_at, e.retry_at)
+                    continue
+                except Exception as e:
+                    if not isinstance(e, CircuitOpenError):
+                        self.logger.error(f"Error searching {source}: {e}")
+                    if not is_transient_error(e):
+                        # Counts as no results from this source (not cached,
+                        # so a fixed key or response is picked up next time)
+                        continue
+                    # Outage: search it again once its circuit would let a
+                    # request through
+                    if breaker.is_available():
+                        retry_at = time.time() + breaker.cooldown_seconds
+                    else:
+                        retry_at = breaker.reopens_at()
+                    throttled_until = min(throttled_until or retry_at, retry_at)
+                    continue
+
+            if found:
+                break
+            best_score = max((score for _, score in pool.values()), default=0.0)
+            if best_score >= self.minimum_score * 0.8:
+                self.logger.warning(f"Using lower-scored images (best score: {best_score:.2f})")
+                break
+
+        ranked = sorted((entry for entry in pool.values() if entry[1] >= self.minimum_score * 0.8),
+                        key=lambda x: x[1], reverse=True)[:self.max_candidates]
+        if not ranked and throttled_until:
+            raise SearchDeferredError(throttled_until)
+        if not ranked:
+            self.logger.warning("No suitable image found")
+        for image, score in ranked:
+            image.relevance_score = score
+        return [image for image, _ in ranked]
+
+    def _cache_results(self, key: Tuple[ImageSource, str], results: List[ImageResult]) -> None:
+        """Remember a provider response, evicting the oldest beyond result_cache_size."""
+        self._result_cache[key] = results
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def source_health(self) -> Dict[str, Dict]:
+        """Get the circuit breaker state of each enabled source."""
+        return {source.value: client.circuit_breaker.snapshot() for source, client in self.clients.items()}
+
+    def sku_budget(self) -> Optional[int]:
+        """Get how many SKUs this run may search within the provider quotas, or None if unlimited."""
+        if not self.quota:
+            return None
+        return self.quota.sku_budget([source.value for source in self.clients])
+
+    def flush_source_stats(self) -> None:
+        """Persist pending source outcomes and quota counts."""
+        if self.scheduler:
+            self.scheduler.flush()
+        if self.quota:
+            self.quota.flush()
 
     def _search_source(self, source: ImageSource, query: str) -> List[ImageResult]:
-        """Search specific source for images."""
+        """Search specific source for images.
+
+        Raises:
+            RateLimitedError, CircuitOpenError or the request error when the
+            source did not answer, so a failure is never taken for "no results"
+        """
         client = self.clients.get(source)
         if not client:
             return []
-        
-        try:
-            return client.search_images(query, per_page=5)
-        except Exception as e:
-            self.logger.error(f"Failed to search {source.value}: {e}")
-            return []
+        return client.search_images(query, per_page=self.results_per_query.get(source, 5))
+
+    def prefilter_candidates(self, images: List[ImageResult]) -> List[ImageResult]:
+        """Drop candidates whose provider metadata already fails validation."""
+        kept = [image for image in images
+                if not self.validator.check_metadata(image.width, image.height, image.file_size)]
+        if len(kept) < len(images):
+            self.logger.debug(f"Pre-filter removed {len(images) - len(kept)} of {len(images)} candidates")
+        return kept
 
     def score_image_relevance(self, image: ImageResult, keywords: List[str]) -> float:
         """Score image relevance based on keywords, quality, and source."""
-        score = 0.0
-        
-        title_lower = (image.title or "").lower()
-        keyword_matches = sum(1 for kw in keywords if kw.lower() in title_lower)
-        score += (keyword_matches / len(keywords)) * 0.6
-        
-        if image.width >= 1920 and image.height >= 1080:
-            score += 0.2
-        elif image.width >= 1280 and image.height >= 720:
-            score += 0.1
-        
-        source_scores = {"freepik": 0.2, "pexels": 0.15, "pixabay": 0.1}
-        score += source_scores.get(image.source.value, 0.05)
-        
-        return min(score, 1.0)
+        return self.score_candidates([image], keywords)[0]
+
+    def score_candidates(self, images: List[ImageResult], keywords: List[str]) -> List[float]:
+        """Score a batch of candidate images for one keyword set in a single pass.
+
+        A keyword matches when each of its words shares a form (the word or
+        a singular, see stem_forms) with a word of the image title; whole
+        words only, so "cap" does not match "capture".
+        Keywords are weighted by IDF over the batch, so matching a keyword
+        that few candidates share counts for more than one they all have.
+        Keywords no candidate matches get the minimum weight.
+
+        Args:
+            images: Candidate images
+            keywords: Search keywords
+
+        Returns:
+            Relevance score (0-1) per image, in input order
+        """
+        keyword_words = [words for words in (tokenize_words(kw) for kw in keywords) if words]
+        matches = [[i for i, words in enumerate(keyword_words)
+                    if all(not forms.isdisjoint(image.tokens) for forms in words)] for image in images]
+        document_frequency = Counter(i for matched in matches for i in matched)
+        corpus_size = len(images)
+        weights = [
+            1.0 + math.log((corpus_size + 1) / (document_frequency[i] + 1)) if document_frequency[i] else 1.0
+            for i in range(len(keyword_words))
+        ]
+        total_weight = sum(weights)
+        scores = []
+
+        for image, matched in zip(images, matches):
+            score = 0.0
+
+            if total_weight:
+                score += (sum(weights[i] for i in matched) / total_weight) * 0.6
+
+            width, height = image.width or 0, image.height or 0
+            if width >= 1920 and height >= 1080:
+                score += 0.2
+            elif width >= 1280 and height >= 720:
+                score += 0.1
+
+            score += SOURCE_SCORES.get(image.source.value, 0.05)
+            scores.append(min(score, 1.0))
+
+        return scores
@@ -1,7 +1,7 @@
 """Validate images before uploading."""
 
 from io import BytesIO
-from typing import List
+from typing import List, Optional
 from PIL import Image
 from src.storage.models import ValidationResult
 from src.utils.logger import LoggerMixin
@@ -21,6 +21,23 @@ class ImageValidator(LoggerMixin):
         self.min_aspect_ratio = min_aspect_ratio
         self.max_aspect_ratio = max_aspect_ratio
 
+    def check_metadata(self, width: Optional[int], height: Optional[int],
+                       file_size: Optional[int] = None) -> List[str]:
+        """Apply the validation rules to provider metadata, before downloading.
+
+        Only rules that make validate_image fail are checked (aspect ratio is
+        just a warning there). Unknown values pass.
+
+        Returns:
+            Errors the image would fail validation with
+        """
+        errors = []
+        if file_size and file_size > self.max_file_size:
+            errors.append(f"File size {file_size/1024/1024:.2f}MB exceeds max {self.max_file_size/1024/1024}MB")
+        if width and height and (width < self.min_width or height < self.min_height):
+            errors.append(f"Dimensions {width}x{height} below minimum {self.min_width}x{self.min_height}")
+        return errors
+
     def validate_image(self, image_data: bytes) -> ValidationResult:
         """Validate image data."""
         errors = []
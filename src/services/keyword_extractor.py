@@ -1,15 +1,32 @@
 """Extract keywords from SKU names for image searching."""
 
 import re
-from typing import List
+import string
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 from src.utils.logger import LoggerMixin
 
+CLEAN_PATTERN = re.compile(r'[^a-z0-9\s\-_]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Lowercase ASCII text: every character clean_text would drop becomes a space
+CLEAN_TABLE = str.maketrans({
+    chr(code): " " for code in range(128)
+    if chr(code) not in string.ascii_lowercase + string.digits + "-_" and not chr(code).isspace()
+})
+SPLIT_TABLE = str.maketrans("-_", "  ")
+_UNSEEN = object()
+
 
 class KeywordExtractor(LoggerMixin):
-    """Extract searchable keywords from SKU names."""
+    """Extract searchable keywords from SKU names.
+
+    Names are normalised with precompiled tables, each distinct word is
+    filtered and expanded once, and the keywords of recently seen names are
+    memoised, since catalogs repeat the same names and name prefixes.
+    """
 
     STOPWORDS = {"a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
-    
+
     ABBREVIATIONS = {
         "l": "large", "m": "medium", "s": "small", "xl": "extra large",
         "xxl": "double extra large", "xs": "extra small",
@@ -21,44 +38,106 @@ class KeywordExtractor(LoggerMixin):
     }
 
     def __init__(self, min_length: int = 3, max_keywords: int = 5,
-                 remove_numbers: bool = False, expand_abbreviations: bool = True):
-        """Initialize keyword extractor."""
+                 remove_numbers: bool = False, expand_abbreviations: bool = True,
+                 cache_size: int = 10000):
+        """Initialize keyword extractor.
+
+        Args:
+            min_length: Shortest keyword kept
+            max_keywords: Keywords kept per name, in name order
+            remove_numbers: Drop purely numeric words
+            expand_abbreviations: Replace known abbreviations with full words
+            cache_size: Normalised names whose keywords are memoised, and
+                distinct words whose keyword is memoised
+        """
         self.min_length = min_length
         self.max_keywords = max_keywords
         self.remove_numbers = remove_numbers
         self.expand_abbreviations = expand_abbreviations
+        self.cache_size = cache_size
+        self._memo: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        # Each word's keyword, or None if the word is dropped; cleared when
+        # it reaches cache_size, which is cheaper than LRU order on every hit
+        self._words: Dict[str, Optional[str]] = {}
 
     def extract_keywords(self, sku_name: str) -> List[str]:
         """Extract keywords from SKU name."""
-        self.logger.debug(f"Extracting keywords from: {sku_name}")
-        
-        cleaned = self.clean_text(sku_name)
-        words = self.split_words(cleaned)
-        words = self.remove_stopwords(words)
-        
-        if self.expand_abbreviations:
-            words = [self.expand_abbreviation(w) for w in words]
-        
-        if self.remove_numbers:
-            words = [w for w in words if not w.isdigit()]
-        
-        words = [w for w in words if len(w) >= self.min_length]
-        keywords = words[:self.max_keywords]
-        
-        self.logger.debug(f"Extracted keywords: {keywords}")
+        return list(self._extract(self.clean_text(sku_name)))
+
+    def extract_many(self, sku_names: Iterable[str]) -> List[List[str]]:
+        """Extract keywords for a chunk of SKU names in one pass.
+
+        Duplicate names within the chunk, and names already memoised, are
+        only normalised once.
+
+        Args:
+            sku_names: SKU names
+
+        Returns:
+            Keywords per name, in input order
+        """
+        extract = self._extract
+        clean_text = self.clean_text
+        by_name: Dict[str, Tuple[str, ...]] = {}
+        results = []
+        for sku_name in sku_names:
+            keywords = by_name.get(sku_name)
+            if keywords is None:
+                keywords = by_name[sku_name] = extract(clean_text(sku_name))
+            results.append(list(keywords))
+        return results
+
+    def _extract(self, cleaned: str) -> Tuple[str, ...]:
+        """Get the keywords of a normalised name, memoised."""
+        memo = self._memo
+        keywords = memo.get(cleaned)
+        if keywords is not None:
+            memo.move_to_end(cleaned)
+            return keywords
+
+        words = self._words
+        found = []
+        for word in self.split_words(cleaned):
+            keyword = words.get(word, _UNSEEN)
+            if keyword is _UNSEEN:
+                if len(words) >= self.cache_size:
+                    words.clear()
+                keyword = words[word] = self._keyword(word)
+            if keyword is not None:
+                found.append(keyword)
+                if len(found) == self.max_keywords:
+                    break
+        keywords = tuple(found)
+
+        memo[cleaned] = keywords
+        if len(memo) > self.cache_size:
+            memo.popitem(last=False)
         return keywords
 
+    def _keyword(self, word: str) -> Optional[str]:
+        """Get the keyword for one word, or None if it is filtered out."""
+        if word.lower() in self.STOPWORDS:
+            return None
+        if self.expand_abbreviations:
+            word = self.expand_abbreviation(word)
+        if self.remove_numbers and word.isdigit():
+            return None
+        if len(word) < self.min_length:
+            return None
+        return word
+
     def clean_text(self, text: str) -> str:
         """Clean text by removing special characters."""
         text = text.lower()
-        text = re.sub(r'[^a-z0-9\s\-_]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        if text.isascii():
+            return " ".join(text.translate(CLEAN_TABLE).split())
+        text = CLEAN_PATTERN.sub(' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         return text.strip()
 
     def split_words(self, text: str) -> List[str]:
         """Split text into words using delimiters."""
-        words = re.split(r'[-_\s]+', text)
-        return [w for w in words if w]
+        return text.translate(SPLIT_TABLE).split()
 
     def remove_stopwords(self, words: List[str]) -> List[str]:
         """Remove common stopwords."""
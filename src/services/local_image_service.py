@@ -1,11 +1,23 @@
 """Service for handling local image files matched by SKU."""
 
 import os
-from pathlib import Path
-from typing import Optional, Dict
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Optional, Dict, Tuple, Union
 from src.utils.logger import LoggerMixin
 
 
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path: Path) -> bool:
+    """Check whether a path looks like a supported image archive."""
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
 class LocalImageResult:
     """Result of local image lookup."""
 
@@ -24,24 +36,34 @@ class LocalImageService(LoggerMixin):
             SKU123.jpg
             SKU456.png
             SKU789.webp
-
-    Filenames (without extension) must match the SKU code.
+            vendor_dump.zip
+
+    Filenames (without extension) must match the SKU code. Images inside
+    ZIP and uncompressed TAR archives are indexed from the archive directory
+    and read straight from the archive, without extracting to disk.
+    Compressed TARs (.tar.gz/.bz2/.xz) have no random access (each backward
+    seek decompresses from the start), so their images are extracted to a
+    temporary cache in one sequential pass instead. The configured path may
+    also point at a single archive instead of a folder.
     """
 
     def __init__(self, images_folder: str):
         """Initialize local image service.
 
         Args:
-            images_folder: Path to folder containing SKU images
+            images_folder: Path to folder containing SKU images, or to a
+                ZIP/TAR archive of SKU images
         """
         self.images_folder = Path(images_folder)
         self.supported_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+        self._archives: Dict[Path, Union[zipfile.ZipFile, tarfile.TarFile]] = {}
+        self._cache_dir: Optional[Path] = None
 
         if not self.images_folder.exists():
             raise ValueError(f"Images folder does not exist: {images_folder}")
 
-        if not self.images_folder.is_dir():
-            raise ValueError(f"Images path is not a directory: {images_folder}")
+        if not self.images_folder.is_dir() and not is_archive(self.images_folder):
+            raise ValueError(f"Images path is not a directory or archive: {images_folder}")
 
         self.logger.info(f"Initialized LocalImageService with folder: {images_folder}")
         self._build_sku_index()
@@ -49,25 +71,124 @@ class LocalImageService(LoggerMixin):
     def _build_sku_index(self) -> None:
         """Build index of available SKU images for faster lookup."""
         self.sku_index: Dict[str, Path] = {}
+        self._archive_members: Dict[str, Tuple[Path, Union[zipfile.ZipInfo, tarfile.TarInfo]]] = {}
+        # Images extracted from compressed TARs, by SKU
+        self._cached_members: Dict[str, Path] = {}
+        self.close()
+
+        if self.images_folder.is_dir():
+            for ext in self.supported_extensions:
+                for image_path in self.images_folder.glob(f"*{ext}"):
+                    self._add_to_index(image_path)
+
+            for archive_path in sorted(self.images_folder.iterdir()):
+                if archive_path.is_file() and is_archive(archive_path):
+                    self._index_archive(archive_path)
+        else:
+            self._index_archive(self.images_folder)
 
-        for ext in self.supported_extensions:
-            for image_path in self.images_folder.glob(f"*{ext}"):
-                # Get SKU from filename (without extension)
-                sku = image_path.stem
+        self.logger.info(f"Indexed {len(self.sku_index)} SKU images")
 
-                # Store case-insensitive for matching
-                sku_lower = sku.lower()
+    def _add_to_index(self, image_path: Path) -> bool:
+        """Add an image path to the index, keeping the first match per SKU."""
+        # Get SKU from filename (without extension)
+        sku = image_path.stem
 
-                # Keep first match if duplicate (warn user)
-                if sku_lower in self.sku_index:
-                    self.logger.warning(
-                        f"Duplicate SKU image found: {sku} "
-                        f"(keeping {self.sku_index[sku_lower].name}, ignoring {image_path.name})"
-                    )
-                else:
-                    self.sku_index[sku_lower] = image_path
+        # Store case-insensitive for matching
+        sku_lower = sku.lower()
 
-        self.logger.info(f"Indexed {len(self.sku_index)} SKU images")
+        # Keep first match if duplicate (warn user)
+        if sku_lower in self.sku_index:
+            self.logger.warning(
+                f"Duplicate SKU image found: {sku} "
+                f"(keeping {self.sku_index[sku_lower]}, ignoring {image_path})"
+            )
+            return False
+
+        self.sku_index[sku_lower] = image_path
+        return True
+
+    def _is_image_member(self, name: str) -> bool:
+        """Check whether an archive member name is a supported, non-hidden image."""
+        member = PurePosixPath(name)
+        return not member.name.startswith('.') and member.suffix.lower() in self.supported_extensions
+
+    def _index_archive(self, archive_path: Path) -> None:
+        """Index image members of a ZIP/TAR archive from its directory."""
+        if not archive_path.name.lower().endswith(('.zip', '.tar')):
+            self._cache_compressed_tar(archive_path)
+            return
+
+        try:
+            if archive_path.name.lower().endswith('.zip'):
+                archive = zipfile.ZipFile(archive_path)
+                members = [(info.filename, info) for info in archive.infolist() if not info.is_dir()]
+            else:
+                archive = tarfile.open(archive_path)
+                members = [(info.name, info) for info in archive.getmembers() if info.isfile()]
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+            self.logger.error(f"Failed to open image archive {archive_path}: {e}")
+            return
+
+        self._archives[archive_path] = archive
+        count = 0
+
+        for name, info in members:
+            if not self._is_image_member(name):
+                continue
+            member = PurePosixPath(name)
+
+            # Virtual path, e.g. images/vendor_dump.zip/SKU123.jpg
+            image_path = archive_path / member.name
+            if self._add_to_index(image_path):
+                self._archive_members[member.stem.lower()] = (archive_path, info)
+                count += 1
+
+        self.logger.info(f"Indexed {count} SKU images from archive {archive_path.name}")
+
+    def _cache_compressed_tar(self, archive_path: Path) -> None:
+        """Extract image members of a compressed TAR to the cache in one sequential pass."""
+        if self._cache_dir is None:
+            self._cache_dir = Path(tempfile.mkdtemp(prefix="image_archive_cache_"))
+        count = 0
+
+        try:
+            # Stream mode reads members in archive order and never seeks back
+            with tarfile.open(archive_path, "r|*") as archive:
+                for info in archive:
+                    if not info.isfile() or not self._is_image_member(info.name):
+                        continue
+                    member = PurePosixPath(info.name)
+                    image_path = archive_path / member.name
+                    if not self._add_to_index(image_path):
+                        continue
+
+                    cached_path = self._cache_dir / f"{len(self._cached_members)}{member.suffix.lower()}"
+                    with archive.extractfile(info) as source, open(cached_path, 'wb') as target:
+                        shutil.copyfileobj(source, target)
+                    self._cached_members[member.stem.lower()] = cached_path
+                    count += 1
+        except (OSError, tarfile.TarError) as e:
+            self.logger.error(f"Failed to read image archive {archive_path}: {e}")
+
+        self.logger.info(f"Indexed {count} SKU images from compressed archive {archive_path.name}")
+
+    def _read_archive_member(self, archive_path: Path,
+                             info: Union[zipfile.ZipInfo, tarfile.TarInfo]) -> bytes:
+        """Read a single archive member into memory."""
+        archive = self._archives[archive_path]
+        if isinstance(archive, zipfile.ZipFile):
+            return archive.read(info)
+
+        member = archive.extractfile(info)
+        if member is None:
+            raise ValueError(f"Archive member is not a regular file: {info.name}")
+        with member:
+            return member.read()
+
+    def has_image(self, sku: str) -> bool:
+        """Check whether the index has an image for the SKU (case-insensitive)."""
+        return sku.lower() in self.sku_index
 
     def find_image_for_sku(self, sku: str) -> Optional[LocalImageResult]:
         """Find local image file matching the SKU.
@@ -87,8 +208,13 @@ class LocalImageService(LoggerMixin):
         image_path = self.sku_index[sku_lower]
 
         try:
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
+            if sku_lower in self._archive_members:
+                image_data = self._read_archive_member(*self._archive_members[sku_lower])
+            elif sku_lower in self._cached_members:
+                image_data = self._cached_members[sku_lower].read_bytes()
+            else:
+                with open(image_path, 'rb') as f:
+                    image_data = f.read()
 
             self.logger.info(f"Found local image for SKU {sku}: {image_path.name}")
             return LocalImageResult(sku, image_path, image_data)
@@ -109,3 +235,12 @@ class LocalImageService(LoggerMixin):
         """Refresh the SKU index (useful if files were added/removed)."""
         self.logger.info("Refreshing SKU image index")
         self._build_sku_index()
+
+    def close(self) -> None:
+        """Close any open image archives and remove extracted images."""
+        for archive in self._archives.values():
+            archive.close()
+        self._archives = {}
+        if self._cache_dir is not None:
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+            self._cache_dir = None
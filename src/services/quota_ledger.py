@@ -0,0 +1,201 @@
+"""Provider quota accounting and per-run call budgets."""
+
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from src.api.base_client import parse_rate_limit_headers
+from src.storage.state_manager import StateManager
+from src.utils.logger import LoggerMixin
+
+# Pseudo-source counting searches, to measure provider calls per SKU
+SEARCHES = "searches"
+# Searches needed before the measured calls per SKU replace the configured estimate
+MIN_SEARCHES = 20
+# Reported quotas resetting sooner than this are short rate windows, not budgets
+BUDGET_RESET_MIN_SECONDS = 3600
+
+
+class QuotaLedger(LoggerMixin):
+    """Count provider calls per hour and month and budget them across runs.
+
+    Every provider response is counted, together with the remaining quota
+    when the provider reports it in X-Ratelimit-* headers. Counts are kept
+    in memory and written to the state DB every ``flush_every`` calls and
+    at batch end (see flush).
+    A source is exhausted once its configured hourly or monthly limit, or
+    its reported remaining quota, is used up. Each run may spend its share
+    of what is left of the monthly quota (the remaining calls divided by the
+    runs left before it resets), so a large backlog is spread over the month
+    instead of exhausting the quota on day one.
+    """
+
+    def __init__(self, state_manager: StateManager, quotas: Dict[str, Dict], run_interval_hours: float = 6,
+                 calls_per_sku: float = 1.5, flush_every: int = 20):
+        """Initialize ledger from the usage persisted in the state DB.
+
+        Args:
+            state_manager: State manager holding the source_quota table
+            quotas: {source: {"hourly": limit, "monthly": limit}}; either may be omitted
+            run_interval_hours: Hours between scheduled runs
+            calls_per_sku: Provider calls per SKU, until enough searches are measured
+            flush_every: Write pending counts to the DB after this many calls
+        """
+        self.state_manager = state_manager
+        self.quotas = quotas
+        self.run_interval_seconds = run_interval_hours * 3600
+        self.calls_per_sku = calls_per_sku
+        self._usage = state_manager.get_quota_usage()
+        self._run_calls: Dict[str, int] = {}
+        self._run_budgets: Dict[str, Optional[float]] = {}
+        self.flush_every = flush_every
+        self._pending_calls: Dict[Tuple[str, str, str], int] = {}
+        self._pending_reported: Dict[str, Tuple[Optional[int], int, Optional[float]]] = {}
+        self._pending_count = 0
+
+    @staticmethod
+    def _periods(now: datetime) -> Dict[str, str]:
+        """Get the start of the current hour and month (UTC)."""
+        return {"hour": now.strftime("%Y-%m-%dT%H"), "month": now.strftime("%Y-%m")}
+
+    def _calls(self, source: str, period: str, now: datetime) -> int:
+        """Get calls to a source in the current period."""
+        usage = self._usage.get((source, period))
+        if not usage or usage["period_start"] != self._periods(now)[period]:
+            return 0
+        return usage["calls"]
+
+    def _count(self, source: str, now: datetime, **reported) -> None:
+        """Count one call in memory, to be written to the state DB by flush."""
+        periods = self._periods(now)
+        for period, period_start in periods.items():
+            key = (source, period, period_start)
+            self._pending_calls[key] = self._pending_calls.get(key, 0) + 1
+            usage = self._usage.setdefault((source, period), {"period_start": period_start, "calls": 0})
+            if usage["period_start"] != period_start:
+                usage.update(period_start=period_start, calls=0)
+            usage["calls"] += 1
+        if reported.get("reported_remaining") is not None:
+            self._usage[(source, "reported")] = {"period_start": None, "calls": 0, **reported}
+            self._pending_reported[source] = (reported["reported_limit"], reported["reported_remaining"],
+                                              reported["reset_at"])
+
+        self._pending_count += 1
+        if self._pending_count >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending call counts and reported quotas to the state DB."""
+        if not self._pending_count:
+            return
+        self.state_manager.record_quota_calls(self._pending_calls, self._pending_reported)
+        self._pending_calls = {}
+        self._pending_reported = {}
+        self._pending_count = 0
+
+    def record_call(self, source: str, headers: Mapping[str, str]) -> None:
+        """Record one provider response.
+
+        Args:
+            source: Source name
+            headers: Response headers (case-insensitive mapping)
+        """
+        limit, remaining, reset_at = parse_rate_limit_headers(headers)
+        self._count(source, datetime.now(timezone.utc), reported_limit=limit, reported_remaining=remaining,
+                    reset_at=reset_at)
+        self._run_calls[source] = self._run_calls.get(source, 0) + 1
+
+    def record_search(self) -> None:
+        """Record one SKU search."""
+        self._count(SEARCHES, datetime.now(timezone.utc))
+
+    def exhausted_until(self, source: str) -> Optional[float]:
+        """Get when a source may be called again, or None if it has quota left.
+
+        Returns:
+            Epoch seconds when the exhausted window (hour, month, reported
+            quota or this run's budget) reopens
+        """
+        now = datetime.now(timezone.utc)
+        limits = self.quotas.get(source, {})
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+
+        if limits.get("hourly") and self._calls(source, "hour", now) >= limits["hourly"]:
+            return (hour_start + timedelta(hours=1)).timestamp()
+        if limits.get("monthly") and self._calls(source, "month", now) >= limits["monthly"]:
+            return self._next_month(now).timestamp()
+
+        reported = self._usage.get((source, "reported"))
+        if (reported and reported["reported_remaining"] is not None and reported["reported_remaining"] <= 0
+                and reported["reset_at"] and reported["reset_at"] > now.timestamp()):
+            return reported["reset_at"]
+
+        budget = self.run_budget(source)
+        if budget is not None and self._run_calls.get(source, 0) >= budget:
+            return now.timestamp() + self.run_interval_seconds
+        return None
+
+    @staticmethod
+    def _next_month(now: datetime) -> datetime:
+        """Get the start of the next month."""
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return (month_start + timedelta(days=32)).replace(day=1)
+
+    def _runs_left(self, reset_at: float, now: datetime) -> int:
+        """Get the scheduled runs left before a quota resets, counting this one."""
+        return max(1, math.ceil((reset_at - now.timestamp()) / self.run_interval_seconds))
+
+    def run_budget(self, source: str) -> Optional[float]:
+        """Get how many calls to a source this run may make.
+
+        Fixed at the first call in a run, so the budget does not shrink as
+        the run spends it.
+
+        Returns:
+            Call budget, or None if the source has no monthly quota
+        """
+        if source not in self._run_budgets:
+            self._run_budgets[source] = self._call_budget(source)
+        return self._run_budgets[source]
+
+    def _call_budget(self, source: str) -> Optional[float]:
+        """Spread the remaining monthly (or reported long-window) quota over the runs left."""
+        now = datetime.now(timezone.utc)
+        budgets = []
+
+        monthly = self.quotas.get(source, {}).get("monthly")
+        if monthly:
+            remaining = max(monthly - self._calls(source, "month", now), 0)
+            budgets.append(remaining / self._runs_left(self._next_month(now).timestamp(), now))
+
+        reported = self._usage.get((source, "reported"))
+        if (reported and reported["reported_remaining"] is not None and reported["reset_at"]
+                and reported["reset_at"] - now.timestamp() > BUDGET_RESET_MIN_SECONDS):
+            budgets.append(max(reported["reported_remaining"], 0) / self._runs_left(reported["reset_at"], now))
+
+        return min(budgets) if budgets else None
+
+    def measured_calls_per_sku(self) -> float:
+        """Get provider calls per SKU search this month, or the configured estimate."""
+        now = datetime.now(timezone.utc)
+        searches = self._calls(SEARCHES, "month", now)
+        if searches < MIN_SEARCHES:
+            return self.calls_per_sku
+        calls = sum(self._calls(source, "month", now) for (source, period) in self._usage
+                    if period == "month" and source != SEARCHES)
+        return max(calls / searches, 1.0)
+
+    def sku_budget(self, sources: Iterable[str]) -> Optional[int]:
+        """Get how many SKUs this run may search within the sources' call budgets.
+
+        Args:
+            sources: Enabled source names
+
+        Returns:
+            SKU budget, or None if any source has no monthly quota (it can
+            take the load once the budgeted sources run out)
+        """
+        budgets = [self.run_budget(source) for source in sources]
+        if not budgets or any(budget is None for budget in budgets):
+            return None
+        return int(sum(budgets) / self.measured_calls_per_sku())
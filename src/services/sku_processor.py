@@ -1,14 +1,22 @@
 """Main orchestrator for SKU processing."""
 
+import heapq
+import itertools
+import json
+import os
+import socket
 import time
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 from src.api.replit_client import ReplitClient
+from src.storage.catalog_index import CatalogIndex
 from src.storage.state_manager import StateManager
-from src.storage.models import ProcessingStatus, ProcessingResult, ProcessingReport, SKU
+from src.storage.event_log import ProcessingEventLog
+from src.storage.models import (ImageSource, ProcessingRecord, ProcessingReport, ProcessingResult,
+                                ProcessingStatus, SKU)
 from src.services.keyword_extractor import KeywordExtractor
 from src.services.image_validator import ImageValidator
-from src.services.image_search_service import ImageSearchService
+from src.services.image_search_service import ImageSearchService, SearchDeferredError
 from src.services.local_image_service import LocalImageService
 from src.utils.logger import LoggerMixin
 from src.utils.config import Config
@@ -17,18 +25,57 @@ from src.utils.config import Config
 class SKUProcessor(LoggerMixin):
     """Process SKUs to find and attach images."""
 
-    def __init__(self, config: Config):
-        """Initialize SKU processor."""
+    def __init__(self, config: Config, worker_id: Optional[str] = None):
+        """Initialize SKU processor.
+
+        Args:
+            config: Application configuration
+            worker_id: Identifier used when claiming SKUs from the shared work
+                queue (defaults to hostname:pid)
+        """
         self.config = config
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_requested = False
+        self._delay_sequence = itertools.count()
+        # Results not yet written to the state DB, by SKU (see flush_results)
+        self._pending_results: Dict[str, ProcessingRecord] = {}
+        self.result_batch_size = config.state_config.get("checkpoint_interval", 25)
         self.replit_client = ReplitClient(
             config.env.replit_api_url,
             config.env.replit_email,
             config.env.replit_password
         )
-        self.state_manager = StateManager(config.env.database_path)
+        retry_backoff = config.state_config.get("retry_backoff", {})
+        self.retry_limit = config.state_config.get("failed_retry_limit", 3)
+        self.state_manager = StateManager(
+            config.env.database_path,
+            retry_base_seconds=retry_backoff.get("base_seconds", 21600),
+            retry_max_seconds=retry_backoff.get("max_seconds", 2592000),
+            review_recheck_seconds=config.state_config.get("needs_review_recheck_days", 30) * 86400
+        )
+
+        event_log_cfg = config.state_config.get("event_log", {})
+        self.event_log_config = event_log_cfg
+        self.work_queue_config = config.state_config.get("work_queue", {})
+        self.lease_seconds = self.work_queue_config.get("lease_seconds", 300)
+        # Work-queue SKUs this worker holds leases on: those finished are
+        # released once their results are flushed, rate-limited ones stay
+        # leased until their retry time (see _defer_claim)
+        self._held_claims: Set[str] = set()
+        self._finished_claims: List[str] = []
+        self._deferred_claims: Set[str] = set()
+        self._leases_renewed_at = 0.0
+        if event_log_cfg.get("enabled", True):
+            self.event_log = ProcessingEventLog(
+                config.env.database_path,
+                batch_size=event_log_cfg.get("batch_size", 200),
+                flush_interval_seconds=event_log_cfg.get("flush_interval_seconds", 1.0)
+            )
+        else:
+            self.event_log = None
         self.keyword_extractor = KeywordExtractor(**config.keywords_config)
         self.image_validator = ImageValidator(**config.validation_config)
-        self.image_search = ImageSearchService(config)
+        self.image_search = ImageSearchService(config, self.state_manager)
 
         # Initialize local image service if local_images_folder is configured
         self.use_local_images = hasattr(config.env, 'local_images_folder') and config.env.local_images_folder
@@ -39,6 +86,15 @@ class SKUProcessor(LoggerMixin):
             self.local_image_service = None
             self.logger.info("Using API-based image search")
 
+        # Product master index, to give code-only SKUs searchable names
+        catalog_cfg = config.catalog_config
+        catalog_path = catalog_cfg.get("database_path", "./data/catalog.db")
+        if not self.use_local_images and catalog_cfg.get("enabled", True) and Path(catalog_path).exists():
+            self.catalog = CatalogIndex(catalog_path)
+            self.logger.info(f"Using product catalog index: {catalog_path}")
+        else:
+            self.catalog = None
+
     def _load_skus_from_file(self, sku_file: str) -> List[SKU]:
         """Load SKU list from text file.
 
@@ -66,46 +122,139 @@ class SKUProcessor(LoggerMixin):
         self.logger.info(f"Loaded {len(skus)} SKUs from {sku_file}")
         return skus
 
-    def process_all_skus(self, sku_file: str = None) -> ProcessingReport:
+    def process_all_skus(self, sku_file: str = None, resume: bool = False) -> ProcessingReport:
         """Process all SKUs without images.
 
+        Progress is checkpointed to the execution record every
+        ``state.checkpoint_interval`` SKUs. After a crash or a graceful stop
+        (see request_stop), ``resume=True`` continues the last incomplete
+        execution from its checkpoint.
+
         Args:
             sku_file: Optional path to text file containing SKU codes (one per line)
+            resume: Continue the last incomplete execution instead of starting a new one
         """
         self.logger.info("Starting SKU processing batch")
         report = ProcessingReport()
-        execution_id = self.state_manager.create_execution_record("manual")
+        self._stop_requested = False
+        self._deferred_claims = set()
+        checkpoint_interval = self.config.state_config.get("checkpoint_interval", 25)
+
+        execution = self.state_manager.get_incomplete_execution() if resume else None
+        if execution and sku_file and execution.sku_source != sku_file:
+            self.logger.warning(f"Last incomplete execution {execution.id} used {execution.sku_source}, "
+                                f"not {sku_file}; starting a new execution")
+            execution = None
+
+        if execution:
+            execution_id = execution.id
+            if execution.sku_source != "api":
+                sku_file = execution.sku_source
+            position = execution.cursor
+            report.total = execution.total_skus
+            report.successful = execution.successful
+            report.failed = execution.failed
+            report.skipped = execution.skipped
+            report.needs_review = execution.needs_review
+            self.logger.info(f"Resuming execution {execution_id} after {position} SKUs")
+        else:
+            if resume:
+                self.logger.info("No incomplete execution to resume, starting a new one")
+            execution_id = self.state_manager.create_execution_record("manual", sku_source=sku_file or "api")
+            position = 0
 
         try:
-            # Load SKUs from file if provided, otherwise use API
+            # Load SKUs from file if provided, otherwise stream them from the API
             if sku_file:
                 skus = self._load_skus_from_file(sku_file)
+                if self.catalog:
+                    enriched = self.catalog.enrich(skus)
+                    self.logger.info(f"Enriched {enriched}/{len(skus)} SKUs from the product catalog")
+                self._extract_keywords(skus)
             else:
-                skus = self.replit_client.get_skus_without_images(limit=self.config.batch_size)
+                skus = self._iter_api_skus()
+
+            # Spread provider quotas over the month: each run searches only
+            # as many SKUs as its share of the remaining quota covers
+            sku_budget = None if self.use_local_images else self.image_search.sku_budget()
+            if sku_budget is not None:
+                self.logger.info(f"Provider quotas allow {sku_budget} SKUs this run")
+
+            # With a shared work queue, several workers pull from one backlog
+            # (the queue itself remembers progress, so the cursor is not used)
+            if self.work_queue_config.get("enabled", False):
+                self.state_manager.enqueue_skus(skus)
+                skus = self._iter_claimed_skus()
+                if sku_budget is not None:
+                    skus = itertools.islice(skus, sku_budget)
+            elif not isinstance(skus, list):
+                # The API lists only products still without images, so the
+                # stream is not the one the checkpoint counted: skipping
+                # ``position`` SKUs of it would skip unprocessed ones. SKUs
+                # finished without an image are skipped by is_sku_due instead
+                if sku_budget is not None:
+                    skus = itertools.islice(skus, sku_budget)
+            else:
+                skus = skus[position:]
+                if sku_budget is not None and len(skus) > sku_budget:
+                    report.held_back = len(skus) - sku_budget
+                    self.logger.warning(f"Holding back {report.held_back} SKUs for later runs "
+                                        f"to stay within provider quotas")
+                    skus = skus[:sku_budget]
+
+            delayed: List[Tuple[float, int, SKU]] = []
+            for sku, is_retry in self._iter_with_delay_queue(skus, delayed):
+                if self._stop_requested:
+                    break
+                if is_retry and not self._resume_claim(sku.id):
+                    continue
 
-            report.total = len(skus)
-            
-            for sku in skus:
-                result = self.process_single_sku(sku.id, sku.name)
-                
-                if result.success:
-                    report.successful += 1
-                    report.source_breakdown[result.image_source.value] = \
-                        report.source_breakdown.get(result.image_source.value, 0) + 1
-                elif result.error and "No suitable image found" in result.error:
-                    report.needs_review += 1
-                    report.error_summary.append(f"{sku.id}: {result.error}")
-                elif result.error:
-                    report.failed += 1
-                    report.error_summary.append(f"{sku.id}: {result.error}")
+                result = self.process_single_sku(sku.id, sku.name, sku.category, sku.keywords)
+                if not is_retry:
+                    report.total += 1
+                    position += 1
+
+                if result.retry_at is not None:
+                    heapq.heappush(delayed, (result.retry_at, next(self._delay_sequence), sku))
+                    self._defer_claim(sku.id, result.retry_at)
                 else:
-                    report.skipped += 1
-            
+                    self._finish_claim(sku.id)
+                    if result.success:
+                        report.successful += 1
+                        report.source_breakdown[result.image_source.value] = \
+                            report.source_breakdown.get(result.image_source.value, 0) + 1
+                    elif result.error and "No suitable image found" in result.error:
+                        report.needs_review += 1
+                        report.error_summary.append(f"{sku.id}: {result.error}")
+                    elif result.error:
+                        report.failed += 1
+                        report.error_summary.append(f"{sku.id}: {result.error}")
+                    else:
+                        report.skipped += 1
+
+                if not is_retry and position % checkpoint_interval == 0:
+                    self._checkpoint(execution_id, position, report)
+
+            report.deferred = len(delayed)
+            if delayed:
+                self.logger.warning(f"{len(delayed)} SKUs still waiting on rate-limited or unavailable sources, "
+                                f"leaving them for the next run")
+
+            if self._stop_requested:
+                self._checkpoint(execution_id, position, report, status="interrupted")
+                report.interrupted = True
+                report.duration_seconds = time.time() - report.started_at.timestamp()
+                self.logger.warning(f"Stopped after {position} SKUs; "
+                                    f"continue execution {execution_id} with --resume")
+                return report
+
             report.completed_at = time.time()
             report.duration_seconds = time.time() - report.started_at.timestamp()
-            
+
+            self.flush_results()
             self.state_manager.update_execution_record(
-                execution_id, report.total, report.successful, report.failed, report.skipped
+                execution_id, report.total, report.successful, report.failed, report.skipped,
+                report.needs_review
             )
 
             # Generate report file for SKUs needing manual review
@@ -115,9 +264,25 @@ class SKUProcessor(LoggerMixin):
                 output_dir = reports_cfg.get("output_dir", "./reports")
 
                 writer = ReportWriter(output_dir=output_dir)
-                needs_review_skus = self.state_manager.get_needs_review_skus()
-                report_path = writer.write_needs_review_report(needs_review_skus)
-                self.logger.info(f"Saved {len(needs_review_skus)} SKUs needing review to {report_path}")
+                needs_review_total = self.state_manager.get_processing_stats()["needs_review"]
+                report_path = writer.write_needs_review_report(
+                    self.state_manager.iter_needs_review_skus(), total=needs_review_total
+                )
+                self.logger.info(f"Saved {needs_review_total} SKUs needing review to {report_path}")
+
+            archive_cfg = self.config.state_config.get("archive", {})
+            if archive_cfg.get("enabled", True):
+                self.state_manager.cleanup_old_records(
+                    days=self.config.state_config.get("retention_days", 30),
+                    archive_dir=archive_cfg.get("dir", "./data/archive"),
+                    chunk_size=archive_cfg.get("chunk_size", 5000)
+                )
+
+            if self.event_log:
+                self.state_manager.prune_processing_log(
+                    days=self.event_log_config.get("retention_days", 14),
+                    chunk_size=self.event_log_config.get("prune_chunk_size", 5000)
+                )
 
             self.logger.info(f"Batch complete: {report.successful}/{report.total} successful")
             return report
@@ -126,59 +291,313 @@ class SKUProcessor(LoggerMixin):
             self.logger.error(f"Batch processing failed: {e}", exc_info=True)
             raise
 
-    def process_single_sku(self, sku_id: str, sku_name: str) -> ProcessingResult:
-        """Process a single SKU."""
+        finally:
+            self.flush_results()
+            if self._held_claims:
+                # Claimed but never processed (stopped, over budget or failed)
+                self.state_manager.unclaim_skus(self.worker_id, list(self._held_claims))
+                self._held_claims = set()
+            report.source_health = self.image_search.source_health()
+            self.image_search.flush_source_stats()
+            if self.event_log:
+                self.event_log.flush()
+
+    def _iter_api_skus(self) -> Iterator[SKU]:
+        """Stream up to batch_size SKUs without images from the API, then SKUs due for retry.
+
+        Pages are enriched from the product catalog and their keywords
+        extracted as they arrive, while the client prefetches the next one.
+        """
+        listed = set()
+        for page in self.replit_client.iter_sku_pages(limit=self.config.batch_size,
+                                                      page_size=self.config.listing_page_size):
+            if self.catalog:
+                self.catalog.enrich(page)
+            self._extract_keywords(page)
+            for sku in page:
+                listed.add(sku.id)
+                yield sku
+
+        retries = self._due_retry_skus(listed)
+        if self.catalog:
+            self.catalog.enrich(retries)
+        self._extract_keywords(retries)
+        yield from retries
+
+    def _extract_keywords(self, skus: List[SKU]) -> None:
+        """Extract the search keywords of a chunk of SKUs in one pass (no-op for local images)."""
+        if self.use_local_images:
+            return
+        for sku, keywords in zip(skus, self.keyword_extractor.extract_many(sku.name for sku in skus)):
+            sku.keywords = keywords
+
+    def _due_retry_skus(self, listed: Set[str]) -> List[SKU]:
+        """Get earlier unsuccessful SKUs due for retry that are not already in the batch."""
+        room = self.config.batch_size - len(listed)
+        if room <= 0:
+            return []
+        due = self.state_manager.get_due_retry_skus(self.retry_limit, limit=room + len(listed))
+        retries = [SKU(id=sku_id, name=sku_id) for sku_id in due if sku_id not in listed][:room]
+        if retries:
+            self.logger.info(f"Adding {len(retries)} SKUs due for retry")
+        return retries
+
+    def request_stop(self) -> None:
+        """Ask a running batch to stop after the SKU in flight and checkpoint."""
+        self.logger.warning("Stop requested, finishing current SKU before exiting")
+        self._stop_requested = True
+
+    def _checkpoint(self, execution_id: int, position: int, report: ProcessingReport,
+                    status: str = "running") -> None:
+        """Persist batch progress so an interrupted run can be resumed."""
+        # Results up to the checkpoint must be stored before it moves past them
+        self.flush_results()
+        self.state_manager.checkpoint_execution(
+            execution_id, position, report.total, report.successful, report.failed,
+            report.skipped, report.needs_review, status=status
+        )
+
+    def _mark_processed(self, sku_id: str, status: ProcessingStatus,
+                        image_source: Optional[ImageSource] = None, image_url: Optional[str] = None,
+                        relevance_score: Optional[float] = None, error: Optional[str] = None,
+                        evidence: Optional[str] = None) -> None:
+        """Record a SKU result.
+
+        SUCCESS follows an image upload that is not safe to repeat, so it is
+        written at once; a crash must not lose it and re-upload on resume.
+        Other results are buffered and written in batches by flush_results.
+        """
+        record = ProcessingRecord(
+            sku_id=sku_id, status=status, image_source=image_source, image_url=image_url,
+            relevance_score=relevance_score, last_error=error, evidence=evidence
+        )
+        self.logger.info(f"SKU {sku_id} result: {status.value}"
+                         + (f" (source: {image_source.value})" if image_source else ""))
+        if status == ProcessingStatus.SUCCESS:
+            self.state_manager.mark_many([record])
+            return
+
+        self._pending_results[sku_id] = record
+        if len(self._pending_results) >= self.result_batch_size:
+            self.flush_results()
+
+    def flush_results(self) -> int:
+        """Write buffered SKU results to the state DB in one transaction.
+
+        Returns:
+            Number of results written
+        """
+        written = 0
+        if self._pending_results:
+            written = self.state_manager.mark_many(self._pending_results.values())
+            self._pending_results = {}
+        if self._finished_claims:
+            self.state_manager.release_skus(self.worker_id, self._finished_claims)
+            self._held_claims.difference_update(self._finished_claims)
+            self._finished_claims = []
+        return written
+
+    def _renew_claims(self) -> None:
+        """Renew this worker's work-queue leases well before they expire.
+
+        Called between SKUs and around each slow processing step (search,
+        download, upload), so the SKU in flight stays leased as well.
+        """
+        if self._held_claims and time.time() - self._leases_renewed_at > self.lease_seconds / 3:
+            self.state_manager.renew_leases(self.worker_id, list(self._held_claims), self.lease_seconds)
+            self._leases_renewed_at = time.time()
+
+    def _finish_claim(self, sku_id: str) -> None:
+        """Release a processed work-queue SKU with the next flush of results."""
+        if sku_id in self._held_claims:
+            self._finished_claims.append(sku_id)
+
+    def _defer_claim(self, sku_id: str, retry_at: float) -> None:
+        """Keep a rate-limited work-queue SKU leased until it is retried."""
+        if sku_id not in self._held_claims:
+            return
+        self._held_claims.discard(sku_id)
+        if self.state_manager.defer_claim(self.worker_id, sku_id, retry_at, self.lease_seconds):
+            self._deferred_claims.add(sku_id)
+
+    def _resume_claim(self, sku_id: str) -> bool:
+        """Take back the lease on a deferred work-queue SKU before retrying it.
+
+        Returns:
+            False if another worker has taken the SKU over
+        """
+        if sku_id not in self._deferred_claims:
+            return True
+        self._deferred_claims.discard(sku_id)
+        if not self.state_manager.renew_leases(self.worker_id, [sku_id], self.lease_seconds):
+            self.logger.info(f"SKU {sku_id} was taken over by another worker, not retrying it")
+            return False
+        self._held_claims.add(sku_id)
+        return True
+
+    def close(self) -> None:
+        """Flush pending results and events and release connections and image archives."""
+        self.flush_results()
+        if self.event_log:
+            self.event_log.close()
+        if self.local_image_service:
+            self.local_image_service.close()
+        self.replit_client.close()
+
+    def _iter_with_delay_queue(self, skus: Iterable[SKU],
+                               delayed: List[Tuple[float, int, SKU]]) -> Iterator[Tuple[SKU, bool]]:
+        """Yield input SKUs, interleaving rate-limited SKUs once their window reopens.
+
+        ``delayed`` is a heap of (retry_at, sequence, sku) that the caller
+        pushes deferred SKUs onto. After the input is exhausted, waits for
+        delayed SKUs for at most ``image_search.rate_limit_max_wait_seconds``
+        in total, so SKUs deferred again and again by a source outage do not
+        keep the batch running.
+
+        Yields:
+            (sku, is_retry) pairs
+        """
+        for sku in skus:
+            while delayed and delayed[0][0] <= time.time():
+                yield heapq.heappop(delayed)[2], True
+            yield sku, False
+
+        max_wait = self.config.image_search_config.get("rate_limit_max_wait_seconds", 900)
+        deadline = time.time() + max_wait
+        while delayed and not self._stop_requested:
+            retry_at = delayed[0][0]
+            if retry_at > deadline:
+                return
+            if retry_at - time.time() >= 1:
+                self.logger.info(f"Waiting {retry_at - time.time():.0f}s for rate-limited or "
+                                 f"unavailable sources ({len(delayed)} SKUs delayed)")
+            while time.time() < retry_at and not self._stop_requested:
+                self._renew_claims()
+                time.sleep(min(retry_at - time.time(), 1.0))
+            if self._stop_requested:
+                return
+            yield heapq.heappop(delayed)[2], True
+
+    def _iter_claimed_skus(self) -> Iterator[SKU]:
+        """Yield SKUs claimed from the shared work queue, one lease batch at a time.
+
+        Claimed SKUs stay leased (see _renew_claims) until their results are
+        flushed; any still unprocessed when the batch ends are handed back
+        to the queue by process_all_skus.
+        """
+        batch_size = self.work_queue_config.get("claim_batch_size", 10)
+        self.state_manager.reclaim_expired_leases()
+
+        while not self._stop_requested:
+            claimed = self.state_manager.claim_skus(self.worker_id, batch_size, self.lease_seconds)
+            if not claimed:
+                return
+
+            self._held_claims.update(sku.id for sku in claimed)
+            self._extract_keywords(claimed)
+            self._leases_renewed_at = time.time()
+            for sku in claimed:
+                if self._stop_requested:
+                    return
+                self._renew_claims()
+                yield sku
+
+    def _log_event(self, sku_id: str, action: str, level: str = "INFO", **details) -> None:
+        """Record a processing event without blocking (no-op if disabled)."""
+        if self.event_log:
+            self.event_log.record(sku_id, action, level, **details)
+
+    def process_single_sku(self, sku_id: str, sku_name: str, category: Optional[str] = None,
+                           keywords: Optional[List[str]] = None) -> ProcessingResult:
+        """Process a single SKU.
+
+        ``keywords`` are the search keywords if already extracted (see
+        _extract_keywords); otherwise they are extracted from the name.
+        """
         start_time = time.time()
         self.logger.info(f"Processing SKU: {sku_id} ({sku_name})")
+        if keywords is None and not self.use_local_images:
+            keywords = self.keyword_extractor.extract_keywords(sku_name)
 
-        if self.state_manager.is_sku_processed(sku_id):
-            self.logger.info(f"SKU {sku_id} already processed, skipping")
+        evidence = self._lookup_evidence(sku_id, keywords)
+        if sku_id in self._pending_results or not self.state_manager.is_sku_due(sku_id, self.retry_limit,
+                                                                                 evidence):
+            self.logger.info(f"SKU {sku_id} already processed or not due for retry, skipping")
             return ProcessingResult(sku_id=sku_id, success=False)
 
         try:
             # Use local images if configured
             if self.use_local_images:
-                return self._process_with_local_image(sku_id, sku_name, start_time)
+                return self._process_with_local_image(sku_id, sku_name, start_time, evidence)
             else:
-                return self._process_with_api_search(sku_id, sku_name, start_time)
+                return self._process_with_api_search(sku_id, keywords, start_time, evidence, category)
 
         except Exception as e:
             error = str(e)
             self.logger.error(f"Error processing SKU {sku_id}: {error}", exc_info=True)
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.FAILED, error=error)
+            self._log_event(sku_id, "error", "ERROR", error=error)
+            self._mark_processed(sku_id, ProcessingStatus.FAILED, error=error)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
-    def _process_with_local_image(self, sku_id: str, sku_name: str, start_time: float) -> ProcessingResult:
-        """Process SKU using local image folder."""
-        from src.storage.models import ImageSource
+    def _lookup_evidence(self, sku_id: str, keywords: Optional[List[str]]) -> str:
+        """Describe what a lookup for this SKU would try right now.
 
+        A NEEDS_REVIEW SKU is retried once this differs from the evidence
+        recorded when it was marked (its image appeared in the local index,
+        or the search keywords, enabled sources or keyword config changed),
+        or after ``state.needs_review_recheck_days``.
+        """
+        if self.use_local_images:
+            evidence = {"mode": "local", "indexed": self.local_image_service.has_image(sku_id)}
+        else:
+            evidence = {
+                "mode": "search",
+                "keywords": keywords,
+                "sources": sorted(source.value for source in self.image_search.clients),
+                "keywords_config": {key: value for key, value in self.config.keywords_config.items()
+                                    if key != "cache_size"},
+            }
+        return json.dumps(evidence, sort_keys=True)
+
+    def _process_with_local_image(self, sku_id: str, sku_name: str, start_time: float,
+                                  evidence: Optional[str] = None) -> ProcessingResult:
+        """Process SKU using local image folder."""
         # Find local image matching SKU
         local_image = self.local_image_service.find_image_for_sku(sku_id)
+        self._log_event(sku_id, "local_lookup", found=local_image is not None,
+                        bytes=len(local_image.image_data) if local_image else 0)
 
         if not local_image:
             error = f"No local image found for SKU: {sku_id}"
             self.logger.warning(f"SKU {sku_id}: {error}")
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.NEEDS_REVIEW, error=error)
+            self._mark_processed(sku_id, ProcessingStatus.NEEDS_REVIEW, error=error,
+                                 evidence=evidence)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
         # Validate the local image
         validation = self.image_validator.validate_image(local_image.image_data)
+        self._log_validation_event(sku_id, validation)
         if not validation.is_valid:
             error = f"Image validation failed: {', '.join(validation.errors)}"
             self.logger.warning(f"SKU {sku_id}: {error}")
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.FAILED, error=error)
+            self._mark_processed(sku_id, ProcessingStatus.FAILED, error=error)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
         # Upload to Replit
+        self._renew_claims()
+        upload_start = time.time()
         success = self.replit_client.attach_image_to_sku(
             sku_id, local_image.image_data, local_image.filename
         )
+        self._log_event(sku_id, "upload", "INFO" if success else "WARNING", success=success,
+                        bytes=len(local_image.image_data),
+                        latency_ms=round((time.time() - upload_start) * 1000, 1))
 
         if success:
-            self.state_manager.mark_sku_processed(
+            self._mark_processed(
                 sku_id, ProcessingStatus.SUCCESS, ImageSource.LOCAL,
                 str(local_image.image_path), 1.0  # Perfect match score
             )
@@ -190,47 +609,99 @@ class SKUProcessor(LoggerMixin):
             )
         else:
             error = "Failed to attach image to SKU"
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.FAILED, error=error)
+            self._mark_processed(sku_id, ProcessingStatus.FAILED, error=error)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
-    def _process_with_api_search(self, sku_id: str, sku_name: str, start_time: float) -> ProcessingResult:
+    def _process_with_api_search(self, sku_id: str, keywords: List[str], start_time: float,
+                                 evidence: Optional[str] = None,
+                                 category: Optional[str] = None) -> ProcessingResult:
         """Process SKU using API-based image search (original logic)."""
-        keywords = self.keyword_extractor.extract_keywords(sku_name)
         if not keywords:
             error = "No keywords extracted from SKU name"
             self.logger.warning(f"SKU {sku_id}: {error}")
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.FAILED, error=error)
+            self._mark_processed(sku_id, ProcessingStatus.FAILED, error=error)
+            return ProcessingResult(sku_id=sku_id, success=False, error=error,
+                                   processing_time=time.time() - start_time)
+        if all(keyword.isdigit() for keyword in keywords):
+            # A bare product code (e.g. a GTIN not in the catalog) matches no
+            # image titles; searching it only spends quota. Retried once the
+            # catalog gives it a name, since that changes the evidence.
+            error = "No suitable image found: SKU name is only a product code, not in the product catalog"
+            self.logger.warning(f"SKU {sku_id}: {error}")
+            self._log_event(sku_id, "no_candidate", "WARNING", keywords=keywords, reason="code_only")
+            self._mark_processed(sku_id, ProcessingStatus.NEEDS_REVIEW, error=error,
+                                 evidence=evidence)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
-        image_result = self.image_search.search_image(keywords)
-        if not image_result:
+        self._log_event(sku_id, "search_issued", keywords=keywords)
+        self._renew_claims()
+        search_start = time.time()
+        try:
+            candidates = self.image_search.search_candidates(keywords, category)
+        except SearchDeferredError as e:
+            # Not a verdict on the SKU: retry it once the source's window reopens
+            self.logger.info(f"SKU {sku_id}: {e}")
+            self._log_event(sku_id, "deferred", "WARNING", retry_in_s=round(e.retry_at - time.time(), 1))
+            return ProcessingResult(sku_id=sku_id, success=False, error=str(e),
+                                   processing_time=time.time() - start_time, retry_at=e.retry_at)
+        search_latency_ms = round((time.time() - search_start) * 1000, 1)
+
+        if not candidates:
+            self._log_event(sku_id, "no_candidate", "WARNING", latency_ms=search_latency_ms)
             error = "No suitable image found"
             self.logger.warning(f"SKU {sku_id}: {error}")
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.NEEDS_REVIEW, error=error)
+            self._mark_processed(sku_id, ProcessingStatus.NEEDS_REVIEW, error=error,
+                                 evidence=evidence)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
-        # Download image from the source (Unsplash, Pexels, etc.)
+        # Walk down the ranked candidates until one downloads and validates
         import requests
-        response = requests.get(image_result.download_url, timeout=30)
-        response.raise_for_status()
-        image_data = response.content
-
-        validation = self.image_validator.validate_image(image_data)
-        if not validation.is_valid:
-            error = f"Image validation failed: {', '.join(validation.errors)}"
-            self.logger.warning(f"SKU {sku_id}: {error}")
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.FAILED, error=error)
+        error = None
+        for rank, image_result in enumerate(candidates):
+            self._log_event(sku_id, "candidate_chosen", source=image_result.source.value,
+                            image_id=image_result.id, score=image_result.relevance_score,
+                            width=image_result.width, height=image_result.height,
+                            rank=rank, latency_ms=search_latency_ms)
+
+            self._renew_claims()
+            download_start = time.time()
+            try:
+                response = requests.get(image_result.download_url, timeout=30)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                error = f"Image download failed: {e}"
+                self.logger.warning(f"SKU {sku_id}: {error}")
+                self._log_event(sku_id, "download", "WARNING", error=str(e),
+                                latency_ms=round((time.time() - download_start) * 1000, 1))
+                continue
+            image_data = response.content
+            self._log_event(sku_id, "download", bytes=len(image_data),
+                            latency_ms=round((time.time() - download_start) * 1000, 1))
+
+            validation = self.image_validator.validate_image(image_data)
+            self._log_validation_event(sku_id, validation)
+            if not validation.is_valid:
+                error = f"Image validation failed: {', '.join(validation.errors)}"
+                self.logger.warning(f"SKU {sku_id}: {error}")
+                continue
+            break
+        else:
+            self._mark_processed(sku_id, ProcessingStatus.FAILED, error=error)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
 
         filename = f"{sku_id}.jpg"
+        self._renew_claims()
+        upload_start = time.time()
         success = self.replit_client.attach_image_to_sku(sku_id, image_data, filename)
+        self._log_event(sku_id, "upload", "INFO" if success else "WARNING", success=success,
+                        bytes=len(image_data), latency_ms=round((time.time() - upload_start) * 1000, 1))
 
         if success:
-            self.state_manager.mark_sku_processed(
+            self._mark_processed(
                 sku_id, ProcessingStatus.SUCCESS, image_result.source,
                 image_result.url, image_result.relevance_score
             )
@@ -242,6 +713,13 @@ class SKUProcessor(LoggerMixin):
             )
         else:
             error = "Failed to attach image to SKU"
-            self.state_manager.mark_sku_processed(sku_id, ProcessingStatus.FAILED, error=error)
+            self._mark_processed(sku_id, ProcessingStatus.FAILED, error=error)
             return ProcessingResult(sku_id=sku_id, success=False, error=error,
                                    processing_time=time.time() - start_time)
+
+    def _log_validation_event(self, sku_id: str, validation) -> None:
+        """Record the outcome of image validation."""
+        self._log_event(sku_id, "validation", "INFO" if validation.is_valid else "WARNING",
+                        is_valid=validation.is_valid, errors=validation.errors,
+                        format=validation.format, width=validation.width,
+                        height=validation.height, file_size=validation.file_size)
@@ -0,0 +1,151 @@
+"""Adaptive ordering of image sources from their observed search outcomes."""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from src.storage.state_manager import StateManager
+from src.utils.logger import LoggerMixin
+
+# Pseudo-observations that pull sparse estimates towards a neutral prior
+PRIOR_CALLS = 5
+PRIOR_HIT_RATE = 0.5
+DEFAULT_LATENCY_MS = 1000.0
+
+
+class SourceScheduler(LoggerMixin):
+    """Order image sources by expected time per accepted image.
+
+    Every provider call the source answered is recorded per (category,
+    source): whether it yielded a result above the minimum relevance score,
+    its best score and its latency. Failed, throttled and skipped calls are
+    not, as they say nothing about the source's hit rate or speed. Sources
+    are tried in ascending order of latency / hit rate, which minimises the
+    expected time to the first accepted image in the cascade. Estimates are
+    smoothed towards a neutral prior, so with little data all sources tie
+    and the static priorities decide. A category falls back to the
+    source's totals over all categories until it has ``min_samples`` calls
+    of its own.
+    """
+
+    def __init__(self, state_manager: StateManager, priorities: Dict[str, int], min_samples: int = 20,
+                 skip_below_hit_rate: float = 0.02, explore_rate: float = 0.05, flush_every: int = 20):
+        """Initialize scheduler from the stats persisted in the state DB.
+
+        Args:
+            state_manager: State manager holding the source_stats table
+            priorities: Static source priorities (lower first), used as tie-breaker
+            min_samples: Calls needed before a source's own stats are trusted
+            skip_below_hit_rate: Skip sources whose hit rate is below this once
+                they have min_samples calls
+            explore_rate: Chance of still trying a skipped source, so it can recover
+            flush_every: Write pending stats to the DB after this many calls
+        """
+        self.state_manager = state_manager
+        self.priorities = priorities
+        self.min_samples = min_samples
+        self.skip_below_hit_rate = skip_below_hit_rate
+        self.explore_rate = explore_rate
+        self.flush_every = flush_every
+        self._totals: Dict[Tuple[str, str], List[float]] = {
+            key: list(values) for key, values in state_manager.get_source_stats().items()
+        }
+        self._pending: Dict[Tuple[str, str], List[float]] = {}
+        self._pending_calls = 0
+
+    @staticmethod
+    def _category_key(category: Optional[str]) -> str:
+        """Normalise a category name for use as a stats key ('' when unknown)."""
+        return (category or "").strip().lower()
+
+    def _observed(self, source: str, category: str) -> Tuple[float, float, float]:
+        """Get (calls, hits, latency_ms_sum) for a source, per category if trusted."""
+        stats = self._totals.get((category, source))
+        if category and stats and stats[0] >= self.min_samples:
+            return stats[0], stats[1], stats[3]
+
+        calls = hits = latency = 0.0
+        for (_, stats_source), values in self._totals.items():
+            if stats_source == source:
+                calls += values[0]
+                hits += values[1]
+                latency += values[3]
+        return calls, hits, latency
+
+    def order_sources(self, sources: List[str], category: Optional[str] = None) -> List[str]:
+        """Order enabled sources for a search, dropping ones that rarely yield a match.
+
+        Args:
+            sources: Enabled source names
+            category: Product category of the SKU being searched, if known
+
+        Returns:
+            Source names in the order they should be tried
+        """
+        category = self._category_key(category)
+        observed = {source: self._observed(source, category) for source in sources}
+        latencies = [latency / calls for calls, _, latency in observed.values() if calls]
+        prior_latency = sum(latencies) / len(latencies) if latencies else DEFAULT_LATENCY_MS
+
+        costs = {}
+        kept = []
+        for source in sources:
+            calls, hits, latency = observed[source]
+            if (calls >= self.min_samples and hits / calls < self.skip_below_hit_rate
+                    and random.random() >= self.explore_rate):
+                self.logger.debug(f"Skipping {source}: hit rate {hits / calls:.1%} over {calls:.0f} calls")
+                continue
+            hit_rate = (hits + PRIOR_CALLS * PRIOR_HIT_RATE) / (calls + PRIOR_CALLS)
+            mean_latency = (latency + PRIOR_CALLS * prior_latency) / (calls + PRIOR_CALLS)
+            costs[source] = mean_latency / hit_rate
+            kept.append(source)
+
+        if not kept:
+            return sorted(sources, key=lambda s: self.priorities.get(s, len(self.priorities)))
+        return sorted(kept, key=lambda s: (costs[s], self.priorities.get(s, len(self.priorities))))
+
+    def record(self, source: str, category: Optional[str], hit: bool, score: float, latency_ms: float) -> None:
+        """Record the outcome of one provider call the source answered.
+
+        Args:
+            source: Source name
+            category: Product category of the SKU searched, if known
+            hit: Whether the call yielded a result above the minimum relevance score
+            score: Best relevance score among the call's results
+            latency_ms: Call latency in milliseconds
+        """
+        key = (self._category_key(category), source)
+        delta = (1, 1 if hit else 0, score, latency_ms)
+        for table in (self._totals, self._pending):
+            values = table.setdefault(key, [0, 0, 0.0, 0.0])
+            for i, value in enumerate(delta):
+                values[i] += value
+
+        self._pending_calls += 1
+        if self._pending_calls >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending outcomes to the state DB."""
+        if not self._pending:
+            return
+        self.state_manager.record_source_stats({key: tuple(values) for key, values in self._pending.items()})
+        self._pending = {}
+        self._pending_calls = 0
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get per-source totals over all categories.
+
+        Returns:
+            {source: {"calls", "hit_rate", "mean_score", "mean_latency_ms"}}
+        """
+        totals: Dict[str, List[float]] = {}
+        for (_, source), values in self._totals.items():
+            combined = totals.setdefault(source, [0, 0, 0.0, 0.0])
+            for i, value in enumerate(values):
+                combined[i] += value
+        return {
+            source: {"calls": calls, "hit_rate": hits / calls if calls else 0.0,
+                     "mean_score": score / calls if calls else 0.0,
+                     "mean_latency_ms": latency / calls if calls else 0.0}
+            for source, (calls, hits, score, latency) in totals.items()
+        }
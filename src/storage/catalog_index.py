@@ -0,0 +1,182 @@
+"""Offline product catalog index mapping SKU codes to product details."""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.storage.models import SKU
+from src.utils.logger import LoggerMixin
+
+# Accepted column names in product master exports, by catalog field
+FIELD_ALIASES = {
+    "sku": ("sku", "sku_id", "gtin", "upc", "ean", "barcode", "id", "code"),
+    "name": ("name", "product_name", "title", "description"),
+    "brand": ("brand", "brand_name", "manufacturer"),
+    "category": ("category", "category_name", "department"),
+}
+
+# SKUs per lookup query, below SQLite's bound parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+def normalize_sku(sku: str) -> str:
+    """Get the catalog key for a SKU code.
+
+    Numeric codes drop their leading zeros, so a GTIN-14 finds the same
+    product as its UPC-A or EAN-13 form; other codes are compared
+    case-insensitively.
+    """
+    sku = sku.strip()
+    if sku.isdigit():
+        return sku.lstrip("0") or "0"
+    return sku.lower()
+
+
+class CatalogIndex(LoggerMixin):
+    """Product master lookup table in SQLite.
+
+    Products are keyed by normalised SKU code in a WITHOUT ROWID table, so a
+    lookup is one B-tree search (O(log n)) and the index stays on disk
+    instead of being loaded into memory.
+    """
+
+    def __init__(self, db_path: str = "./data/catalog.db", busy_timeout: float = 30.0):
+        """Initialize catalog index.
+
+        Args:
+            db_path: Path to SQLite database file
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.db_path = Path(db_path)
+        self.busy_timeout = busy_timeout
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection."""
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        conn = self._get_connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS products (
+                sku_key TEXT PRIMARY KEY,
+                sku TEXT NOT NULL,
+                name TEXT,
+                brand TEXT,
+                category TEXT
+            ) WITHOUT ROWID
+        """
+        )
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _record_fields(record: Dict) -> Tuple[Optional[str], ...]:
+        """Pick (sku, name, brand, category) from an export record, by FIELD_ALIASES."""
+        lowered = {str(key).strip().lower(): value for key, value in record.items()}
+        fields = []
+        for aliases in FIELD_ALIASES.values():
+            value = next((lowered[alias] for alias in aliases if lowered.get(alias) not in (None, "")), None)
+            fields.append(str(value).strip() if value is not None else None)
+        return tuple(fields)
+
+    def ingest(self, records: Iterable[Dict], batch_size: int = 10000) -> int:
+        """Load product records, replacing existing products with the same SKU.
+
+        Args:
+            records: Product master records (see FIELD_ALIASES for accepted
+                columns); records without a SKU code or name are skipped
+            batch_size: Records per transaction
+
+        Returns:
+            Number of products loaded
+        """
+        conn = self._get_connection()
+        loaded = skipped = 0
+        batch = []
+        try:
+            for record in records:
+                sku, name, brand, category = self._record_fields(record)
+                if not sku or not name:
+                    skipped += 1
+                    continue
+                batch.append((normalize_sku(sku), sku, name, brand, category))
+                if len(batch) >= batch_size:
+                    conn.executemany("INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?)", batch)
+                    conn.commit()
+                    loaded += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany("INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?)", batch)
+                conn.commit()
+                loaded += len(batch)
+        finally:
+            conn.close()
+
+        if skipped:
+            self.logger.warning(f"Skipped {skipped} catalog records without a SKU code or name")
+        self.logger.info(f"Loaded {loaded} products into the catalog index")
+        return loaded
+
+    def lookup_many(self, skus: Iterable[str]) -> Dict[str, sqlite3.Row]:
+        """Look up products by SKU code.
+
+        Returns:
+            {sku: row with name, brand, category} for the SKUs in the catalog
+        """
+        keys: Dict[str, List[str]] = {}
+        for sku in skus:
+            keys.setdefault(normalize_sku(sku), []).append(sku)
+        key_list = list(keys)
+
+        found = {}
+        conn = self._get_connection()
+        for start in range(0, len(key_list), LOOKUP_CHUNK_SIZE):
+            chunk = key_list[start:start + LOOKUP_CHUNK_SIZE]
+            rows = conn.execute(
+                f"SELECT sku_key, name, brand, category FROM products "
+                f"WHERE sku_key IN ({', '.join('?' * len(chunk))})", chunk).fetchall()
+            for row in rows:
+                for sku in keys[row["sku_key"]]:
+                    found[sku] = row
+        conn.close()
+        return found
+
+    def enrich(self, skus: List[SKU]) -> int:
+        """Fill in names and categories of SKUs from the catalog, in place.
+
+        A SKU whose name is missing or just its code gets the catalog name,
+        prefixed with the brand unless the name already contains it. A
+        missing category is taken from the catalog.
+
+        Returns:
+            Number of SKUs enriched
+        """
+        products = self.lookup_many(sku.id for sku in skus)
+        enriched = 0
+        for sku in skus:
+            product = products.get(sku.id)
+            if product is None:
+                continue
+            changed = False
+            if not sku.name or sku.name.strip() == sku.id.strip():
+                name, brand = product["name"], product["brand"]
+                sku.name = f"{brand} {name}" if brand and brand.lower() not in name.lower() else name
+                changed = True
+            if not sku.category and product["category"]:
+                sku.category = product["category"]
+                changed = True
+            enriched += changed
+        return enriched
+
+    def count(self) -> int:
+        """Get the number of products in the index."""
+        conn = self._get_connection()
+        total = conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+        conn.close()
+        return total
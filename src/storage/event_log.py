@@ -0,0 +1,114 @@
+"""Asynchronous batched writer for per-SKU processing events."""
+
+import json
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from src.utils.logger import LoggerMixin
+
+_STOP = object()
+
+
+class ProcessingEventLog(LoggerMixin):
+    """Write structured processing events to the processing_log table.
+
+    Events are queued in memory and written by a background thread in
+    batches, so recording an event never blocks on SQLite. Details are
+    stored as JSON, e.g. ``json_extract(details, '$.latency_ms')``.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 200,
+                 flush_interval_seconds: float = 1.0, max_queue_size: int = 10000):
+        """Initialize event log and start the writer thread.
+
+        Args:
+            db_path: Path to the state database (schema created by StateManager)
+            batch_size: Maximum events written per transaction
+            flush_interval_seconds: Maximum time an event waits before being written
+            max_queue_size: Events beyond this backlog are dropped rather than blocking
+        """
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_seconds
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="processing-log-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, sku_id: Optional[str], action: str, level: str = "INFO", **details: Any) -> None:
+        """Queue an event for writing without blocking.
+
+        Args:
+            sku_id: SKU the event belongs to
+            action: Stage name, e.g. "search_issued" or "upload"
+            level: Log level name
+            **details: JSON-serialisable event attributes
+        """
+        timestamp = datetime.utcnow().isoformat(sep=" ", timespec="milliseconds")
+        event = (timestamp, sku_id, action, json.dumps(details, default=str), level)
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                self.logger.warning(f"Processing log backlog full, dropped {self.dropped} events")
+
+    def flush(self) -> None:
+        """Block until all queued events have been written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Writer loop: drain the queue in batches and insert them."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+
+                batch: List[Tuple] = []
+                stop = item is _STOP
+                if not stop:
+                    batch.append(item)
+                while not stop and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        batch.append(item)
+
+                self._write_batch(conn, batch)
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple]) -> None:
+        """Insert a batch of events in one transaction."""
+        if not batch:
+            return
+        try:
+            conn.executemany(
+                "INSERT INTO processing_log (timestamp, sku_id, action, details, level) VALUES (?, ?, ?, ?, ?)",
+                batch)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            self.logger.error(f"Failed to write {len(batch)} processing log events: {e}")
@@ -1,4 +1,9 @@
-"""Data models using Pydantic."""
+"""Data models.
+
+Records that cross a system boundary (database rows, reports, execution
+history) are validated pydantic models. Objects created by our own code on
+per-SKU and per-result hot paths are plain slotted classes.
+"""
 
 from datetime import datetime
 from enum import Enum
@@ -6,6 +11,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
+from src.utils.text import tokenize
+
 
 class ProcessingStatus(str, Enum):
     """Status of SKU processing."""
@@ -22,50 +29,72 @@ class ImageSource(str, Enum):
     FREEPIK = "freepik"
     PEXELS = "pexels"
     PIXABAY = "pixabay"
+    UNSPLASH = "unsplash"
     WEB_SCRAPER = "web_scraper"
     MANUAL = "manual"
     LOCAL = "local"
 
 
-class SKU(BaseModel):
-    """SKU/Product model."""
-
-    id: str = Field(..., description="Unique SKU identifier")
-    name: str = Field(..., description="SKU name")
-    description: Optional[str] = Field(None, description="SKU description")
-    category: Optional[str] = Field(None, description="Product category")
-    has_image: bool = Field(False, description="Whether SKU has an image")
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
-
-class ImageResult(BaseModel):
-    """Image search result."""
-
-    id: str = Field(..., description="Image ID from source")
-    url: str = Field(..., description="Image URL")
-    download_url: str = Field(..., description="Direct download URL")
-    source: ImageSource = Field(..., description="Image source")
-    title: Optional[str] = Field(None, description="Image title/description")
-    width: int = Field(..., description="Image width in pixels")
-    height: int = Field(..., description="Image height in pixels")
-    file_size: Optional[int] = Field(None, description="File size in bytes")
-    relevance_score: float = Field(0.0, description="Relevance score (0-1)")
-    photographer: Optional[str] = Field(None, description="Photographer name")
-    photographer_url: Optional[str] = Field(None, description="Photographer URL")
+class SKU:
+    """SKU/Product model.
+
+    Built by our own code for every SKU in a run, so it is a plain slotted
+    class rather than a validated pydantic model.
+    """
+
+    __slots__ = ("id", "name", "description", "category", "has_image", "keywords")
+
+    def __init__(self, id: str, name: str, description: Optional[str] = None,
+                 category: Optional[str] = None, has_image: bool = False,
+                 keywords: Optional[List[str]] = None):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.category = category
+        self.has_image = has_image
+        # Search keywords, when extracted for a whole chunk of SKUs up front
+        self.keywords = keywords
+
+    def __repr__(self) -> str:
+        return f"SKU(id={self.id!r}, name={self.name!r})"
+
+
+class ImageResult:
+    """Image search result.
+
+    Provider clients build one per search hit from fields they have already
+    mapped and typed, so it skips pydantic validation. The title (Pexels alt
+    text, Pixabay tags, ...) is tokenised once here for relevance matching.
+    """
+
+    __slots__ = ("id", "url", "download_url", "source", "title", "width", "height", "file_size",
+                 "relevance_score", "photographer", "photographer_url", "tokens")
+
+    def __init__(self, id: str, url: str, download_url: str, source: ImageSource,
+                 width: Optional[int], height: Optional[int], title: Optional[str] = None,
+                 file_size: Optional[int] = None, relevance_score: float = 0.0,
+                 photographer: Optional[str] = None, photographer_url: Optional[str] = None):
+        self.id = id
+        self.url = url
+        self.download_url = download_url
+        self.source = source
+        self.title = title
+        self.width = width
+        self.height = height
+        self.file_size = file_size
+        self.relevance_score = relevance_score
+        self.photographer = photographer
+        self.photographer_url = photographer_url
+        self.tokens = tokenize(title)
 
     @property
     def aspect_ratio(self) -> float:
         """Calculate aspect ratio."""
-        return self.width / self.height if self.height > 0 else 0.0
+        return self.width / self.height if self.width and self.height else 0.0
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    def __repr__(self) -> str:
+        return (f"ImageResult(source={self.source.value!r}, id={self.id!r}, "
+                f"{self.width}x{self.height}, score={self.relevance_score:.3f})")
 
 
 class ValidationResult(BaseModel):
@@ -102,6 +131,7 @@ class ProcessingRecord(BaseModel):
     )
     attempts: int = Field(1, description="Number of attempts")
     last_error: Optional[str] = Field(None, description="Last error message")
+    evidence: Optional[str] = Field(None, description="What an unsuccessful lookup tried")
     created_at: datetime = Field(
         default_factory=datetime.utcnow, description="Creation timestamp"
     )
@@ -112,21 +142,82 @@ class ProcessingRecord(BaseModel):
         from_attributes = True
 
 
-class ProcessingResult(BaseModel):
-    """Result of processing a single SKU."""
-
-    sku_id: str = Field(..., description="SKU identifier")
-    success: bool = Field(..., description="Whether processing was successful")
-    image_attached: bool = Field(False, description="Whether image was attached")
-    image_source: Optional[ImageSource] = Field(None, description="Image source used")
-    relevance_score: Optional[float] = Field(None, description="Image relevance score")
-    error: Optional[str] = Field(None, description="Error message if failed")
-    processing_time: float = Field(0.0, description="Processing time in seconds")
+class ProcessingRow:
+    """Lightweight, slotted view of a processed_skus row.
+
+    Used by the streaming read APIs: values are kept as stored and
+    timestamps parsed only when accessed. Call to_model() for a validated
+    ProcessingRecord.
+    """
+
+    __slots__ = ("id", "sku_id", "status", "image_source", "image_url", "relevance_score",
+                 "attempts", "last_error", "evidence", "processed_at_raw", "created_at_raw")
+
+    def __init__(self, id: Optional[int], sku_id: str, status: str, image_source: Optional[str],
+                 image_url: Optional[str], relevance_score: Optional[float], attempts: int,
+                 last_error: Optional[str], evidence: Optional[str],
+                 processed_at_raw: Optional[str], created_at_raw: Optional[str]):
+        self.id = id
+        self.sku_id = sku_id
+        self.status = status
+        self.image_source = image_source
+        self.image_url = image_url
+        self.relevance_score = relevance_score
+        self.attempts = attempts
+        self.last_error = last_error
+        self.evidence = evidence
+        self.processed_at_raw = processed_at_raw
+        self.created_at_raw = created_at_raw
+
+    @classmethod
+    def from_row(cls, row) -> "ProcessingRow":
+        """Build from a sqlite3.Row of processed_skus."""
+        return cls(row["id"], row["sku_id"], row["status"], row["image_source"], row["image_url"],
+                   row["relevance_score"], row["attempts"], row["last_error"], row["evidence"],
+                   row["processed_at"], row["created_at"])
 
-    class Config:
-        """Pydantic config."""
+    @property
+    def processed_at(self) -> Optional[datetime]:
+        """Processing timestamp, parsed on access."""
+        return datetime.fromisoformat(self.processed_at_raw) if self.processed_at_raw else None
 
-        from_attributes = True
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation timestamp, parsed on access."""
+        return datetime.fromisoformat(self.created_at_raw) if self.created_at_raw else None
+
+    def to_model(self) -> "ProcessingRecord":
+        """Build the validated pydantic model for this row."""
+        return ProcessingRecord(
+            id=self.id, sku_id=self.sku_id, status=ProcessingStatus(self.status),
+            image_source=ImageSource(self.image_source) if self.image_source else None,
+            image_url=self.image_url, relevance_score=self.relevance_score,
+            processed_at=self.processed_at, attempts=self.attempts,
+            last_error=self.last_error, evidence=self.evidence, created_at=self.created_at)
+
+
+class ProcessingResult:
+    """Result of processing a single SKU (plain slotted class, see SKU)."""
+
+    __slots__ = ("sku_id", "success", "image_attached", "image_source", "relevance_score", "error",
+                 "processing_time", "retry_at")
+
+    def __init__(self, sku_id: str, success: bool, image_attached: bool = False,
+                 image_source: Optional[ImageSource] = None, relevance_score: Optional[float] = None,
+                 error: Optional[str] = None, processing_time: float = 0.0,
+                 retry_at: Optional[float] = None):
+        self.sku_id = sku_id
+        self.success = success
+        self.image_attached = image_attached
+        self.image_source = image_source
+        self.relevance_score = relevance_score
+        self.error = error
+        self.processing_time = processing_time
+        # Set when the SKU was deferred by source rate limits (epoch seconds)
+        self.retry_at = retry_at
+
+    def __repr__(self) -> str:
+        return f"ProcessingResult(sku_id={self.sku_id!r}, success={self.success}, error={self.error!r})"
 
 
 class ProcessingReport(BaseModel):
@@ -137,6 +228,8 @@ class ProcessingReport(BaseModel):
     failed: int = Field(0, description="Failed to process")
     skipped: int = Field(0, description="Skipped (already processed)")
     needs_review: int = Field(0, description="Needs manual review")
+    deferred: int = Field(0, description="Left unprocessed by source rate limits")
+    held_back: int = Field(0, description="Left for later runs by provider quota budgets")
     started_at: datetime = Field(
         default_factory=datetime.utcnow, description="Session start time"
     )
@@ -148,6 +241,10 @@ class ProcessingReport(BaseModel):
     error_summary: List[str] = Field(
         default_factory=list, description="Summary of errors"
     )
+    interrupted: bool = Field(False, description="Stopped early, resumable with --resume")
+    source_health: dict = Field(
+        default_factory=dict, description="Circuit breaker state per image source"
+    )
 
     @property
     def success_rate(self) -> float:
@@ -174,8 +271,12 @@ class ExecutionHistory(BaseModel):
     successful: int = Field(0, description="Successfully processed")
     failed: int = Field(0, description="Failed to process")
     skipped: int = Field(0, description="Skipped SKUs")
+    needs_review: int = Field(0, description="SKUs needing manual review")
     duration_seconds: Optional[int] = Field(None, description="Duration in seconds")
     trigger_type: str = Field("manual", description="How execution was triggered")
+    status: Optional[str] = Field(None, description="running, interrupted or completed")
+    sku_source: Optional[str] = Field(None, description="SKU file path or 'api'")
+    cursor: int = Field(0, description="Number of input SKUs handled so far")
 
     class Config:
         """Pydantic config."""
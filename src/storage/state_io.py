@@ -0,0 +1,78 @@
+"""Streaming CSV/JSONL readers and writers for processing state."""
+
+import csv
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, TextIO
+
+from src.storage.state_manager import STATE_EXPORT_COLUMNS
+
+
+def _open_text(path: Path, mode: str) -> TextIO:
+    """Open a text file, transparently (de)compressing .gz files."""
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def _file_format(path: Path) -> str:
+    """Get the record format ("csv" or "jsonl") from a file name."""
+    suffixes = [suffix.lower() for suffix in path.suffixes if suffix.lower() != ".gz"]
+    if suffixes and suffixes[-1] == ".csv":
+        return "csv"
+    if suffixes and suffixes[-1] in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    raise ValueError(f"Unsupported state file format: {path.name} (use .csv or .jsonl, optionally .gz)")
+
+
+def read_state_file(path: str) -> Iterator[Dict]:
+    """Stream records from a CSV or JSONL state file, one at a time.
+
+    Args:
+        path: File path; format is taken from the extension (.csv, .jsonl, + .gz)
+
+    Yields:
+        Record dicts
+    """
+    file_path = Path(path)
+    file_format = _file_format(file_path)
+
+    with _open_text(file_path, "r") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def write_state_file(path: str, records: Iterable[Dict]) -> int:
+    """Stream records to a CSV or JSONL state file.
+
+    Args:
+        path: File path; format is taken from the extension (.csv, .jsonl, + .gz)
+        records: Record dicts keyed by STATE_EXPORT_COLUMNS
+
+    Returns:
+        Number of records written
+    """
+    file_path = Path(path)
+    file_format = _file_format(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+
+    with _open_text(file_path, "w") as f:
+        if file_format == "csv":
+            writer = csv.DictWriter(f, fieldnames=STATE_EXPORT_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                written += 1
+        else:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+                written += 1
+
+    return written
@@ -1,26 +1,139 @@
 """SQLite-based state management for tracking processed SKUs."""
 
+import gzip
+import json
 import sqlite3
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.utils.logger import LoggerMixin
-from src.storage.models import ExecutionHistory, ProcessingRecord, ProcessingStatus, ImageSource
+from src.storage.models import (ExecutionHistory, ProcessingRecord, ProcessingRow, ProcessingStatus,
+                                ImageSource, SKU)
+
+# Insert a processing result, or overwrite the existing row and bump its attempts.
+# Unsuccessful SKUs get a next_attempt_at that doubles with every attempt.
+# evidence records what a NEEDS_REVIEW lookup tried (see is_sku_due).
+UPSERT_PROCESSED_SKU_SQL = """
+    INSERT INTO processed_skus
+        (sku_id, status, image_source, image_url, relevance_score, last_error, evidence, next_attempt_at)
+    VALUES (:sku_id, :status, :image_source, :image_url, :relevance_score, :last_error, :evidence,
+        CASE WHEN :status = 'success' THEN NULL
+             ELSE datetime('now', '+' || min(:retry_max, :retry_base) || ' seconds') END)
+    ON CONFLICT(sku_id) DO UPDATE SET
+        status = excluded.status,
+        image_source = excluded.image_source,
+        image_url = excluded.image_url,
+        relevance_score = excluded.relevance_score,
+        processed_at = CURRENT_TIMESTAMP,
+        attempts = processed_skus.attempts + 1,
+        last_error = excluded.last_error,
+        evidence = excluded.evidence,
+        next_attempt_at = CASE WHEN excluded.status = 'success' THEN NULL
+             ELSE datetime('now', '+' || min(:retry_max,
+                  :retry_base << min(processed_skus.attempts, 20)) || ' seconds') END
+"""
+
+
+# Per-status/per-source row counts kept in step with processed_skus by triggers,
+# so get_processing_stats never scans the table. NULL sources are stored as ''.
+PROCESSING_STATS_TRIGGERS = {
+    "trg_stats_insert": """
+    CREATE TRIGGER IF NOT EXISTS trg_stats_insert AFTER INSERT ON processed_skus
+    BEGIN
+        INSERT INTO processing_stats (status, image_source, count)
+        VALUES (NEW.status, COALESCE(NEW.image_source, ''), 1)
+        ON CONFLICT(status, image_source) DO UPDATE SET count = count + 1;
+    END
+    """,
+    "trg_stats_delete": """
+    CREATE TRIGGER IF NOT EXISTS trg_stats_delete AFTER DELETE ON processed_skus
+    BEGIN
+        UPDATE processing_stats SET count = count - 1
+        WHERE status = OLD.status AND image_source = COALESCE(OLD.image_source, '');
+    END
+    """,
+    "trg_stats_update": """
+    CREATE TRIGGER IF NOT EXISTS trg_stats_update AFTER UPDATE OF status, image_source ON processed_skus
+    WHEN OLD.status IS NOT NEW.status OR OLD.image_source IS NOT NEW.image_source
+    BEGIN
+        UPDATE processing_stats SET count = count - 1
+        WHERE status = OLD.status AND image_source = COALESCE(OLD.image_source, '');
+        INSERT INTO processing_stats (status, image_source, count)
+        VALUES (NEW.status, COALESCE(NEW.image_source, ''), 1)
+        ON CONFLICT(status, image_source) DO UPDATE SET count = count + 1;
+    END
+    """,
+}
+
+# Secondary indexes on processed_skus; dropped during bulk imports and rebuilt after
+PROCESSED_SKUS_INDEXES = {
+    "idx_sku_id": "processed_skus(sku_id)",
+    "idx_status": "processed_skus(status)",
+    "idx_processed_at": "processed_skus(processed_at)",
+    "idx_next_attempt_at": "processed_skus(next_attempt_at)",
+}
+
+# Columns exchanged by export_records/import_records
+STATE_EXPORT_COLUMNS = [
+    "sku_id", "status", "image_source", "image_url", "relevance_score", "processed_at",
+    "attempts", "last_error", "created_at", "next_attempt_at", "evidence",
+]
+
+VALID_STATUSES = frozenset(status.value for status in ProcessingStatus)
+VALID_SOURCES = frozenset(source.value for source in ImageSource)
+
+# Bulk import overwrites existing rows with the imported values as-is.
+# Parameters are positional, in STATE_EXPORT_COLUMNS order.
+IMPORT_PROCESSED_SKU_SQL = """
+    INSERT INTO processed_skus
+        (sku_id, status, image_source, image_url, relevance_score, processed_at,
+         attempts, last_error, created_at, next_attempt_at, evidence)
+    VALUES (?1, ?2, ?3, ?4, ?5, COALESCE(?6, CURRENT_TIMESTAMP), COALESCE(?7, 1), ?8,
+        COALESCE(?9, CURRENT_TIMESTAMP), ?10, ?11)
+    ON CONFLICT(sku_id) DO UPDATE SET
+        status = excluded.status,
+        image_source = excluded.image_source,
+        image_url = excluded.image_url,
+        relevance_score = excluded.relevance_score,
+        processed_at = excluded.processed_at,
+        attempts = excluded.attempts,
+        last_error = excluded.last_error,
+        next_attempt_at = excluded.next_attempt_at,
+        evidence = excluded.evidence
+"""
 
 
 class StateManager(LoggerMixin):
     """Manage processing state using SQLite database."""
 
-    def __init__(self, db_path: str = "./data/state.db"):
-        """Initialize state manager."""
+    def __init__(self, db_path: str = "./data/state.db", busy_timeout: float = 30.0,
+                 retry_base_seconds: int = 21600, retry_max_seconds: int = 2592000,
+                 review_recheck_seconds: int = 2592000):
+        """Initialize state manager.
+
+        Args:
+            db_path: Path to SQLite database file
+            busy_timeout: Seconds to wait for a lock held by another process
+            retry_base_seconds: Delay before the first retry of an unsuccessful SKU;
+                doubled on every further attempt
+            retry_max_seconds: Upper bound on the retry delay
+            review_recheck_seconds: Age after which a NEEDS_REVIEW SKU is
+                looked up again even though its evidence has not changed
+        """
         self.db_path = Path(db_path)
+        self.busy_timeout = busy_timeout
+        self.retry_base_seconds = int(retry_base_seconds)
+        self.retry_max_seconds = int(retry_max_seconds)
+        self.review_recheck_seconds = int(review_recheck_seconds)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -29,6 +142,9 @@ class StateManager(LoggerMixin):
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        # Lets archive_old_records reclaim space; only takes effect on a new database
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # Create processed_skus table
         cursor.execute(
             """
@@ -47,6 +163,11 @@ class StateManager(LoggerMixin):
         """
         )
 
+        self._add_missing_columns(cursor, "processed_skus", {
+            "next_attempt_at": "TIMESTAMP",
+            "evidence": "TEXT",
+        })
+
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS processing_log (
@@ -75,49 +196,182 @@ class StateManager(LoggerMixin):
             )
         """
         )
+        self._add_missing_columns(cursor, "execution_history", {
+            "status": "TEXT",
+            "sku_source": "TEXT",
+            "cursor": "INTEGER DEFAULT 0",
+            "needs_review": "INTEGER DEFAULT 0",
+            "checkpointed_at": "TIMESTAMP",
+        })
 
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sku_id ON processed_skus(sku_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_status ON processed_skus(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_at ON processed_skus(processed_at)")
+        # Shared backlog for multiple workers; a row is claimed while leased
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS work_queue (
+                sku_id TEXT PRIMARY KEY,
+                sku_name TEXT,
+                claimed_by TEXT,
+                lease_expires_at REAL,
+                enqueued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # Per-category search outcomes per image source, for adaptive source ordering
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS source_stats (
+                category TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                hits INTEGER NOT NULL DEFAULT 0,
+                score_sum REAL NOT NULL DEFAULT 0,
+                latency_ms_sum REAL NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (category, source)
+            ) WITHOUT ROWID
+        """
+        )
+
+        # Provider calls in the current hour/month period per source, plus the
+        # quota last reported in response headers (period 'reported')
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS source_quota (
+                source TEXT NOT NULL,
+                period TEXT NOT NULL,
+                period_start TEXT,
+                calls INTEGER NOT NULL DEFAULT 0,
+                reported_limit INTEGER,
+                reported_remaining INTEGER,
+                reset_at REAL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (source, period)
+            ) WITHOUT ROWID
+        """
+        )
+
+        # SKUs whose records were archived; still count as processed
+        cursor.execute("CREATE TABLE IF NOT EXISTS archived_skus (sku_id TEXT PRIMARY KEY) WITHOUT ROWID")
+
+        stats_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'processing_stats'").fetchone()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS processing_stats (
+                status TEXT NOT NULL,
+                image_source TEXT NOT NULL DEFAULT '',
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (status, image_source)
+            )
+        """
+        )
+        for trigger in PROCESSING_STATS_TRIGGERS.values():
+            cursor.execute(trigger)
+        if not stats_exists:
+            self._rebuild_processing_stats(cursor)
+
+        for name, target in PROCESSED_SKUS_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_log_sku_id ON processing_log(sku_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_log_timestamp ON processing_log(timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_queue_lease ON work_queue(lease_expires_at)")
 
         conn.commit()
         conn.close()
         self.logger.info(f"Database initialized at {self.db_path}")
 
+    def _add_missing_columns(self, cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
+        """Add columns introduced after a database was created."""
+        existing = {row["name"] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        for name, definition in columns.items():
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
     def is_sku_processed(self, sku_id: str) -> bool:
         """Check if SKU has been successfully processed."""
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT status FROM processed_skus WHERE sku_id = ? AND status = ?",
-                      (sku_id, ProcessingStatus.SUCCESS.value))
+        cursor.execute("""SELECT 1 FROM processed_skus WHERE sku_id = ? AND status = ?
+                       UNION ALL SELECT 1 FROM archived_skus WHERE sku_id = ?""",
+                      (sku_id, ProcessingStatus.SUCCESS.value, sku_id))
         result = cursor.fetchone()
         conn.close()
         return result is not None
 
+    def is_sku_due(self, sku_id: str, retry_limit: int = 3, evidence: Optional[str] = None) -> bool:
+        """Check if SKU should be processed now.
+
+        True for SKUs never processed, and for unsuccessful SKUs whose retry
+        time has come. FAILED SKUs stop being retried after ``retry_limit``
+        attempts. NEEDS_REVIEW SKUs that recorded evidence are only due once
+        the current ``evidence`` differs from what was tried last time, or
+        once the lookup is older than ``review_recheck_seconds`` (providers
+        keep adding images).
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""SELECT status, attempts, evidence,
+                       next_attempt_at IS NULL OR next_attempt_at <= datetime('now') AS due,
+                       processed_at <= datetime('now', ?) AS review_expired
+                       FROM processed_skus WHERE sku_id = ?""",
+                      (f"-{self.review_recheck_seconds} seconds", sku_id))
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute("SELECT 1 FROM archived_skus WHERE sku_id = ?", (sku_id,))
+            archived = cursor.fetchone()
+            conn.close()
+            return archived is None
+        conn.close()
+        if row["status"] == ProcessingStatus.SUCCESS.value:
+            return False
+        if row["status"] == ProcessingStatus.FAILED.value and row["attempts"] >= retry_limit:
+            return False
+        if row["status"] == ProcessingStatus.NEEDS_REVIEW.value and row["evidence"] is not None:
+            return bool(row["review_expired"]) or (evidence is not None and evidence != row["evidence"])
+        return bool(row["due"])
+
+    def get_due_retry_skus(self, retry_limit: int = 3, limit: int = 50) -> List[str]:
+        """Get unsuccessful SKUs whose retry time has come, oldest due first."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""SELECT sku_id FROM processed_skus
+                       WHERE next_attempt_at <= datetime('now') AND status != ?
+                       AND NOT (status = ? AND attempts >= ?)
+                       AND NOT (status = ? AND evidence IS NOT NULL AND processed_at > datetime('now', ?))
+                       ORDER BY next_attempt_at LIMIT ?""",
+                      (ProcessingStatus.SUCCESS.value, ProcessingStatus.FAILED.value, retry_limit,
+                       ProcessingStatus.NEEDS_REVIEW.value, f"-{self.review_recheck_seconds} seconds", limit))
+        results = cursor.fetchall()
+        conn.close()
+        return [row["sku_id"] for row in results]
+
+    def _record_params(self, sku_id: str, status: ProcessingStatus,
+                       image_source: Optional[ImageSource], image_url: Optional[str],
+                       relevance_score: Optional[float], error: Optional[str],
+                       evidence: Optional[str] = None) -> Dict:
+        """Build UPSERT_PROCESSED_SKU_SQL parameters for one result."""
+        return {"sku_id": sku_id, "status": status.value,
+                "image_source": image_source.value if image_source else None,
+                "image_url": image_url, "relevance_score": relevance_score, "last_error": error,
+                "evidence": evidence,
+                "retry_base": self.retry_base_seconds, "retry_max": self.retry_max_seconds}
+
     def mark_sku_processed(self, sku_id: str, status: ProcessingStatus,
                           image_source: Optional[ImageSource] = None,
                           image_url: Optional[str] = None,
                           relevance_score: Optional[float] = None,
-                          error: Optional[str] = None) -> None:
-        """Mark SKU as processed with status."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, attempts FROM processed_skus WHERE sku_id = ?", (sku_id,))
-        existing = cursor.fetchone()
-
-        if existing:
-            attempts = existing["attempts"] + 1
-            cursor.execute("""UPDATE processed_skus SET status = ?, image_source = ?, image_url = ?,
-                           relevance_score = ?, processed_at = ?, attempts = ?, last_error = ? WHERE sku_id = ?""",
-                         (status.value, image_source.value if image_source else None, image_url,
-                          relevance_score, datetime.utcnow(), attempts, error, sku_id))
-        else:
-            cursor.execute("""INSERT INTO processed_skus 
-                           (sku_id, status, image_source, image_url, relevance_score, last_error)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
-                         (sku_id, status.value, image_source.value if image_source else None,
-                          image_url, relevance_score, error))
+                          error: Optional[str] = None,
+                          evidence: Optional[str] = None) -> None:
+        """Mark SKU as processed with status.
 
+        ``evidence`` describes what an unsuccessful lookup tried, so the SKU
+        is only retried once that changes (see is_sku_due).
+        """
+        conn = self._get_connection()
+        conn.execute(UPSERT_PROCESSED_SKU_SQL,
+                     self._record_params(sku_id, status, image_source, image_url, relevance_score,
+                                         error, evidence))
         conn.commit()
         conn.close()
         log_msg = f"Marked SKU {sku_id} as {status.value}"
@@ -125,6 +379,28 @@ class StateManager(LoggerMixin):
             log_msg += f" (source: {image_source.value})"
         self.logger.info(log_msg)
 
+    def mark_many(self, records: Iterable[ProcessingRecord]) -> int:
+        """Mark a batch of SKUs as processed in a single transaction.
+
+        Args:
+            records: Processing records to write (sku_id, status, image_source,
+                image_url, relevance_score, last_error and evidence are used)
+
+        Returns:
+            Number of records written
+        """
+        rows = [self._record_params(r.sku_id, r.status, r.image_source, r.image_url,
+                                    r.relevance_score, r.last_error, r.evidence) for r in records]
+        if not rows:
+            return 0
+
+        conn = self._get_connection()
+        conn.executemany(UPSERT_PROCESSED_SKU_SQL, rows)
+        conn.commit()
+        conn.close()
+        self.logger.info(f"Marked {len(rows)} SKUs as processed")
+        return len(rows)
+
     def get_processing_record(self, sku_id: str) -> Optional[ProcessingRecord]:
         """Get processing record for SKU."""
         conn = self._get_connection()
@@ -133,12 +409,7 @@ class StateManager(LoggerMixin):
         row = cursor.fetchone()
         conn.close()
         if row:
-            return ProcessingRecord(
-                id=row["id"], sku_id=row["sku_id"], status=ProcessingStatus(row["status"]),
-                image_source=ImageSource(row["image_source"]) if row["image_source"] else None,
-                image_url=row["image_url"], relevance_score=row["relevance_score"],
-                processed_at=datetime.fromisoformat(row["processed_at"]), attempts=row["attempts"],
-                last_error=row["last_error"], created_at=datetime.fromisoformat(row["created_at"]))
+            return ProcessingRow.from_row(row).to_model()
         return None
 
     def get_failed_skus(self, retry_limit: int = 3) -> List[str]:
@@ -153,70 +424,532 @@ class StateManager(LoggerMixin):
 
     def get_needs_review_skus(self) -> List[ProcessingRecord]:
         """Get all SKUs marked as needing manual review."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM processed_skus WHERE status = ? ORDER BY processed_at DESC",
-                      (ProcessingStatus.NEEDS_REVIEW.value,))
-        results = cursor.fetchall()
-        conn.close()
+        return [row.to_model() for row in self.iter_needs_review_skus()]
+
+    def iter_needs_review_skus(self, chunk_size: int = 1000) -> Iterator[ProcessingRow]:
+        """Stream SKUs needing manual review, most recent first, as lightweight rows."""
+        return self.iter_records(ProcessingStatus.NEEDS_REVIEW, chunk_size)
+
+    def iter_records(self, status: Optional[ProcessingStatus] = None,
+                     chunk_size: int = 1000) -> Iterator[ProcessingRow]:
+        """Stream processing records, most recent first, as lightweight rows.
 
-        records = []
-        for row in results:
-            records.append(ProcessingRecord(
-                id=row["id"], sku_id=row["sku_id"], status=ProcessingStatus(row["status"]),
-                image_source=ImageSource(row["image_source"]) if row["image_source"] else None,
-                image_url=row["image_url"], relevance_score=row["relevance_score"],
-                processed_at=datetime.fromisoformat(row["processed_at"]), attempts=row["attempts"],
-                last_error=row["last_error"], created_at=datetime.fromisoformat(row["created_at"])))
-        return records
+        Rows are fetched ``chunk_size`` at a time; no pydantic models are
+        built unless the caller asks for them with ProcessingRow.to_model().
+        """
+        conn = self._get_connection()
+        try:
+            if status is None:
+                cursor = conn.execute("SELECT * FROM processed_skus ORDER BY processed_at DESC")
+            else:
+                cursor = conn.execute("SELECT * FROM processed_skus WHERE status = ? ORDER BY processed_at DESC",
+                                      (status.value,))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield ProcessingRow.from_row(row)
+        finally:
+            conn.close()
 
     def get_processing_stats(self) -> dict:
-        """Get processing statistics."""
+        """Get processing statistics from the trigger-maintained counters."""
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("""SELECT COUNT(*) as total,
-                       SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as successful,
-                       SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as failed,
-                       SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as needs_review
-                       FROM processed_skus""",
-                      (ProcessingStatus.SUCCESS.value, ProcessingStatus.FAILED.value,
-                       ProcessingStatus.NEEDS_REVIEW.value))
-        overall = cursor.fetchone()
-        cursor.execute("""SELECT image_source, COUNT(*) as count FROM processed_skus
-                       WHERE status = ? AND image_source IS NOT NULL GROUP BY image_source""",
-                      (ProcessingStatus.SUCCESS.value,))
-        source_breakdown = {row["image_source"]: row["count"] for row in cursor.fetchall()}
-        conn.close()
-        return {"total": overall["total"], "successful": overall["successful"],
-                "failed": overall["failed"], "needs_review": overall["needs_review"],
+        cursor.execute("SELECT status, image_source, count FROM processing_stats WHERE count != 0")
+        rows = cursor.fetchall()
+        conn.close()
+
+        by_status: Dict[str, int] = {}
+        source_breakdown: Dict[str, int] = {}
+        for row in rows:
+            by_status[row["status"]] = by_status.get(row["status"], 0) + row["count"]
+            if row["status"] == ProcessingStatus.SUCCESS.value and row["image_source"]:
+                source_breakdown[row["image_source"]] = row["count"]
+        return {"total": sum(by_status.values()),
+                "successful": by_status.get(ProcessingStatus.SUCCESS.value, 0),
+                "failed": by_status.get(ProcessingStatus.FAILED.value, 0),
+                "needs_review": by_status.get(ProcessingStatus.NEEDS_REVIEW.value, 0),
                 "source_breakdown": source_breakdown}
 
-    def cleanup_old_records(self, days: int = 30) -> int:
-        """Clean up old processing records."""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+    def check_processing_stats(self, rebuild: bool = True) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Compare the stats counters with a full scan of processed_skus.
+
+        Args:
+            rebuild: Rebuild the counters from the table if they have drifted
+
+        Returns:
+            Mismatches as {(status, image_source): (counter, actual)}
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM processed_skus WHERE processed_at < ? AND status = ?",
-                      (cutoff_date, ProcessingStatus.SUCCESS.value))
-        deleted = cursor.rowcount
+        counters = {(row["status"], row["image_source"]): row["count"]
+                    for row in cursor.execute("SELECT * FROM processing_stats WHERE count != 0")}
+        actual = {(row["status"], row["image_source"]): row["count"]
+                  for row in cursor.execute("""SELECT status, COALESCE(image_source, '') AS image_source,
+                                            COUNT(*) AS count FROM processed_skus
+                                            GROUP BY status, COALESCE(image_source, '')""")}
+        mismatches = {key: (counters.get(key, 0), actual.get(key, 0))
+                      for key in set(counters) | set(actual)
+                      if counters.get(key, 0) != actual.get(key, 0)}
+        if mismatches and rebuild:
+            self._rebuild_processing_stats(cursor)
+            conn.commit()
+            self.logger.warning(f"Rebuilt processing stats ({len(mismatches)} counters had drifted)")
+        conn.close()
+        return mismatches
+
+    def _rebuild_processing_stats(self, cursor: sqlite3.Cursor) -> None:
+        """Recompute the stats counters from processed_skus."""
+        cursor.execute("DELETE FROM processing_stats")
+        cursor.execute("""INSERT INTO processing_stats (status, image_source, count)
+                       SELECT status, COALESCE(image_source, ''), COUNT(*) FROM processed_skus
+                       GROUP BY status, COALESCE(image_source, '')""")
+
+    def cleanup_old_records(self, days: int = 30, archive_dir: str = "./data/archive",
+                            chunk_size: int = 5000) -> int:
+        """Archive old SUCCESS records and compact the database.
+
+        Expired rows are streamed in chunks into gzipped JSONL files
+        partitioned by processing date (``<archive_dir>/YYYY-MM/processed_skus_YYYY-MM-DD.jsonl.gz``),
+        their SKU ids are kept in archived_skus so they are still skipped,
+        and the freed pages are released with an incremental vacuum.
+
+        Args:
+            days: Retention window for SUCCESS records
+            archive_dir: Directory for archive files
+            chunk_size: Rows archived per transaction
+
+        Returns:
+            Number of records archived
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat(sep=" ")
+        archive_root = Path(archive_dir)
+        archived = 0
+        conn = self._get_connection()
+
+        while True:
+            rows = conn.execute("""SELECT * FROM processed_skus WHERE processed_at < ? AND status = ?
+                                ORDER BY id LIMIT ?""",
+                                (cutoff, ProcessingStatus.SUCCESS.value, chunk_size)).fetchall()
+            if not rows:
+                break
+
+            by_date = defaultdict(list)
+            for row in rows:
+                by_date[str(row["processed_at"])[:10]].append(dict(row))
+            for date, records in by_date.items():
+                path = archive_root / date[:7] / f"processed_skus_{date}.jsonl.gz"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Appending adds a new gzip member; readers see one continuous stream
+                with gzip.open(path, "at", encoding="utf-8") as f:
+                    for record in records:
+                        f.write(json.dumps(record, default=str) + "\n")
+
+            conn.executemany("INSERT OR IGNORE INTO archived_skus (sku_id) VALUES (?)",
+                             [(row["sku_id"],) for row in rows])
+            conn.executemany("DELETE FROM processed_skus WHERE id = ?", [(row["id"],) for row in rows])
+            conn.commit()
+            archived += len(rows)
+            if len(rows) < chunk_size:
+                break
+
+        self._incremental_vacuum(conn)
+        conn.close()
+        self.logger.info(f"Archived {archived} old records (older than {days} days) to {archive_root}")
+        return archived
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection) -> None:
+        """Release free pages if the database uses incremental auto-vacuum."""
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            self.logger.info("Database predates incremental auto-vacuum, free pages are kept; "
+                             "run scripts/manage_state.py enable-auto-vacuum to switch it")
+            return
+        conn.execute("PRAGMA incremental_vacuum").fetchall()
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch a database created before auto_vacuum was set to incremental auto-vacuum.
+
+        Takes one full VACUUM, which rewrites the whole file under an
+        exclusive lock, so it is a maintenance step to run while no bot is
+        using the database.
+
+        Returns:
+            True if the database was switched, False if it already was
+        """
+        conn = self._get_connection()
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+            self.logger.info("Enabling incremental auto-vacuum (full VACUUM)")
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return True
+        finally:
+            conn.close()
+
+    def export_records(self, chunk_size: int = 10000) -> Iterator[Dict]:
+        """Stream all processed_skus rows as dicts of STATE_EXPORT_COLUMNS.
+
+        Rows are fetched ``chunk_size`` at a time, so memory stays constant
+        regardless of table size.
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(f"SELECT {', '.join(STATE_EXPORT_COLUMNS)} FROM processed_skus ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            conn.close()
+
+    def import_records(self, records: Iterable[Dict], batch_size: int = 10000,
+                       default_status: ProcessingStatus = ProcessingStatus.SUCCESS) -> int:
+        """Bulk-load processed_skus rows, overwriting existing SKUs.
+
+        Records are written with executemany in transactions of ``batch_size``.
+        Secondary indexes and the stats triggers are dropped for the duration
+        of the import, then rebuilt once at the end.
+
+        Args:
+            records: Dicts keyed by STATE_EXPORT_COLUMNS; only sku_id is required.
+                Empty strings are treated as missing values.
+            batch_size: Records per transaction
+            default_status: Status for records without one
+
+        Returns:
+            Number of records imported
+        """
+        conn = self._get_connection()
+        conn.execute("PRAGMA cache_size = -65536")
+        for name in PROCESSED_SKUS_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for name in PROCESSING_STATS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
         conn.commit()
+
+        imported = 0
+        batch = []
+        try:
+            for record in records:
+                batch.append(self._import_params(record, default_status))
+                if len(batch) >= batch_size:
+                    conn.executemany(IMPORT_PROCESSED_SKU_SQL, batch)
+                    conn.commit()
+                    imported += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(IMPORT_PROCESSED_SKU_SQL, batch)
+                conn.commit()
+                imported += len(batch)
+        finally:
+            conn.rollback()
+            cursor = conn.cursor()
+            for name, target in PROCESSED_SKUS_INDEXES.items():
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            for trigger in PROCESSING_STATS_TRIGGERS.values():
+                cursor.execute(trigger)
+            self._rebuild_processing_stats(cursor)
+            conn.commit()
+            conn.close()
+
+        self.logger.info(f"Imported {imported} processing records")
+        return imported
+
+    def _import_params(self, record: Dict, default_status: ProcessingStatus) -> Tuple:
+        """Normalise one imported record into IMPORT_PROCESSED_SKU_SQL parameters."""
+        (sku_id, status, image_source, image_url, relevance_score, processed_at,
+         attempts, last_error, created_at, next_attempt_at, evidence) = [
+            None if value == "" else value for value in map(record.get, STATE_EXPORT_COLUMNS)]
+        if not sku_id:
+            raise ValueError(f"Record without sku_id: {record}")
+        status = status or default_status.value
+        if status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status {status!r} for SKU {sku_id}")
+        if image_source is not None and image_source not in VALID_SOURCES:
+            raise ValueError(f"Invalid image source {image_source!r} for SKU {sku_id}")
+        return (sku_id, status, image_source, image_url,
+                float(relevance_score) if relevance_score is not None else None,
+                processed_at, int(attempts) if attempts is not None else None,
+                last_error, created_at, next_attempt_at, evidence)
+
+    def prune_processing_log(self, days: int = 30, chunk_size: int = 5000) -> int:
+        """Delete processing log events older than the retention window.
+
+        Rows are deleted in chunks of ``chunk_size``, each in its own short
+        transaction, so pruning never holds the write lock for long.
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat(sep=" ")
+        deleted = 0
+        conn = self._get_connection()
+        while True:
+            cursor = conn.execute(
+                """DELETE FROM processing_log WHERE id IN
+                   (SELECT id FROM processing_log WHERE timestamp < ? LIMIT ?)""",
+                (cutoff, chunk_size))
+            conn.commit()
+            deleted += cursor.rowcount
+            if cursor.rowcount < chunk_size:
+                break
         conn.close()
-        self.logger.info(f"Cleaned up {deleted} old records (older than {days} days)")
+        self.logger.info(f"Pruned {deleted} processing log events (older than {days} days)")
         return deleted
 
-    def create_execution_record(self, trigger_type: str = "manual") -> int:
-        """Create a new execution history record."""
+    def enqueue_skus(self, skus: Iterable[SKU]) -> int:
+        """Add SKUs to the shared work queue.
+
+        SKUs already queued or already processed successfully are ignored.
+
+        Returns:
+            Number of SKUs newly queued
+        """
+        conn = self._get_connection()
+        cursor = conn.executemany(
+            """INSERT OR IGNORE INTO work_queue (sku_id, sku_name)
+               SELECT ?, ? WHERE NOT EXISTS
+               (SELECT 1 FROM processed_skus WHERE sku_id = ? AND status = ?)
+               AND NOT EXISTS (SELECT 1 FROM archived_skus WHERE sku_id = ?)""",
+            ((sku.id, sku.name, sku.id, ProcessingStatus.SUCCESS.value, sku.id) for sku in skus))
+        queued = cursor.rowcount
+        conn.commit()
+        conn.close()
+        self.logger.info(f"Queued {queued} new SKUs for processing")
+        return queued
+
+    def claim_skus(self, worker_id: str, limit: int, lease_seconds: float = 300) -> List[SKU]:
+        """Atomically claim the next unleased SKUs from the work queue.
+
+        SKUs whose lease has expired (e.g. their worker died) are claimable
+        again. The select and update run under one write lock, so two
+        workers never claim the same SKU.
+
+        Args:
+            worker_id: Unique identifier of the claiming worker
+            limit: Maximum number of SKUs to claim
+            lease_seconds: How long the claim is valid unless renewed
+
+        Returns:
+            Claimed SKUs in queue order
+        """
+        now = time.time()
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute("""SELECT sku_id, sku_name FROM work_queue
+                            WHERE claimed_by IS NULL OR lease_expires_at < ?
+                            ORDER BY enqueued_at, rowid LIMIT ?""", (now, limit)).fetchall()
+        if rows:
+            conn.executemany("UPDATE work_queue SET claimed_by = ?, lease_expires_at = ? WHERE sku_id = ?",
+                             [(worker_id, now + lease_seconds, row["sku_id"]) for row in rows])
+        conn.commit()
+        conn.close()
+        if rows:
+            self.logger.info(f"Worker {worker_id} claimed {len(rows)} SKUs")
+        return [SKU(id=row["sku_id"], name=row["sku_name"] or row["sku_id"]) for row in rows]
+
+    def renew_leases(self, worker_id: str, sku_ids: List[str], lease_seconds: float = 300) -> int:
+        """Extend the leases a worker holds on the given SKUs.
+
+        Returns:
+            Number of leases renewed (leases lost to another worker are not)
+        """
+        if not sku_ids:
+            return 0
+        conn = self._get_connection()
+        placeholders = ",".join("?" * len(sku_ids))
+        cursor = conn.execute(f"""UPDATE work_queue SET lease_expires_at = ?
+                              WHERE claimed_by = ? AND sku_id IN ({placeholders})""",
+                              (time.time() + lease_seconds, worker_id, *sku_ids))
+        renewed = cursor.rowcount
+        conn.commit()
+        conn.close()
+        if renewed < len(sku_ids):
+            self.logger.warning(f"Worker {worker_id} lost {len(sku_ids) - renewed} SKU leases")
+        return renewed
+
+    def defer_claim(self, worker_id: str, sku_id: str, retry_at: float, lease_seconds: float = 300) -> bool:
+        """Keep a rate-limited SKU leased until its retry time.
+
+        The worker retries it then, with ``lease_seconds`` of grace; if the
+        worker is gone by then, the lease expires and another worker claims it.
+
+        Returns:
+            Whether the worker still held the SKU
+        """
+        conn = self._get_connection()
+        cursor = conn.execute("UPDATE work_queue SET lease_expires_at = ? WHERE claimed_by = ? AND sku_id = ?",
+                              (retry_at + lease_seconds, worker_id, sku_id))
+        held = cursor.rowcount > 0
+        conn.commit()
+        conn.close()
+        return held
+
+    def release_skus(self, worker_id: str, sku_ids: List[str]) -> None:
+        """Remove SKUs the worker has finished with from the work queue."""
+        if not sku_ids:
+            return
+        conn = self._get_connection()
+        placeholders = ",".join("?" * len(sku_ids))
+        conn.execute(f"DELETE FROM work_queue WHERE claimed_by = ? AND sku_id IN ({placeholders})",
+                     (worker_id, *sku_ids))
+        conn.commit()
+        conn.close()
+
+    def unclaim_skus(self, worker_id: str, sku_ids: List[str]) -> None:
+        """Give back unprocessed claimed SKUs so other workers can take them now."""
+        if not sku_ids:
+            return
+        conn = self._get_connection()
+        placeholders = ",".join("?" * len(sku_ids))
+        conn.execute(f"""UPDATE work_queue SET claimed_by = NULL, lease_expires_at = NULL
+                     WHERE claimed_by = ? AND sku_id IN ({placeholders})""", (worker_id, *sku_ids))
+        conn.commit()
+        conn.close()
+
+    def reclaim_expired_leases(self) -> int:
+        """Clear expired leases so their SKUs return to the queue.
+
+        Returns:
+            Number of leases reclaimed
+        """
+        conn = self._get_connection()
+        cursor = conn.execute("""UPDATE work_queue SET claimed_by = NULL, lease_expires_at = NULL
+                              WHERE claimed_by IS NOT NULL AND lease_expires_at < ?""", (time.time(),))
+        reclaimed = cursor.rowcount
+        conn.commit()
+        conn.close()
+        if reclaimed:
+            self.logger.warning(f"Reclaimed {reclaimed} SKUs from expired worker leases")
+        return reclaimed
+
+    def get_source_stats(self) -> Dict[Tuple[str, str], Tuple[int, int, float, float]]:
+        """Get accumulated search outcomes per image source.
+
+        Returns:
+            {(category, source): (calls, hits, score_sum, latency_ms_sum)}
+        """
+        conn = self._get_connection()
+        rows = conn.execute(
+            "SELECT category, source, calls, hits, score_sum, latency_ms_sum FROM source_stats"
+        ).fetchall()
+        conn.close()
+        return {(row["category"], row["source"]): (row["calls"], row["hits"], row["score_sum"], row["latency_ms_sum"])
+                for row in rows}
+
+    def record_source_stats(self, deltas: Dict[Tuple[str, str], Tuple[int, int, float, float]]) -> None:
+        """Add search outcomes to the per-source totals.
+
+        Args:
+            deltas: {(category, source): (calls, hits, score_sum, latency_ms_sum)} to add
+        """
+        if not deltas:
+            return
+        conn = self._get_connection()
+        conn.executemany(
+            """INSERT INTO source_stats (category, source, calls, hits, score_sum, latency_ms_sum)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT (category, source) DO UPDATE SET
+                   calls = calls + excluded.calls,
+                   hits = hits + excluded.hits,
+                   score_sum = score_sum + excluded.score_sum,
+                   latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+                   updated_at = CURRENT_TIMESTAMP""",
+            (key + values for key, values in deltas.items()))
+        conn.commit()
+        conn.close()
+
+    def get_quota_usage(self) -> Dict[Tuple[str, str], Dict]:
+        """Get the quota ledger.
+
+        Returns:
+            {(source, period): {"period_start", "calls", "reported_limit",
+            "reported_remaining", "reset_at"}}
+        """
+        conn = self._get_connection()
+        rows = conn.execute("""SELECT source, period, period_start, calls, reported_limit,
+                            reported_remaining, reset_at FROM source_quota""").fetchall()
+        conn.close()
+        return {(row["source"], row["period"]): {key: row[key] for key in
+                                                 ("period_start", "calls", "reported_limit",
+                                                  "reported_remaining", "reset_at")}
+                for row in rows}
+
+    def record_quota_calls(self, calls: Dict[Tuple[str, str, str], int],
+                           reported: Dict[str, Tuple[Optional[int], int, Optional[float]]]) -> None:
+        """Add counted provider calls to the quota ledger in one transaction.
+
+        A period's count restarts when its period_start rolls over, so calls
+        must be given oldest period first.
+
+        Args:
+            calls: {(source, period, period_start): calls}, e.g.
+                {("pexels", "hour", "2026-10-18T14"): 12}
+            reported: {source: (limit, remaining, reset_at)} last reported in
+                response headers (reset_at in epoch seconds)
+        """
+        conn = self._get_connection()
+        conn.executemany(
+            """INSERT INTO source_quota (source, period, period_start, calls) VALUES (?, ?, ?, ?)
+               ON CONFLICT (source, period) DO UPDATE SET
+                   calls = CASE WHEN period_start = excluded.period_start
+                                THEN calls + excluded.calls ELSE excluded.calls END,
+                   period_start = excluded.period_start,
+                   updated_at = CURRENT_TIMESTAMP""",
+            ((source, period, period_start, count) for (source, period, period_start), count in calls.items()))
+        conn.executemany(
+            """INSERT INTO source_quota (source, period, reported_limit, reported_remaining, reset_at)
+               VALUES (?, 'reported', ?, ?, ?)
+               ON CONFLICT (source, period) DO UPDATE SET
+                   reported_limit = excluded.reported_limit,
+                   reported_remaining = excluded.reported_remaining,
+                   reset_at = excluded.reset_at,
+                   updated_at = CURRENT_TIMESTAMP""",
+            ((source, *values) for source, values in reported.items()))
+        conn.commit()
+        conn.close()
+
+    def create_execution_record(self, trigger_type: str = "manual", sku_source: Optional[str] = None) -> int:
+        """Create a new execution history record.
+
+        Args:
+            trigger_type: How the execution was triggered
+            sku_source: Where the SKU list came from (file path or "api"), used for resume
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("INSERT INTO execution_history (trigger_type) VALUES (?)", (trigger_type,))
+        cursor.execute("""INSERT INTO execution_history (trigger_type, status, sku_source, cursor)
+                       VALUES (?, 'running', ?, 0)""", (trigger_type, sku_source))
         execution_id = cursor.lastrowid
         conn.commit()
         conn.close()
         return execution_id
 
+    def checkpoint_execution(self, execution_id: int, cursor_position: int, total_skus: int,
+                             successful: int, failed: int, skipped: int, needs_review: int,
+                             status: str = "running") -> None:
+        """Record progress of a running execution so it can be resumed.
+
+        Args:
+            execution_id: Execution to update
+            cursor_position: Number of SKUs of the input list already handled
+            status: "running", or "interrupted" after a graceful stop
+        """
+        conn = self._get_connection()
+        conn.execute("""UPDATE execution_history SET cursor = ?, total_skus = ?, successful = ?,
+                     failed = ?, skipped = ?, needs_review = ?, status = ?, checkpointed_at = CURRENT_TIMESTAMP
+                     WHERE id = ?""",
+                     (cursor_position, total_skus, successful, failed, skipped, needs_review,
+                      status, execution_id))
+        conn.commit()
+        conn.close()
+
     def update_execution_record(self, execution_id: int, total_skus: int,
-                                successful: int, failed: int, skipped: int) -> None:
-        """Update execution history record."""
+                                successful: int, failed: int, skipped: int,
+                                needs_review: int = 0) -> None:
+        """Update execution history record and mark it completed."""
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute("SELECT started_at FROM execution_history WHERE id = ?", (execution_id,))
@@ -225,8 +958,10 @@ class StateManager(LoggerMixin):
             started_at = datetime.fromisoformat(row["started_at"])
             duration = int((datetime.utcnow() - started_at).total_seconds())
             cursor.execute("""UPDATE execution_history SET completed_at = ?, total_skus = ?,
-                           successful = ?, failed = ?, skipped = ?, duration_seconds = ? WHERE id = ?""",
-                          (datetime.utcnow(), total_skus, successful, failed, skipped, duration, execution_id))
+                           successful = ?, failed = ?, skipped = ?, needs_review = ?,
+                           duration_seconds = ?, status = 'completed' WHERE id = ?""",
+                          (datetime.utcnow(), total_skus, successful, failed, skipped, needs_review,
+                           duration, execution_id))
             conn.commit()
         conn.close()
 
@@ -234,14 +969,32 @@ class StateManager(LoggerMixin):
         """Get the most recent execution record."""
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM execution_history ORDER BY started_at DESC LIMIT 1")
+        cursor.execute("SELECT * FROM execution_history ORDER BY started_at DESC, id DESC LIMIT 1")
+        row = cursor.fetchone()
+        conn.close()
+        if row:
+            return self._row_to_execution(row)
+        return None
+
+    def get_incomplete_execution(self) -> Optional[ExecutionHistory]:
+        """Get the most recent execution that never completed (crashed or stopped)."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""SELECT * FROM execution_history WHERE completed_at IS NULL
+                       ORDER BY started_at DESC, id DESC LIMIT 1""")
         row = cursor.fetchone()
         conn.close()
         if row:
-            return ExecutionHistory(
-                id=row["id"], started_at=datetime.fromisoformat(row["started_at"]),
-                completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-                total_skus=row["total_skus"], successful=row["successful"], failed=row["failed"],
-                skipped=row["skipped"], duration_seconds=row["duration_seconds"],
-                trigger_type=row["trigger_type"])
+            return self._row_to_execution(row)
         return None
+
+    def _row_to_execution(self, row: sqlite3.Row) -> ExecutionHistory:
+        """Build an ExecutionHistory model from a database row."""
+        return ExecutionHistory(
+            id=row["id"], started_at=datetime.fromisoformat(row["started_at"]),
+            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
+            total_skus=row["total_skus"] or 0, successful=row["successful"] or 0,
+            failed=row["failed"] or 0, skipped=row["skipped"] or 0,
+            needs_review=row["needs_review"] or 0, duration_seconds=row["duration_seconds"],
+            trigger_type=row["trigger_type"], status=row["status"],
+            sku_source=row["sku_source"], cursor=row["cursor"] or 0)
@@ -21,6 +21,7 @@ class AppConfig(BaseSettings):
     freepik_api_key: Optional[str] = Field(None, alias="FREEPIK_API_KEY")
     pexels_api_key: Optional[str] = Field(None, alias="PEXELS_API_KEY")
     pixabay_api_key: Optional[str] = Field(None, alias="PIXABAY_API_KEY")
+    unsplash_access_key: Optional[str] = Field(None, alias="UNSPLASH_ACCESS_KEY")
 
     # Application Settings
     log_level: str = Field("INFO", alias="LOG_LEVEL")
@@ -79,6 +80,11 @@ class Config:
         """Get batch size for processing SKUs."""
         return self.yaml_config.get("app", {}).get("batch_size", 50)
 
+    @property
+    def listing_page_size(self) -> int:
+        """Get page size for listing SKUs without images."""
+        return self.yaml_config.get("app", {}).get("listing_page_size", 200)
+
     @property
     def scheduler_config(self) -> Dict:
         """Get scheduler configuration."""
@@ -109,6 +115,11 @@ class Config:
         """Get state management configuration."""
         return self.yaml_config.get("state", {})
 
+    @property
+    def catalog_config(self) -> Dict:
+        """Get product catalog index configuration."""
+        return self.yaml_config.get("catalog", {})
+
     @property
     def logging_config(self) -> Dict:
         """Get logging configuration."""
@@ -149,7 +160,7 @@ class Config:
         """Get API key for a specific source.
 
         Args:
-            source: Image source name (freepik, pexels, pixabay)
+            source: Image source name (freepik, pexels, pixabay, unsplash)
 
         Returns:
             API key or None if not configured
@@ -158,6 +169,7 @@ class Config:
             "freepik": self.env.freepik_api_key,
             "pexels": self.env.pexels_api_key,
             "pixabay": self.env.pixabay_api_key,
+            "unsplash": self.env.unsplash_access_key,
         }
         return source_mapping.get(source.lower())
 
@@ -2,9 +2,9 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Optional, Union
 
-from src.storage.models import ProcessingRecord
+from src.storage.models import ProcessingRecord, ProcessingRow
 from src.utils.logger import LoggerMixin
 
 
@@ -19,11 +19,27 @@ class ReportWriter(LoggerMixin):
 
     def write_needs_review_report(
         self,
-        skus: List[ProcessingRecord],
-        filename: Optional[str] = None
+        skus: Iterable[Union[ProcessingRecord, ProcessingRow]],
+        filename: Optional[str] = None,
+        total: Optional[int] = None
     ) -> str:
-        """Write SKUs needing manual review to text file."""
-        if not skus:
+        """Write SKUs needing manual review to text file.
+
+        Args:
+            skus: Records to list; may be a lazy iterator (e.g.
+                StateManager.iter_needs_review_skus()) consumed in one pass
+            filename: Report file name (default: timestamped)
+            total: Number of records, required to stream an iterator
+                without materialising it
+
+        Returns:
+            Report path, or "" if there was nothing to report
+        """
+        if total is None:
+            skus = skus if isinstance(skus, (list, tuple)) else list(skus)
+            total = len(skus)
+
+        if not total:
             self.logger.info("No SKUs need review, skipping report generation")
             return ""
 
@@ -38,14 +54,14 @@ class ReportWriter(LoggerMixin):
             f.write("SKUs Requiring Manual Review - Image Not Found\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("=" * 80 + "\n\n")
-            f.write(f"Total SKUs Needing Review: {len(skus)}\n\n")
+            f.write(f"Total SKUs Needing Review: {total}\n\n")
 
             f.write(f"{'SKU ID':<25} | {'Processed At':<20} | {'Last Error':<30}\n")
             f.write("-" * 25 + " | " + "-" * 20 + " | " + "-" * 30 + "\n")
 
             for sku in skus:
                 sku_id = sku.sku_id[:24] if len(sku.sku_id) > 24 else sku.sku_id
-                processed_at = sku.processed_at.strftime('%Y-%m-%d %H:%M:%S')
+                processed_at = sku.processed_at.strftime('%Y-%m-%d %H:%M:%S') if sku.processed_at else ""
                 error = (sku.last_error or "Unknown error")[:29]
 
                 f.write(f"{sku_id:<25} | {processed_at:<20} | {error:<30}\n")
@@ -0,0 +1,44 @@
+"""Text normalisation for relevance matching."""
+
+import re
+from typing import FrozenSet, List, Optional
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words ending in s that are not the plural of the word without it
+NON_PLURALS = frozenset({
+    "news", "lens", "series", "species", "canvas", "atlas", "chaos", "always", "perhaps",
+    "mews", "thanks", "shorts", "pants", "tongs", "pliers", "scissors", "tweezers",
+})
+
+
+def stem_forms(word: str) -> FrozenSet[str]:
+    """Get a word together with the singular forms it may be the plural of.
+
+    Deliberately conservative, and the word itself is always kept: an
+    "ies" plural gives both candidate singulars (cookies -> cookie, cooky;
+    batteries -> battery), "es" plurals both cuts (boxes -> box, sizes -> size),
+    and NON_PLURALS and words ending in ss/us/is are left whole, so news
+    never meets new. Two words match when their forms intersect.
+    """
+    if len(word) <= 3 or word.isdigit() or word in NON_PLURALS:
+        return frozenset((word,))
+    if word.endswith("ies"):
+        return frozenset((word, word[:-3] + "y", word[:-1]))
+    if word.endswith(("sses", "xes", "zes", "ches", "shes")):
+        return frozenset((word, word[:-2], word[:-1]))
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return frozenset((word, word[:-1]))
+    return frozenset((word,))
+
+
+def tokenize_words(text: Optional[str]) -> List[FrozenSet[str]]:
+    """Split text into lowercase words, each as its set of stem_forms."""
+    if not text:
+        return []
+    return [stem_forms(token) for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+def tokenize(text: Optional[str]) -> FrozenSet[str]:
+    """Split text into the set of all stem_forms of its lowercase words."""
+    return frozenset().union(*tokenize_words(text))
@@ -0,0 +1,38 @@
+"""Tests for the image dimensions the provider clients report."""
+
+import json
+
+import requests
+
+from src.api.freepik_client import FreepikClient
+from src.api.pixabay_client import PixabayClient
+
+
+def _respond(client, monkeypatch, payload):
+    """Make every request of the client return the given JSON."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    monkeypatch.setattr(client.session, "request", lambda method, url, **kwargs: response)
+
+
+def test_pixabay_reports_size_of_large_image(monkeypatch):
+    client = PixabayClient("key")
+    hits = [{"id": 1, "webformatURL": "w", "largeImageURL": "l", "imageWidth": 4000, "imageHeight": 3000},
+            {"id": 2, "webformatURL": "w", "largeImageURL": "l", "imageWidth": 900, "imageHeight": 1200}]
+    _respond(client, monkeypatch, {"hits": hits})
+
+    assert [(image.width, image.height) for image in client.search_images("mug")] == [(1280, 960), (900, 1200)]
+
+
+def test_freepik_reports_thumbnail_size_only_when_downloading_thumbnail(monkeypatch):
+    client = FreepikClient("key")
+    thumbnail = {"url": "thumb", "width": 626, "height": 417}
+    items = [{"id": 1, "image": {"thumbnail": thumbnail, "source": {"url": "full"}}},
+             {"id": 2, "image": {"thumbnail": thumbnail}}]
+    _respond(client, monkeypatch, {"data": items})
+
+    images = client.search_images("mug")
+
+    assert [(image.download_url, image.width, image.height) for image in images] == [
+        ("full", None, None), ("thumb", 626, 417)]
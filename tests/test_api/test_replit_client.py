@@ -0,0 +1,133 @@
+"""Tests for paging through the WholesaleHub products listing."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.api.replit_client import ReplitClient
+
+
+class ProductsHandler(BaseHTTPRequestHandler):
+    """Login plus GET /api/admin/products, paged by offset or by cursor."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, headers=()):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send_json({"ok": True}, [("Set-Cookie", "connect.sid=session; Path=/")])
+
+    def do_GET(self):
+        server = self.server
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        with server.lock:
+            server.requests.append(query)
+        limit = int(query["limit"])
+        if server.by_cursor:
+            start = int(query.get("cursor", 0))
+            # Like some APIs, hand out a cursor even when the next page is empty
+            next_cursor = start + limit if start + limit <= len(server.products) else None
+            self._send_json({"products": server.products[start:start + limit], "nextCursor": next_cursor})
+        else:
+            start = int(query["offset"])
+            self._send_json({"products": server.products[start:start + limit]})
+
+
+@pytest.fixture
+def hub(request, monkeypatch):
+    """Products server on an ephemeral port, with 20k products unless parametrized with a count."""
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ProductsHandler)
+    server.products = [{"sku": f"SKU-{n}", "name": f"Widget {n}"} for n in range(getattr(request, "param", 20000))]
+    server.requests = []
+    server.lock = threading.Lock()
+    server.by_cursor = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = ReplitClient(f"http://127.0.0.1:{server.server_address[1]}", "bot@example.com", "secret")
+    yield server, client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def _page_ids(pages):
+    return [[sku.id for sku in page] for page in pages]
+
+
+small_hub = pytest.mark.parametrize("hub", [6], indirect=True)
+
+
+@pytest.mark.parametrize("by_cursor", [False, True])
+def test_full_listing_yields_every_sku_once_in_order_and_closes_session(hub, monkeypatch, by_cursor):
+    server, client = hub
+    server.by_cursor = by_cursor
+    closed = []
+    monkeypatch.setattr(client.listing_session, "close", lambda: closed.append(True))
+
+    sku_ids = [sku.id for sku in client.iter_skus_without_images(limit=None)]
+    client.close()
+
+    assert sku_ids == [product["sku"] for product in server.products]
+    assert len(server.requests) == len(server.products) // 200 + 1
+    assert closed == [True]
+
+
+@small_hub
+def test_offset_pages_end_at_empty_final_page(hub):
+    server, client = hub
+
+    pages = _page_ids(client.iter_sku_pages(page_size=2))
+
+    assert pages == [["SKU-0", "SKU-1"], ["SKU-2", "SKU-3"], ["SKU-4", "SKU-5"]]
+    assert [request["offset"] for request in server.requests] == ["0", "2", "4", "6"]
+
+
+@small_hub
+def test_offset_pages_stop_at_short_page_and_limit(hub):
+    server, client = hub
+
+    assert _page_ids(client.iter_sku_pages(page_size=4)) == [[f"SKU-{n}" for n in range(4)], ["SKU-4", "SKU-5"]]
+    server.requests.clear()
+    assert _page_ids(client.iter_sku_pages(limit=3, page_size=2)) == [["SKU-0", "SKU-1"], ["SKU-2"]]
+    assert [(request["offset"], request["limit"]) for request in server.requests] == [("0", "2"), ("2", "1")]
+
+
+@small_hub
+def test_cursor_pages_end_at_empty_final_page(hub):
+    server, client = hub
+    server.by_cursor = True
+
+    pages = _page_ids(client.iter_sku_pages(page_size=3))
+
+    assert pages == [["SKU-0", "SKU-1", "SKU-2"], ["SKU-3", "SKU-4", "SKU-5"]]
+    assert [request.get("cursor") for request in server.requests] == [None, "3", "6"]
+
+
+@small_hub
+def test_next_page_is_prefetched_while_the_current_one_is_used(hub):
+    server, client = hub
+    pages = client.iter_sku_pages(page_size=2)
+
+    first = next(pages)
+    deadline = time.time() + 5
+    while len(server.requests) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert [sku.id for sku in first] == ["SKU-0", "SKU-1"]
+    assert [request["offset"] for request in server.requests] == ["0", "2"]
+    assert _page_ids(pages) == [["SKU-2", "SKU-3"], ["SKU-4", "SKU-5"]]
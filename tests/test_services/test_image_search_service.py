@@ -0,0 +1,78 @@
+"""Tests for how ImageSearchService treats sources that fail or answer."""
+
+import time
+
+import pytest
+import requests
+
+from src.services.image_search_service import ImageSearchService, SearchDeferredError
+from src.storage.models import ImageSource
+from src.storage.state_manager import StateManager
+from src.utils.config import AppConfig, Config
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """Search service with only Pexels enabled and a state DB in tmp_path."""
+    for name in ("FREEPIK_API_KEY", "PIXABAY_API_KEY", "UNSPLASH_ACCESS_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("REPLIT_API_URL", "http://hub.invalid")
+    monkeypatch.setenv("REPLIT_EMAIL", "bot@example.com")
+    monkeypatch.setenv("REPLIT_PASSWORD", "secret")
+    monkeypatch.setenv("PEXELS_API_KEY", "key")
+
+    config = Config("config/config.yaml")
+    config.env = AppConfig(_env_file=None)
+    config.yaml_config["image_search"]["quotas"] = {}
+    config.yaml_config["image_search"]["circuit_breaker"] = {"failure_threshold": 1, "cooldown_seconds": 120}
+    return ImageSearchService(config, StateManager(str(tmp_path / "state.db")))
+
+
+def _respond(service, monkeypatch, status_code, payload=None):
+    """Make every Pexels request return the given response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}" if payload is None else payload
+    client = service.clients[ImageSource.PEXELS]
+    monkeypatch.setattr(client.session, "request", lambda method, url, **kwargs: response)
+
+
+def test_failed_source_defers_search_without_caching_or_recording(service, monkeypatch):
+    _respond(service, monkeypatch, 503)
+
+    with pytest.raises(SearchDeferredError):
+        service.search_candidates(["red", "mug"])
+
+    assert service._result_cache == {}
+    assert service.scheduler._pending == {}
+
+
+def test_open_circuit_defers_search_until_it_reopens(service, monkeypatch):
+    _respond(service, monkeypatch, 503)
+    with pytest.raises(SearchDeferredError):
+        service.search_candidates(["red", "mug"])
+
+    with pytest.raises(SearchDeferredError) as deferred:
+        service.search_candidates(["blue", "mug"])
+
+    assert deferred.value.retry_at == pytest.approx(time.time() + 120, abs=5)
+    assert service.clients[ImageSource.PEXELS].circuit_breaker.rejected == 1
+
+
+def test_answered_source_is_cached_and_recorded(service, monkeypatch):
+    _respond(service, monkeypatch, 200, b'{"photos": []}')
+
+    assert service.search_candidates(["red", "mug"]) == []
+
+    assert list(service._result_cache) == [(ImageSource.PEXELS, "red mug")]
+    assert service.scheduler._pending[("", "pexels")][:2] == [1, 0]
+
+
+@pytest.mark.parametrize("status_code, payload", [(401, None), (400, None), (200, b"not json")])
+def test_permanent_source_error_counts_as_no_results(service, monkeypatch, status_code, payload):
+    _respond(service, monkeypatch, status_code, payload)
+
+    assert service.search_candidates(["red", "mug"]) == []
+
+    assert service._result_cache == {}
+    assert service.clients[ImageSource.PEXELS].circuit_breaker.state == "closed"
@@ -0,0 +1,79 @@
+"""Tests for indexing and reading SKU images from folders and archives."""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from src.services.local_image_service import LocalImageService
+
+IMAGES = {"SKU-1.jpg": b"first image", "nested/SKU-2.PNG": b"second image", "notes.txt": b"not an image",
+          ".hidden.jpg": b"hidden"}
+
+
+def _write_zip(path):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in IMAGES.items():
+            archive.writestr(name, data)
+
+
+def _write_tar(path, mode):
+    with tarfile.open(path, mode) as archive:
+        for name, data in IMAGES.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+ARCHIVES = {
+    "images.zip": _write_zip,
+    "images.tar": lambda path: _write_tar(path, "w"),
+    "images.tar.gz": lambda path: _write_tar(path, "w:gz"),
+    "images.tar.xz": lambda path: _write_tar(path, "w:xz"),
+}
+
+
+@pytest.fixture(params=sorted(ARCHIVES))
+def archive_path(request, tmp_path):
+    """Archive of IMAGES in every supported format."""
+    path = tmp_path / request.param
+    ARCHIVES[request.param](path)
+    return path
+
+
+@pytest.mark.parametrize("in_folder", [False, True])
+def test_archive_images_are_indexed_and_read(archive_path, in_folder):
+    service = LocalImageService(str(archive_path.parent if in_folder else archive_path))
+
+    assert sorted(service.get_available_skus()) == ["SKU-1", "SKU-2"]
+    assert service.has_image("sku-2")
+    assert service.find_image_for_sku("sku-1").image_data == b"first image"
+    result = service.find_image_for_sku("SKU-2")
+    assert (result.filename, result.image_data) == ("SKU-2.PNG", b"second image")
+    assert service.find_image_for_sku("notes") is None
+    assert service.find_image_for_sku(".hidden") is None
+    service.close()
+
+
+def test_loose_image_wins_over_archived_duplicate(tmp_path):
+    _write_zip(tmp_path / "images.zip")
+    (tmp_path / "SKU-1.jpg").write_bytes(b"loose image")
+
+    service = LocalImageService(str(tmp_path))
+
+    assert service.find_image_for_sku("SKU-1").image_data == b"loose image"
+    assert service.find_image_for_sku("SKU-2").image_data == b"second image"
+    service.close()
+
+
+def test_close_removes_compressed_archive_cache(tmp_path):
+    _write_tar(tmp_path / "images.tar.gz", "w:gz")
+    service = LocalImageService(str(tmp_path / "images.tar.gz"))
+    cache_dir = service._cache_dir
+    assert sorted(path.read_bytes() for path in cache_dir.iterdir()) == [b"first image", b"second image"]
+
+    service.close()
+
+    assert not cache_dir.exists()
+    assert service._cache_dir is None
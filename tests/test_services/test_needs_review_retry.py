@@ -0,0 +1,26 @@
+"""Tests for when NEEDS_REVIEW SKUs are looked up again."""
+
+from src.storage.models import ProcessingStatus
+from src.storage.state_manager import StateManager
+
+
+def _mark_needs_review(state_manager: StateManager, sku_id: str, evidence: str) -> None:
+    state_manager.mark_sku_processed(sku_id, ProcessingStatus.NEEDS_REVIEW, error="No suitable image found",
+                                     evidence=evidence)
+
+
+def test_needs_review_waits_for_new_evidence(tmp_path):
+    state_manager = StateManager(str(tmp_path / "state.db"), retry_base_seconds=0)
+    _mark_needs_review(state_manager, "A", '{"keywords": ["cookie"]}')
+
+    assert not state_manager.is_sku_due("A", evidence='{"keywords": ["cookie"]}')
+    assert state_manager.is_sku_due("A", evidence='{"keywords": ["cookie", "jar"]}')
+    assert state_manager.get_due_retry_skus() == []
+
+
+def test_needs_review_is_rechecked_after_expiry(tmp_path):
+    state_manager = StateManager(str(tmp_path / "state.db"), retry_base_seconds=0, review_recheck_seconds=0)
+    _mark_needs_review(state_manager, "A", '{"keywords": ["cookie"]}')
+
+    assert state_manager.is_sku_due("A", evidence='{"keywords": ["cookie"]}')
+    assert state_manager.get_due_retry_skus() == ["A"]
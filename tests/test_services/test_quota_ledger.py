@@ -0,0 +1,35 @@
+"""Tests for batched writes of the provider quota ledger."""
+
+from src.services.quota_ledger import QuotaLedger
+from src.storage.state_manager import StateManager
+
+HEADERS = {"X-Ratelimit-Limit": "200", "X-Ratelimit-Remaining": "150"}
+
+
+def test_calls_are_written_in_batches(tmp_path):
+    state_manager = StateManager(str(tmp_path / "state.db"))
+    ledger = QuotaLedger(state_manager, {"pexels": {"hourly": 100}}, flush_every=2)
+
+    ledger.record_call("pexels", HEADERS)
+    assert state_manager.get_quota_usage() == {}
+
+    ledger.record_call("pexels", HEADERS)
+    ledger.record_call("pexels", HEADERS)
+    assert state_manager.get_quota_usage()[("pexels", "hour")]["calls"] == 2
+
+    ledger.flush()
+    usage = state_manager.get_quota_usage()
+    assert usage[("pexels", "hour")]["calls"] == 3
+    assert usage[("pexels", "month")]["calls"] == 3
+    assert usage[("pexels", "reported")]["reported_remaining"] == 150
+
+
+def test_flushed_counts_restart_when_the_period_rolls_over(tmp_path):
+    state_manager = StateManager(str(tmp_path / "state.db"))
+    state_manager.record_quota_calls({("pexels", "hour", "2026-10-18T13"): 5}, {})
+
+    state_manager.record_quota_calls({("pexels", "hour", "2026-10-18T13"): 2,
+                                      ("pexels", "hour", "2026-10-18T14"): 3}, {})
+
+    usage = state_manager.get_quota_usage()[("pexels", "hour")]
+    assert (usage["period_start"], usage["calls"]) == ("2026-10-18T14", 3)
@@ -0,0 +1,43 @@
+"""Tests for the word matching behind relevance scoring."""
+
+import pytest
+
+from src.utils.text import tokenize, tokenize_words
+
+
+def _matches(keyword: str, title: str) -> bool:
+    """Match the way ImageSearchService.score_candidates does."""
+    title_tokens = tokenize(title)
+    return all(not forms.isdisjoint(title_tokens) for forms in tokenize_words(keyword))
+
+
+@pytest.mark.parametrize("keyword, title", [
+    ("cookie", "chocolate chip cookies"),
+    ("cookies", "a chocolate cookie"),
+    ("pie", "apple pies"),
+    ("movies", "movie night"),
+    ("battery", "AA batteries"),
+    ("batteries", "battery pack"),
+    ("box", "cardboard boxes"),
+    ("size", "all sizes"),
+    ("can", "soda cans"),
+    ("glass", "wine glasses"),
+])
+def test_singular_and_plural_match(keyword, title):
+    assert _matches(keyword, title)
+
+
+@pytest.mark.parametrize("keyword, title", [
+    ("new", "breaking news"),
+    ("len", "camera lens"),
+    ("short", "denim shorts"),
+    ("cap", "capture the moment"),
+    ("bu", "city bus"),
+])
+def test_unrelated_words_do_not_match(keyword, title):
+    assert not _matches(keyword, title)
+
+
+def test_multi_word_keyword_needs_every_word():
+    assert _matches("red mugs", "a red mug on a table")
+    assert not _matches("red mugs", "a blue mug")
@@ -0,0 +1,59 @@
+"""Tests for the shared SKU work queue in the state DB."""
+
+import multiprocessing
+import time
+from collections import Counter
+
+from src.storage.models import SKU
+from src.storage.state_manager import StateManager
+
+
+def _drain_queue(db_path: str, worker_id: str) -> list:
+    """Claim and release SKUs until the queue is empty, as one worker process."""
+    state_manager = StateManager(db_path)
+    claimed_ids = []
+    while True:
+        claimed = state_manager.claim_skus(worker_id, limit=3, lease_seconds=300)
+        if not claimed:
+            return claimed_ids
+        claimed_ids.extend(sku.id for sku in claimed)
+        state_manager.release_skus(worker_id, [sku.id for sku in claimed])
+
+
+def test_concurrent_workers_never_claim_the_same_sku(tmp_path):
+    db_path = str(tmp_path / "state.db")
+    state_manager = StateManager(db_path)
+    sku_ids = [f"SKU-{n:04d}" for n in range(300)]
+    state_manager.enqueue_skus(SKU(id=sku_id, name=sku_id) for sku_id in sku_ids)
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(4) as pool:
+        results = pool.starmap(_drain_queue, [(db_path, f"worker-{n}") for n in range(4)])
+
+    claims = Counter(sku_id for claimed_ids in results for sku_id in claimed_ids)
+    assert [sku_id for sku_id, count in claims.items() if count > 1] == []
+    assert sorted(claims) == sku_ids
+
+
+def test_deferred_claim_stays_leased_until_retry_time(tmp_path):
+    state_manager = StateManager(str(tmp_path / "state.db"))
+    state_manager.enqueue_skus([SKU(id="A", name="A"), SKU(id="B", name="B")])
+    assert [sku.id for sku in state_manager.claim_skus("w1", limit=1, lease_seconds=0.01)] == ["A"]
+
+    assert state_manager.defer_claim("w1", "A", retry_at=time.time() + 60, lease_seconds=0.01)
+    time.sleep(0.02)
+    assert [sku.id for sku in state_manager.claim_skus("w2", limit=2)] == ["B"]
+
+    assert state_manager.defer_claim("w1", "A", retry_at=time.time() - 1, lease_seconds=0)
+    assert [sku.id for sku in state_manager.claim_skus("w2", limit=2)] == ["A"]
+    assert not state_manager.defer_claim("w1", "A", retry_at=time.time())
+
+
+def test_renewed_lease_is_not_claimed_by_another_worker(tmp_path):
+    state_manager = StateManager(str(tmp_path / "state.db"))
+    state_manager.enqueue_skus([SKU(id="A", name="A")])
+    state_manager.claim_skus("w1", limit=1, lease_seconds=0.01)
+
+    assert state_manager.renew_leases("w1", ["A"], lease_seconds=60) == 1
+    time.sleep(0.02)
+    assert state_manager.claim_skus("w2", limit=1) == []